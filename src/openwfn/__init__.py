@@ -8,11 +8,19 @@ __version__ = "0.5.0"
 from .fchk import read_fchk, parse_fchk_arrays, parse_fchk_scalars, parse_fchk_density, parse_fchk_basis, parse_fchk_mos  # type: ignore
 from .geometry import distance, angle, dihedral, detect_bonds  # type: ignore
 from .graph import MolecularGraph, build_graph  # type: ignore
-from .basis import eval_s_type_gto  # type: ignore
-from .density import compute_density  # type: ignore
-from .mo import evaluate_mo  # type: ignore
-from .grid import make_bounding_box_grid  # type: ignore
-from .export import export_vtk, export_json, export_csv, export_molecule_viewer  # type: ignore
+from .basis import BasisSet, eval_s_type_gto, compile_basis, eval_basis_functions, iter_basis_blocks  # type: ignore
+from .density import compute_density, compute_density_derivatives, compute_spin_densities, unpack_triangular  # type: ignore
+from .mo import evaluate_mo, evaluate_mos, parse_mo_selection  # type: ignore
+from .grid import RegularGrid, make_bounding_box_grid  # type: ignore
+from .integration import molecular_grid  # type: ignore
+from .export import export_vtk, export_vti, export_cube, export_json, export_csv, export_molecule_viewer  # type: ignore
+from .cube import read_cube  # type: ignore
+from .volume import VolumeStore  # type: ignore
+from .interpolate import interpolate_grid, resample_grid  # type: ignore
+from .cache import BasisBlockCache, basis_cache  # type: ignore
+from .symmetry import point_group  # type: ignore
+from .promolecular import compile_promolecule, promolecular_density  # type: ignore
+from .xyz import read_xyz  # type: ignore
 
 __all__ = [
     "read_fchk",
@@ -27,11 +35,34 @@ __all__ = [
     "detect_bonds",
     "MolecularGraph",
     "build_graph",
+    "BasisSet",
     "eval_s_type_gto",
+    "compile_basis",
+    "eval_basis_functions",
+    "iter_basis_blocks",
     "compute_density",
+    "compute_density_derivatives",
+    "compute_spin_densities",
+    "unpack_triangular",
     "evaluate_mo",
+    "evaluate_mos",
+    "parse_mo_selection",
+    "RegularGrid",
     "make_bounding_box_grid",
+    "molecular_grid",
     "export_vtk",
+    "export_vti",
+    "export_cube",
+    "read_cube",
+    "VolumeStore",
+    "interpolate_grid",
+    "resample_grid",
+    "BasisBlockCache",
+    "basis_cache",
+    "point_group",
+    "compile_promolecule",
+    "promolecular_density",
+    "read_xyz",
     "export_json",
     "export_csv",
     "export_molecule_viewer",
@@ -1,29 +1,830 @@
 # src/openwfn/basis.py
 
+import json
+import math
+import os
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Iterator
+
 import numpy as np  # type: ignore
 
+from .cache import CACHE_BLOCK_BUDGET, active_basis_cache  # type: ignore
+from .constants import BOHR_TO_ANGSTROM  # type: ignore
+
+
+def working_dtype(array: Any) -> type:
+    """
+    Floating-point type used to evaluate grids given by `array`.
+
+    Single-precision input keeps the whole pipeline in float32 (half the
+    memory traffic); everything else is evaluated in float64.
+    """
+    return np.float32 if getattr(array, "dtype", None) == np.float32 else np.float64
+
+
 def eval_s_type_gto(r_points: np.ndarray, center: np.ndarray, alpha: np.ndarray, d: np.ndarray) -> np.ndarray:
     """
     Vectorized evaluation of an s-type Contracted Gaussian Type Orbital over N points.
-    
+
     Args:
         r_points: (N, 3) float array of Cartesian coordinates.
         center: (3,) float array of the basis function center.
         alpha: (K,) float array of orbital exponents.
         d: (K,) float array of orbital contraction coefficients.
-        
+
     Returns:
         (N,) float array of the evaluated basis function amplitude at each point.
     """
     # r_squared: shape (N,)
     r_squared = np.sum((r_points - center)**2, axis=1)
-    
+
     # exponentials: shape (N, K)
     # alpha is shape (K,), r_squared is broadcasted by outer product
     exponentials = np.exp(-np.outer(r_squared, alpha))
-    
+
     # Contract with coefficients d: shape (N,)
     return np.dot(exponentials, d)
 
-# P and D type orbital implementations would go here, multiplying the unnormalized
-# s-type contracted Gaussians by the corresponding cartesian polynomials (x, y, z, xy, x2-y2, etc.)
+
+# -------------------------------------------------
+# Angular tables (Gaussian AO ordering)
+# -------------------------------------------------
+
+def _double_factorial(n: int) -> int:
+    """Return n!! with the convention (-1)!! = 0!! = 1."""
+    result = 1
+    while n > 1:
+        result *= n
+        n -= 2
+    return result
+
+
+@lru_cache(maxsize=None)
+def cartesian_powers(l: int) -> tuple[tuple[int, int, int], ...]:
+    """
+    Return the (lx, ly, lz) exponents of a Cartesian shell in Gaussian order.
+
+    S, P, D and F shells use Gaussian's historical ordering
+    (e.g. XX, YY, ZZ, XY, XZ, YZ); G and higher shells use the
+    formatted-checkpoint ordering ZZZZ, YZZZ, ..., XXXY, XXXX.
+    """
+    if l == 0:
+        return ((0, 0, 0),)
+    if l == 1:
+        return ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+    if l == 2:
+        return ((2, 0, 0), (0, 2, 0), (0, 0, 2), (1, 1, 0), (1, 0, 1), (0, 1, 1))
+    if l == 3:
+        return (
+            (3, 0, 0), (0, 3, 0), (0, 0, 3), (1, 2, 0), (2, 1, 0),
+            (2, 0, 1), (1, 0, 2), (0, 1, 2), (0, 2, 1), (1, 1, 1),
+        )
+    return tuple((a, b, l - a - b) for a in range(l + 1) for b in range(l - a + 1))
+
+
+def _poly_mul(p: dict[tuple[int, int, int], float], q: dict[tuple[int, int, int], float]) -> dict[tuple[int, int, int], float]:
+    """Multiply two polynomials stored as {(a, b, c): coefficient}."""
+    out: dict[tuple[int, int, int], float] = {}
+    for (a1, b1, c1), v1 in p.items():
+        for (a2, b2, c2), v2 in q.items():
+            key = (a1 + a2, b1 + b2, c1 + c2)
+            out[key] = out.get(key, 0.0) + v1 * v2
+    return out
+
+
+def _poly_add(p: dict[tuple[int, int, int], float], q: dict[tuple[int, int, int], float], scale: float = 1.0) -> dict[tuple[int, int, int], float]:
+    """Return p + scale * q."""
+    out = dict(p)
+    for key, value in q.items():
+        out[key] = out.get(key, 0.0) + scale * value
+    return out
+
+
+@lru_cache(maxsize=None)
+def _solid_harmonic_polynomials(l_max: int) -> dict[tuple[int, int], dict[tuple[int, int, int], float]]:
+    """Real solid harmonics S_lm as Cartesian polynomials (Helgaker recursions)."""
+    x = {(1, 0, 0): 1.0}
+    y = {(0, 1, 0): 1.0}
+    z = {(0, 0, 1): 1.0}
+    r2 = {(2, 0, 0): 1.0, (0, 2, 0): 1.0, (0, 0, 2): 1.0}
+    S: dict[tuple[int, int], dict[tuple[int, int, int], float]] = {(0, 0): {(0, 0, 0): 1.0}}
+    for l in range(l_max):
+        # Diagonal recursions for m = +/-(l + 1)
+        if l == 0:
+            S[(1, 1)] = dict(x)
+            S[(1, -1)] = dict(y)
+        else:
+            factor = math.sqrt((2 * l + 1) / (2 * l + 2))
+            S[(l + 1, l + 1)] = {
+                k: factor * v for k, v in _poly_add(_poly_mul(x, S[(l, l)]), _poly_mul(y, S[(l, -l)]), -1.0).items()
+            }
+            S[(l + 1, -l - 1)] = {
+                k: factor * v for k, v in _poly_add(_poly_mul(y, S[(l, l)]), _poly_mul(x, S[(l, -l)])).items()
+            }
+        # Vertical recursion for |m| <= l
+        for m in range(-l, l + 1):
+            term = {k: (2 * l + 1) * v for k, v in _poly_mul(z, S[(l, m)]).items()}
+            if l - 1 >= abs(m):
+                term = _poly_add(term, _poly_mul(r2, S[(l - 1, m)]), -math.sqrt((l + m) * (l - m)))
+            denom = math.sqrt((l + m + 1) * (l - m + 1))
+            S[(l + 1, m)] = {k: v / denom for k, v in term.items()}
+    return S
+
+
+@lru_cache(maxsize=None)
+def cartesian_norm_factors(l: int) -> np.ndarray:
+    """Per-component factors normalizing each Cartesian function individually."""
+    ref = _double_factorial(2 * l - 1)
+    return np.array([
+        math.sqrt(ref / (_double_factorial(2 * a - 1) * _double_factorial(2 * b - 1) * _double_factorial(2 * c - 1)))
+        for a, b, c in cartesian_powers(l)
+    ])
+
+
+@lru_cache(maxsize=None)
+def spherical_transform(l: int) -> np.ndarray:
+    """
+    Return the (ncart, 2l + 1) matrix mapping Cartesian monomials to normalized
+    real solid harmonics in Gaussian order (m = 0, +1, -1, +2, -2, ...).
+
+    Rows follow `cartesian_powers(l)`. The monomials are assumed to carry the
+    common primitive normalization of an x^l function, so each column has the
+    same norm as x^l.
+    """
+    powers = cartesian_powers(l)
+    index = {p: k for k, p in enumerate(powers)}
+    harmonics = _solid_harmonic_polynomials(l)
+
+    # Gram matrix of monomials over the sphere (up to a common factor).
+    gram = np.zeros((len(powers), len(powers)))
+    for i, (a1, b1, c1) in enumerate(powers):
+        for j, (a2, b2, c2) in enumerate(powers):
+            a, b, c = a1 + a2, b1 + b2, c1 + c2
+            if a % 2 == 0 and b % 2 == 0 and c % 2 == 0:
+                gram[i, j] = _double_factorial(a - 1) * _double_factorial(b - 1) * _double_factorial(c - 1)
+
+    order = [0]
+    for m in range(1, l + 1):
+        order.extend([m, -m])
+
+    T = np.zeros((len(powers), 2 * l + 1))
+    for col, m in enumerate(order):
+        for key, value in harmonics[(l, m)].items():
+            T[index[key], col] += value
+        norm = T[:, col] @ gram @ T[:, col]
+        T[:, col] *= math.sqrt(_double_factorial(2 * l - 1) / norm)
+    return T
+
+
+def shell_size(shell_type: int) -> int:
+    """Number of basis functions in a Gaussian shell type code."""
+    if shell_type == -1:
+        return 4
+    l = abs(shell_type)
+    if shell_type < 0:
+        return 2 * l + 1
+    return (l + 1) * (l + 2) // 2
+
+
+def _primitive_norms(alpha: np.ndarray, l: int) -> np.ndarray:
+    """Normalization of x^l exp(-alpha r^2) primitives."""
+    return (2.0 * alpha / math.pi) ** 0.75 * (4.0 * alpha) ** (l / 2.0) / math.sqrt(_double_factorial(2 * l - 1))
+
+
+def _normalized_contraction(alpha: np.ndarray, d: np.ndarray, l: int) -> np.ndarray:
+    """Fold primitive normalization into d and renormalize the contracted function."""
+    overlap = (2.0 * np.sqrt(np.outer(alpha, alpha)) / np.add.outer(alpha, alpha)) ** (l + 1.5)
+    norm = float(d @ overlap @ d)
+    scale = 1.0 / math.sqrt(norm) if norm > 0.0 else 0.0
+    return d * scale * _primitive_norms(alpha, l)
+
+
+# -------------------------------------------------
+# Contracted shell engine
+# -------------------------------------------------
+
+def compile_basis(
+    basis_data: dict[str, list[Any]],
+    coordinates: list[tuple[float, float, float]],
+    tol: float = 1e-10,
+) -> dict[str, Any]:
+    """
+    Flatten parsed FCHK basis data into the arrays used by `eval_basis_functions`.
+
+    Every shell is split into radial components (SP shells give an S and a P
+    component sharing the same primitives), and components are grouped by
+    angular type so that a whole group is evaluated with array operations.
+
+    Args:
+        basis_data: Output of `parse_fchk_basis`.
+        coordinates: Atomic coordinates in Angstroms (shell centres).
+        tol: Amplitude below which basis functions are screened out.
+
+    Returns:
+        Dictionary of NumPy arrays describing the basis set (lengths in Bohr).
+    """
+    shell_types = [int(t) for t in basis_data.get("shell_types", [])]
+    n_prims = [int(n) for n in basis_data.get("primitives_per_shell", [])]
+    shell_to_atom = [int(a) for a in basis_data.get("shell_to_atom", [])]
+    exponents = np.asarray(basis_data.get("primitive_exponents", []), dtype=float)
+    coeffs = np.asarray(basis_data.get("contraction_coeffs", []), dtype=float)
+    p_coeffs = np.asarray(basis_data.get("p_contraction_coeffs", []), dtype=float)
+
+    if not (len(shell_types) == len(n_prims) == len(shell_to_atom)):
+        raise ValueError("Inconsistent basis data: shell arrays differ in length.")
+    if sum(n_prims) != len(exponents) or len(coeffs) != len(exponents):
+        raise ValueError("Inconsistent basis data: primitive arrays do not match shell primitive counts.")
+    if -1 in shell_types and len(p_coeffs) != len(exponents):
+        raise ValueError("SP shells present but P(S=P) contraction coefficients are missing.")
+
+    atom_xyz = np.asarray(coordinates, dtype=float).reshape(-1, 3) / BOHR_TO_ANGSTROM
+    if shell_to_atom and max(shell_to_atom) > len(atom_xyz):
+        raise ValueError("Shell to atom map references an atom outside the coordinate list.")
+
+    prim_start = np.concatenate([[0], np.cumsum(n_prims)]).astype(np.intp)
+    centers = atom_xyz[np.asarray(shell_to_atom, dtype=np.intp) - 1] if shell_types else np.empty((0, 3))
+
+    # Radial components: (shell index, l, pure, AO offset, coefficient vector)
+    components: list[tuple[int, int, bool, int, np.ndarray]] = []
+    offset = 0
+    for s, shell_type in enumerate(shell_types):
+        sl = slice(prim_start[s], prim_start[s + 1])
+        alpha = exponents[sl]
+        if shell_type == -1:
+            components.append((s, 0, False, offset, _normalized_contraction(alpha, coeffs[sl], 0)))
+            components.append((s, 1, False, offset + 1, _normalized_contraction(alpha, p_coeffs[sl], 1)))
+        else:
+            l = abs(shell_type)
+            components.append((s, l, shell_type < -1, offset, _normalized_contraction(alpha, coeffs[sl], l)))
+        offset += shell_size(shell_type)
+
+    comp_prims = [np.arange(prim_start[c[0]], prim_start[c[0] + 1]) for c in components]
+    comp_coeffs = [c[4] for c in components]
+    comp_l = np.asarray([c[1] for c in components], dtype=np.intp)
+    comp_pure = np.asarray([c[2] for c in components], dtype=bool)
+    comp_shell = np.asarray([c[0] for c in components], dtype=np.intp)
+    comp_cutoff = np.asarray([
+        _cutoff_radius(exponents[prims], coef, c[1], c[2], tol)
+        for prims, coef, c in zip(comp_prims, comp_coeffs, components)
+    ])
+    shell_cutoff = np.zeros(len(shell_types))
+    np.maximum.at(shell_cutoff, comp_shell, comp_cutoff)
+
+    return {
+        "n_basis": offset,
+        "shell_types": np.asarray(shell_types, dtype=np.intp),
+        "centers": centers,
+        "exponents": exponents,
+        "prim_shell": np.repeat(np.arange(len(shell_types)), n_prims).astype(np.intp),
+        "comp_shell": comp_shell,
+        "comp_l": comp_l,
+        "comp_pure": comp_pure,
+        "comp_ao": np.asarray([c[3] for c in components], dtype=np.intp),
+        "comp_nprim": np.asarray([len(p) for p in comp_prims], dtype=np.intp),
+        "comp_prim_index": np.concatenate(comp_prims).astype(np.intp) if comp_prims else np.empty(0, dtype=np.intp),
+        "comp_coeffs": np.concatenate(comp_coeffs) if comp_coeffs else np.empty(0),
+        "shell_cutoff": shell_cutoff,
+        "groups": _build_groups(comp_shell, comp_l, comp_pure, np.asarray([c[3] for c in components], dtype=np.intp)),
+    }
+
+
+def _build_groups(comp_shell: np.ndarray, comp_l: np.ndarray, comp_pure: np.ndarray, comp_ao: np.ndarray) -> list[dict[str, Any]]:
+    """Group radial components by angular type for batched evaluation."""
+    groups: list[dict[str, Any]] = []
+    for l, pure in sorted({(int(l), bool(p)) for l, p in zip(comp_l, comp_pure)}):
+        members = np.nonzero((comp_l == l) & (comp_pure == pure))[0]
+        n_func = 2 * l + 1 if pure else len(cartesian_powers(l))
+        groups.append({
+            "l": l,
+            "pure": pure,
+            "components": members,
+            "shells": comp_shell[members],
+            "ao_index": comp_ao[members][:, None] + np.arange(n_func),
+        })
+    return groups
+
+
+def _angular_bound(l: int, pure: bool) -> float:
+    """Upper bound of the angular factor of a shell on the unit sphere."""
+    if l == 0:
+        return 1.0
+    if pure:
+        return float(np.abs(spherical_transform(l)).sum(axis=0).max())
+    return float(cartesian_norm_factors(l).max())
+
+
+def _cutoff_radius(alpha: np.ndarray, coef: np.ndarray, l: int, pure: bool, tol: float) -> float:
+    """
+    Distance (Bohr) beyond which |phi| < tol for every function of a component.
+
+    Bounds the contraction by its most diffuse exponent:
+    |phi(r)| <= C * r^l * exp(-alpha_min r^2).
+    """
+    if len(alpha) == 0:
+        return 0.0
+    log_c = math.log(max(float(np.abs(coef).sum()) * _angular_bound(l, pure), 1e-300)) - math.log(tol)
+    alpha_min = float(alpha.min())
+    r = math.sqrt(max(log_c, 0.0) / alpha_min)
+    for _ in range(8):
+        r = math.sqrt(max(log_c + l * math.log(max(r, 1.0)), 0.0) / alpha_min)
+    return r
+
+
+def subset_basis(basis: Mapping[str, Any], shell_mask: np.ndarray) -> dict[str, Any]:
+    """
+    Restrict a compiled basis to the shells selected by a boolean mask.
+
+    The returned basis evaluates to a column-compressed matrix; its `ao_map`
+    entry gives the full AO index of every compressed column.
+    """
+    shell_mask = np.asarray(shell_mask, dtype=bool)
+    prim_keep = shell_mask[basis["prim_shell"]]
+    prim_new = np.cumsum(prim_keep) - 1
+    shell_new = np.cumsum(shell_mask) - 1
+
+    comp_keep = shell_mask[basis["comp_shell"]]
+    elem_keep = prim_keep[basis["comp_prim_index"]]
+
+    comp_l = basis["comp_l"][comp_keep]
+    comp_pure = basis["comp_pure"][comp_keep]
+    sizes = np.where(comp_pure, 2 * comp_l + 1, (comp_l + 1) * (comp_l + 2) // 2)
+    ao_full = basis["comp_ao"][comp_keep]
+    # SP shells have two components sharing one AO block; sort columns by full AO index.
+    ao_map = np.concatenate([a + np.arange(n) for a, n in zip(ao_full, sizes)]) if len(sizes) else np.empty(0, dtype=np.intp)
+    ao_map = np.sort(ao_map).astype(np.intp)
+    comp_ao = np.searchsorted(ao_map, ao_full).astype(np.intp)
+
+    comp_shell = shell_new[basis["comp_shell"][comp_keep]].astype(np.intp)
+    return {
+        "n_basis": len(ao_map),
+        "shell_types": basis["shell_types"][shell_mask],
+        "centers": basis["centers"][shell_mask],
+        "exponents": basis["exponents"][prim_keep],
+        "prim_shell": shell_new[basis["prim_shell"][prim_keep]].astype(np.intp),
+        "comp_shell": comp_shell,
+        "comp_l": comp_l,
+        "comp_pure": comp_pure,
+        "comp_ao": comp_ao,
+        "comp_nprim": basis["comp_nprim"][comp_keep],
+        "comp_prim_index": prim_new[basis["comp_prim_index"][elem_keep]].astype(np.intp),
+        "comp_coeffs": basis["comp_coeffs"][elem_keep],
+        "shell_cutoff": basis["shell_cutoff"][shell_mask],
+        "groups": _build_groups(comp_shell, comp_l, comp_pure, comp_ao),
+        "ao_map": ao_map,
+    }
+
+
+# -------------------------------------------------
+# Reusable basis set object
+# -------------------------------------------------
+
+_BASIS_FORMAT = "openwfn-basis"
+_BASIS_FORMAT_VERSION = 1
+_GROUP_ARRAYS = ("components", "shells", "ao_index")
+
+
+class BasisSet(Mapping):
+    """
+    A compiled basis set: per-shell NumPy arrays built and normalized once.
+
+    Behaves as a read-only mapping with the same keys as `compile_basis`
+    output, so it can be passed anywhere a compiled basis is accepted. It
+    pickles cheaply to worker processes and can be saved to a directory of
+    `.npy` files and re-opened memory-mapped; a memory-mapped instance
+    pickles as its path, so workers map the same files instead of copying.
+    """
+
+    def __init__(self, arrays: Mapping[str, Any], path: str | None = None):
+        self._data = dict(arrays)
+        self._path = path
+
+    @classmethod
+    def from_basis_data(
+        cls,
+        basis_data: dict[str, list[Any]],
+        coordinates: list[tuple[float, float, float]],
+        tol: float = 1e-10,
+    ) -> "BasisSet":
+        """Compile `parse_fchk_basis` output for atoms at `coordinates` (Angstroms)."""
+        return cls(compile_basis(basis_data, coordinates, tol=tol))
+
+    @classmethod
+    def from_fchk(cls, lines: list[str], tol: float = 1e-10) -> "BasisSet":
+        """Build the basis set of a formatted checkpoint read by `read_fchk`."""
+        from .fchk import parse_fchk_arrays, parse_fchk_basis  # type: ignore
+
+        _, coordinates = parse_fchk_arrays(lines)
+        return cls.from_basis_data(parse_fchk_basis(lines), coordinates, tol=tol)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"BasisSet(n_shells={self.n_shells}, n_basis={self.n_basis})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        if self._path is not None:
+            return (BasisSet.load, (self._path, True))
+        return (BasisSet, (self._data,))
+
+    @property
+    def n_basis(self) -> int:
+        return int(self._data["n_basis"])
+
+    @property
+    def n_shells(self) -> int:
+        return len(self._data["shell_types"])
+
+    @property
+    def shell_ao_offsets(self) -> np.ndarray:
+        """Index of the first AO of every shell."""
+        sizes = [shell_size(int(t)) for t in self._data["shell_types"]]
+        return np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.intp) if sizes else np.empty(0, dtype=np.intp)
+
+    def save(self, directory: str) -> None:
+        """
+        Write the basis set to `directory` as `.npy` arrays plus a JSON manifest.
+
+        Args:
+            directory: Target directory; created if missing.
+        """
+        os.makedirs(directory, exist_ok=True)
+        arrays = [key for key, value in self._data.items() if isinstance(value, np.ndarray)]
+        for key in arrays:
+            np.save(os.path.join(directory, f"{key}.npy"), np.asarray(self._data[key]))
+        groups = []
+        for i, group in enumerate(self._data["groups"]):
+            for key in _GROUP_ARRAYS:
+                np.save(os.path.join(directory, f"group{i}_{key}.npy"), np.asarray(group[key]))
+            groups.append({"l": int(group["l"]), "pure": bool(group["pure"])})
+        manifest = {
+            "format": _BASIS_FORMAT,
+            "version": _BASIS_FORMAT_VERSION,
+            "n_basis": self.n_basis,
+            "arrays": arrays,
+            "groups": groups,
+        }
+        with open(os.path.join(directory, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "BasisSet":
+        """
+        Open a basis set written by `save`.
+
+        Args:
+            directory: Directory containing `manifest.json` and the arrays.
+            mmap: Memory-map the arrays read-only instead of reading them.
+        """
+        with open(os.path.join(directory, "manifest.json")) as f:
+            manifest = json.load(f)
+        if manifest.get("format") != _BASIS_FORMAT or manifest.get("version") != _BASIS_FORMAT_VERSION:
+            raise ValueError(f"Unsupported basis set directory: {directory}")
+        mode = "r" if mmap else None
+        data: dict[str, Any] = {"n_basis": int(manifest["n_basis"])}
+        for key in manifest["arrays"]:
+            data[key] = np.load(os.path.join(directory, f"{key}.npy"), mmap_mode=mode)
+        data["groups"] = [
+            {
+                "l": group["l"],
+                "pure": group["pure"],
+                **{key: np.load(os.path.join(directory, f"group{i}_{key}.npy"), mmap_mode=mode) for key in _GROUP_ARRAYS},
+            }
+            for i, group in enumerate(manifest["groups"])
+        ]
+        return cls(data, path=os.path.abspath(directory) if mmap else None)
+
+
+def screen_shells(basis: Mapping[str, Any], center: np.ndarray, radius: float) -> np.ndarray:
+    """
+    Select shells whose cutoff sphere intersects a sphere around a point block.
+
+    Args:
+        basis: Compiled basis from `compile_basis` or a `BasisSet`.
+        center: (3,) centre of the block in Angstroms.
+        radius: Radius of the block's bounding sphere in Angstroms.
+
+    Returns:
+        Boolean mask over shells.
+    """
+    c = np.asarray(center, dtype=float) / BOHR_TO_ANGSTROM
+    dist = np.sqrt(np.sum((basis["centers"] - c) ** 2, axis=1))
+    return dist <= basis["shell_cutoff"] + radius / BOHR_TO_ANGSTROM
+
+
+def partition_points(r_points: np.ndarray, block_length: float = 2.0, max_points: int = 20000) -> list[np.ndarray]:
+    """
+    Split points into spatially compact blocks.
+
+    Points are binned into cubic cells of side `block_length` (Angstroms);
+    cells with more than `max_points` points are split further.
+
+    Returns:
+        List of index arrays into `r_points`.
+    """
+    pts = np.asarray(r_points).reshape(-1, 3)
+    if pts.shape[0] == 0:
+        return []
+    cells = np.floor((pts - pts.min(axis=0)) / block_length).astype(np.int64)
+    dims = cells.max(axis=0) + 1
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    order = np.argsort(keys, kind="stable")
+    bounds = np.nonzero(np.diff(keys[order]))[0] + 1
+    blocks: list[np.ndarray] = []
+    for block in np.split(order, bounds):
+        blocks.extend(np.array_split(block, -(-len(block) // max_points)))
+    return blocks
+
+
+def points_per_block(
+    basis: Mapping[str, Any],
+    memory_budget: int,
+    extra_columns: int = 0,
+    deriv: int = 0,
+    itemsize: int = 8,
+) -> int:
+    """
+    Number of grid points per block that keeps evaluation within a memory budget.
+
+    Args:
+        basis: Compiled basis from `compile_basis` or a `BasisSet`.
+        memory_budget: Budget in bytes for the transient per-block arrays.
+        extra_columns: Additional columns per point held by the caller
+            (e.g. the Phi @ P product or MO values).
+        deriv: Derivative order requested from `eval_basis_functions`.
+        itemsize: Bytes per value (4 in single precision).
+    """
+    n_comp = _N_DERIV_COMPONENTS[deriv]
+    n_shell = len(basis["shell_types"])
+    n_prim = len(basis["exponents"]) + (1 + deriv) * len(basis["comp_prim_index"])
+    columns = (n_comp + 1) * basis["n_basis"] + extra_columns + 2 * n_prim + 4 * n_shell + 4
+    return max(64, int(memory_budget // (itemsize * columns)))
+
+
+def iter_basis_blocks(
+    r_points: np.ndarray,
+    basis: Mapping[str, Any],
+    block_length: float = 2.0,
+    max_points: int = 20000,
+    deriv: int = 0,
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Evaluate screened, column-compressed basis matrices block by block.
+
+    Only shells whose cutoff sphere reaches a block are evaluated, so the
+    total cost grows roughly linearly with molecule size. While a
+    `BasisBlockCache` is active (see `openwfn.cache.basis_cache`) blocks
+    are looked up there before being evaluated; their size is rounded
+    down to a power of two (and capped by the cache's block budget) so
+    kernels with similar budgets partition a grid identically, but never
+    exceeds `max_points`.
+
+    Yields:
+        (point_index, phi, ao_index) where `phi[..., k]` holds basis function
+        `ao_index[k]` at points `r_points[point_index]`; `phi` carries a
+        leading derivative axis when `deriv > 0` (see `eval_basis_functions`).
+        Columns follow the evaluation groups, not Gaussian AO order.
+    """
+    pts = np.asarray(r_points).reshape(-1, 3)
+    cache = active_basis_cache()
+    if cache is not None:
+        limit = points_per_block(
+            basis, CACHE_BLOCK_BUDGET, extra_columns=basis["n_basis"], deriv=deriv, itemsize=pts.itemsize
+        )
+        max_points = 1 << (max(int(min(max_points, limit)), 1).bit_length() - 1)
+        prefix = cache.basis_key(basis, pts, deriv, max_points)
+    for block_id, index in enumerate(partition_points(pts, block_length, max_points)):
+        if cache is not None:
+            entry = cache.get(f"{prefix}-{block_id}")
+            if entry is not None:
+                yield index, entry[0], entry[1]
+                continue
+        block = pts[index]
+        lo, hi = block.min(axis=0), block.max(axis=0)
+        mask = screen_shells(basis, 0.5 * (lo + hi), 0.5 * float(np.linalg.norm(hi - lo)))
+        if not mask.any():
+            empty_shape = (len(index), 0) if deriv == 0 else (_N_DERIV_COMPONENTS[deriv], len(index), 0)
+            phi, ao_index = np.zeros(empty_shape, dtype=working_dtype(pts)), np.empty(0, dtype=np.intp)
+        else:
+            sub = subset_basis(basis, mask)
+            dtype = working_dtype(pts)
+            phi, columns = _eval_grouped(np.asarray(block, dtype=dtype) / dtype(BOHR_TO_ANGSTROM), sub, deriv)
+            phi, ao_index = phi[0] if deriv == 0 else phi, sub["ao_map"][columns]
+        if cache is not None:
+            cache.put(f"{prefix}-{block_id}", phi, ao_index)
+        yield index, phi, ao_index
+
+
+# Derivative components returned by `eval_basis_functions(..., deriv=n)`:
+# value, then d/dx, d/dy, d/dz, then xx, xy, xz, yy, yz, zz.
+DERIV_COMPONENTS = (
+    (0, 0, 0),
+    (1, 0, 0), (0, 1, 0), (0, 0, 1),
+    (2, 0, 0), (1, 1, 0), (1, 0, 1), (0, 2, 0), (0, 1, 1), (0, 0, 2),
+)
+_N_DERIV_COMPONENTS = (1, 4, 10)
+_HESSIAN_PAIRS = ((0, 0), (0, 1), (0, 2), (1, 1), (1, 2), (2, 2))
+
+
+def _monomials(d: np.ndarray, l: int, deriv: int = 0) -> np.ndarray:
+    """
+    Evaluate all Cartesian monomials of degree l and their partial derivatives.
+
+    Args:
+        d: (3, ...) displacements, one leading row per axis.
+        l: Monomial degree.
+        deriv: Highest derivative order (0, 1 or 2).
+
+    Returns:
+        (ncomp, ncart, ...) array following `DERIV_COMPONENTS`.
+    """
+    n_comp = _N_DERIV_COMPONENTS[deriv]
+    powers = np.empty((l + 1,) + d.shape, dtype=d.dtype)
+    powers[0] = 1.0
+    if l >= 1:
+        powers[1] = d
+    for k in range(2, l + 1):
+        powers[k] = powers[k - 1] * d
+
+    out = np.zeros((n_comp, len(cartesian_powers(l))) + d.shape[1:], dtype=d.dtype)
+    for c, exps in enumerate(cartesian_powers(l)):
+        for k, orders in enumerate(DERIV_COMPONENTS[:n_comp]):
+            factor = 1.0
+            term = None
+            for axis, (e, o) in enumerate(zip(exps, orders)):
+                if o > e:
+                    factor = 0.0
+                    break
+                factor *= math.perm(e, o)
+                if e - o:
+                    term = powers[e - o][axis] if term is None else term * powers[e - o][axis]
+            if factor == 0.0:
+                continue
+            out[k, c] = factor if term is None else factor * term
+    return out
+
+
+def _contract_radial(
+    expo: np.ndarray,
+    basis: Mapping[str, Any],
+    deriv: int,
+    dtype: type,
+) -> tuple[list[np.ndarray], np.ndarray]:
+    """
+    Contract primitive exponentials into radial factors of every component.
+
+    Components are ordered by decreasing primitive count, so the k-th
+    primitive of all components that have one is a contiguous column prefix;
+    each pass is then a single gather, scale and in-place add.
+
+    Returns:
+        Radial factors R0 (and R1, R2 for derivatives) as (N, ncomp) arrays in
+        that order, and the column of each original component.
+    """
+    n_prim = basis["comp_nprim"]
+    order = np.argsort(-n_prim, kind="stable")
+    comp_column = np.empty_like(order)
+    comp_column[order] = np.arange(len(order))
+    first = (np.cumsum(n_prim) - n_prim)[order]
+    counts = np.sum(n_prim[order][:, None] > np.arange(int(n_prim.max(initial=0))), axis=0)
+
+    exponents = basis["exponents"]
+    scales = [np.ones_like(exponents), -2.0 * exponents, 4.0 * exponents * exponents][: deriv + 1]
+    radial = [np.zeros((expo.shape[0], len(order)), dtype=dtype) for _ in scales]
+    for k, count in enumerate(counts):
+        elems = first[:count] + k
+        prims = basis["comp_prim_index"][elems]
+        term = expo[:, prims]
+        for R, scale in zip(radial, scales):
+            R[:, :count] += term * (basis["comp_coeffs"][elems] * scale[prims]).astype(dtype)
+    return radial, comp_column
+
+
+def _eval_grouped(pts: np.ndarray, basis: Mapping[str, Any], deriv: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate basis functions with columns in group order.
+
+    Each (l, pure) group fills one contiguous slab of columns, ordered by
+    angular function and then by shell, through plain slices; nothing is
+    scattered into Gaussian AO order.
+
+    Args:
+        pts: (N, 3) points in Bohr, already in the working dtype.
+        basis: Compiled basis with at least one function.
+        deriv: Derivative order (0, 1 or 2).
+
+    Returns:
+        (ncomp, N, nbasis) values and the AO index of every column.
+    """
+    dtype = pts.dtype.type
+    n_points = pts.shape[0]
+    n_comp = _N_DERIV_COMPONENTS[deriv]
+    phi = np.empty((n_comp, n_points, basis["n_basis"]), dtype=dtype)
+    columns = np.concatenate([group["ao_index"].T.ravel() for group in basis["groups"]])
+
+    # Displacements to every shell centre, one (N, nshell) row per axis
+    disp = pts.T[:, :, None] - basis["centers"].T.astype(dtype)[:, None, :]
+    r2 = disp[0] * disp[0] + disp[1] * disp[1] + disp[2] * disp[2]
+
+    # One exponential per (point, primitive), contracted per radial component:
+    # R0 = sum c e^{-a r^2}; R1 = sum c (-2a) e^{-a r^2}; R2 = sum c (4a^2) e^{-a r^2}
+    expo = np.exp(-r2[:, basis["prim_shell"]] * basis["exponents"].astype(dtype))
+    radial, comp_column = _contract_radial(expo, basis, deriv, dtype)
+
+    stop = 0
+    for group in basis["groups"]:
+        l = group["l"]
+        n_shells = len(group["shells"])
+        start, stop = stop, stop + group["ao_index"].size
+        # (ncomp, nfunc, N, nshell) view of the group's columns. Radial factors
+        # and displacements are (N, nshell) and broadcast over the leading
+        # function axis, which keeps every NumPy inner loop long.
+        slab = phi[:, :, start:stop].reshape(n_comp, n_points, -1, n_shells).swapaxes(1, 2)
+        rad = [R[:, comp_column[group["components"]]] for R in radial]
+        d = disp[:, :, group["shells"]]
+        x = list(d)
+
+        if l == 0:
+            # Angular factor is 1: phi = R0, d_i phi = x_i R1, d_ij phi = x_i x_j R2 + delta_ij R1
+            slab[0, 0] = rad[0]
+            if deriv:
+                for i in range(3):
+                    np.multiply(x[i], rad[1], out=slab[1 + i, 0])
+            if deriv == 2:
+                for k, (i, j) in enumerate(_HESSIAN_PAIRS, start=4):
+                    value = x[i] * x[j]
+                    value *= rad[2]
+                    if i == j:
+                        value += rad[1]
+                    slab[k, 0] = value
+            continue
+
+        mono = _monomials(d, l, deriv)
+        if group["pure"]:
+            A = np.einsum("kcns,cm->kmns", mono, spherical_transform(l).astype(dtype))
+        else:
+            A = mono * cartesian_norm_factors(l).astype(dtype)[:, None, None]
+
+        np.multiply(A[0], rad[0], out=slab[0])
+        if deriv == 0:
+            continue
+        A0R1 = A[0] * rad[1]
+        xR1 = [x[i] * rad[1] for i in range(3)]
+        for i in range(3):
+            value = A[1 + i] * rad[0]
+            value += x[i] * A0R1
+            slab[1 + i] = value
+        if deriv == 2:
+            A0R2 = A[0] * rad[2]
+            for k, (i, j) in enumerate(_HESSIAN_PAIRS, start=4):
+                value = A[k] * rad[0]
+                value += A[1 + i] * xR1[j]
+                value += A[1 + j] * xR1[i]
+                value += (x[i] * x[j]) * A0R2
+                if i == j:
+                    value += A0R1
+                slab[k] = value
+    return phi, columns
+
+
+def eval_basis_functions(r_points: np.ndarray, basis: Mapping[str, Any], deriv: int = 0) -> np.ndarray:
+    """
+    Evaluate every contracted basis function (and optionally its derivatives).
+
+    Each primitive exponential is computed once per point and shared by all
+    angular components of its shell (and by both halves of SP shells). With
+    `deriv > 0` the same exponentials also feed the radial derivative factors,
+    so values, gradients and Hessians come from a single pass. Functions are
+    evaluated in (l, pure) groups and permuted to Gaussian AO order once at
+    the end; `iter_basis_blocks` skips that permutation and reorders its
+    `ao_index` instead.
+
+    Args:
+        r_points: (N, 3) array of Cartesian coordinates in Angstroms.
+        basis: Compiled basis from `compile_basis` or a `BasisSet`.
+        deriv: 0 for values only, 1 adds gradients, 2 adds second derivatives.
+
+    Returns:
+        (N, nbasis) matrix of basis function values in Gaussian AO order for
+        `deriv=0`; otherwise a (4 or 10, N, nbasis) array ordered as
+        `DERIV_COMPONENTS`, with derivatives in atomic units (per Bohr).
+        Float32 points are evaluated in single precision (see `working_dtype`).
+    """
+    if deriv not in (0, 1, 2):
+        raise ValueError(f"deriv must be 0, 1 or 2 (got {deriv}).")
+    dtype = working_dtype(r_points)
+    pts = np.asarray(r_points, dtype=dtype).reshape(-1, 3) / dtype(BOHR_TO_ANGSTROM)
+    n_comp = _N_DERIV_COMPONENTS[deriv]
+    if basis["n_basis"] == 0 or pts.shape[0] == 0:
+        phi = np.zeros((n_comp, pts.shape[0], basis["n_basis"]), dtype=dtype)
+    else:
+        grouped, columns = _eval_grouped(pts, basis, deriv)
+        phi = np.take(grouped, np.argsort(columns), axis=-1)
+    return phi[0] if deriv == 0 else phi
@@ -0,0 +1,180 @@
+# src/openwfn/cache.py
+
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import numpy as np  # type: ignore
+
+# Default in-memory capacity of a basis block cache.
+DEFAULT_CACHE_BYTES = 1024 ** 3
+# Largest transient budget of a block while a cache is active; callers'
+# smaller budgets still apply (see `iter_basis_blocks`).
+CACHE_BLOCK_BUDGET = 256 * 1024 ** 2
+
+
+def _update(h: Any, value: Any) -> None:
+    """Feed a (possibly nested) basis entry into a hash."""
+    if isinstance(value, np.ndarray):
+        h.update(f"{value.dtype.str}{value.shape}".encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, Mapping):
+        for key in sorted(value):
+            h.update(str(key).encode())
+            _update(h, value[key])
+    elif isinstance(value, (list, tuple)):
+        h.update(f"[{len(value)}]".encode())
+        for item in value:
+            _update(h, item)
+    else:
+        h.update(repr(value).encode())
+
+
+def _digest(value: Any) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    _update(h, value)
+    return h.hexdigest()
+
+
+class BasisBlockCache:
+    """
+    LRU cache of screened basis-value blocks shared by the grid kernels.
+
+    While a cache is active (see `basis_cache`), `iter_basis_blocks` looks
+    up every block of basis values it would evaluate under the key
+    (geometry hash, basis hash, points hash, derivative order, block size,
+    block id), so exporting the density and then a few orbitals on the same
+    grid pays for the exponentials once and only for the GEMMs afterwards.
+    Blocks are kept in memory up to `max_bytes`, least recently used first
+    out. With `spill_dir` every block is also written there as `.npz`,
+    which extends the cache beyond memory and shares it with worker
+    processes and later runs on the same grid.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES, spill_dir: str | None = None):
+        self.max_bytes = int(max_bytes)
+        self.spill_dir = None if spill_dir is None else os.fspath(spill_dir)
+        if self.spill_dir is not None:
+            os.makedirs(self.spill_dir, exist_ok=True)
+        self.nbytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._blocks: "OrderedDict[str, tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+
+    def basis_key(self, basis: Mapping[str, Any], r_points: np.ndarray, deriv: int, block_points: int) -> str:
+        """Key prefix of all blocks of one `iter_basis_blocks` call with blocks of up to `block_points`."""
+        geometry = _digest(np.asarray(basis["centers"]))
+        functions = _digest({key: basis[key] for key in basis if key != "centers"})
+        points = _digest(np.asarray(r_points))
+        return f"{geometry}-{functions}-{points}-d{int(deriv)}-b{int(block_points)}"
+
+    def get(self, key: str) -> tuple[np.ndarray, np.ndarray] | None:
+        """Cached (phi, ao_index) of a block, from memory or the spill directory."""
+        entry = self._blocks.get(key)
+        if entry is not None:
+            self._blocks.move_to_end(key)
+            self.hits += 1
+            return entry
+        path = self._path(key)
+        if path is not None and os.path.exists(path):
+            with np.load(path) as data:
+                entry = (data["phi"], data["ao_index"])
+            self._remember(key, entry)
+            self.disk_hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def put(self, key: str, phi: np.ndarray, ao_index: np.ndarray) -> None:
+        """Store a block, spilling it to disk when a spill directory is set."""
+        path = self._path(key)
+        if path is not None and not os.path.exists(path):
+            # Write under a unique name first so concurrent workers never
+            # see a partial file.
+            tmp = f"{path[:-4]}.{os.getpid()}.tmp.npz"
+            np.savez(tmp, phi=phi, ao_index=ao_index)
+            os.replace(tmp, path)
+        self._remember(key, (phi, ao_index))
+
+    def clear(self) -> None:
+        """Drop the in-memory blocks (spilled files are kept)."""
+        self._blocks.clear()
+        self.nbytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "blocks": len(self._blocks),
+            "nbytes": self.nbytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+    def _path(self, key: str) -> str | None:
+        if self.spill_dir is None:
+            return None
+        return os.path.join(self.spill_dir, f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.npz")
+
+    def _remember(self, key: str, entry: tuple[np.ndarray, np.ndarray]) -> None:
+        size = entry[0].nbytes + entry[1].nbytes
+        if size > self.max_bytes:
+            return
+        if key in self._blocks:
+            self._blocks.move_to_end(key)
+            return
+        self._blocks[key] = entry
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, (phi, ao_index) = self._blocks.popitem(last=False)
+            self.nbytes -= phi.nbytes + ao_index.nbytes
+
+    def __repr__(self) -> str:
+        spill = "" if self.spill_dir is None else f", spill_dir={self.spill_dir!r}"
+        return f"BasisBlockCache({len(self._blocks)} blocks, {self.nbytes} of {self.max_bytes} bytes{spill})"
+
+
+# Cache consulted by `iter_basis_blocks`; None disables caching.
+_ACTIVE: dict[str, BasisBlockCache | None] = {"cache": None}
+
+
+def active_basis_cache() -> BasisBlockCache | None:
+    """The basis block cache currently in use, if any."""
+    return _ACTIVE["cache"]
+
+
+def set_basis_cache(cache: BasisBlockCache | None) -> BasisBlockCache | None:
+    """Install `cache` (None disables caching) and return the previous one."""
+    previous = _ACTIVE["cache"]
+    _ACTIVE["cache"] = cache
+    return previous
+
+
+@contextmanager
+def basis_cache(
+    max_bytes: int = DEFAULT_CACHE_BYTES,
+    spill_dir: str | None = None,
+    cache: BasisBlockCache | None = None,
+) -> Iterator[BasisBlockCache]:
+    """
+    Reuse basis-function values across grid evaluations within a block.
+
+    Example:
+        with basis_cache(max_bytes=2 * 1024 ** 3) as cache:
+            rho = compute_density(points, P, basis)
+            homo = evaluate_mo(points, homo_index, C, basis)  # GEMM only
+
+    Args:
+        max_bytes: In-memory capacity; least recently used blocks go first.
+        spill_dir: Optional directory that keeps every block on disk.
+        cache: Existing cache to (re)activate instead of a new one.
+    """
+    active = BasisBlockCache(max_bytes, spill_dir) if cache is None else cache
+    previous = set_basis_cache(active)
+    try:
+        yield active
+    finally:
+        set_basis_cache(previous)
@@ -45,18 +45,23 @@ def convert_chk_to_fchk(file: str, output: str | None = None, *, quiet: bool = F
 
 
 def ensure_fchk(file: str) -> str:
-    """Convert .chk -> .fchk if necessary."""
-    if file.endswith(".fchk"):
+    """Convert .chk -> .fchk if necessary (.xyz geometries are used as they are)."""
+    if file.endswith((".fchk", ".xyz")):
         return file
 
     if file.endswith(".chk"):
         return convert_chk_to_fchk(file)
 
-    sys.exit("Input must be a Gaussian `.chk` or `.fchk` file.")
+    sys.exit("Input must be a Gaussian `.chk` or `.fchk` file (or an `.xyz` geometry).")
 
 
 def load_data(filename: str) -> tuple[str, dict[str, Any], list[int], list[tuple[float, float, float]]]:
     fchk_file = ensure_fchk(filename)
+    if fchk_file.endswith(".xyz"):
+        from .xyz import read_xyz  # type: ignore
+
+        atomic_numbers, coordinates = read_xyz(fchk_file)
+        return fchk_file, {}, atomic_numbers, coordinates
     lines = read_fchk(fchk_file)
     scalars = parse_fchk_scalars(lines)
     atomic_numbers, coordinates = parse_fchk_arrays(lines)
@@ -72,12 +77,15 @@ def main() -> int:
         prog="openwfn",
         description=(
             "openWFN — Lightweight Wavefunction Geometry Toolkit. "
-            "Geometry analysis commands are stable; 'density' and 'mo' are experimental "
-            "and currently unavailable for production use."
+            "Geometry analysis commands are stable; 'density', 'mo' and 'integrate' are experimental "
+            "developer previews and not yet intended for production use."
         )
     )
 
-    parser.add_argument("file", help="Gaussian .chk or .fchk file")
+    parser.add_argument(
+        "file",
+        help="Gaussian .chk or .fchk file, or an .xyz geometry (an .owv volume store or .cube file for `volume`)",
+    )
 
     subparsers = parser.add_subparsers(
         dest="command",
@@ -154,10 +162,83 @@ def main() -> int:
     )
     p_dens.add_argument(
         "--grid-size",
-        default="40x40x40",
-        help="Requested grid size placeholder (currently ignored; spacing-based grid is used)"
+        default=None,
+        help="Grid points per axis as NXxNYxNZ (e.g. 80x80x80) or a spacing in Angstroms (default: 0.2)",
+    )
+    p_dens.add_argument("--export", required=True, help="Output .vtk, .vti, .cube, .csv[.gz] or .owv store path (or mesh file with --isosurface)")
+    p_dens.add_argument(
+        "--spin",
+        action="store_true",
+        help="Also export spin, alpha and beta densities (open-shell checkpoints)",
+    )
+    p_dens.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Evaluate on an adaptive octree and export it as a VTK unstructured grid",
+    )
+    p_dens.add_argument(
+        "--to-uniform",
+        action="store_true",
+        help="With --adaptive, interpolate the octree back onto the uniform --grid-size grid",
+    )
+    p_dens.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for grid evaluation (0 uses all available cores)",
+    )
+    p_dens.add_argument(
+        "--precision",
+        choices=["float64", "float32"],
+        default="float64",
+        help="Floating-point precision of grid evaluation (float32 is faster, ~1e-5 relative error)",
+    )
+    p_dens.add_argument(
+        "--out-of-core",
+        action="store_true",
+        help="Stream grid blocks through a disk-backed scratch array (bounded memory for very fine grids)",
+    )
+    p_dens.add_argument(
+        "--max-memory",
+        default=None,
+        help="Cap on estimated peak memory (e.g. 2G, 512M); chunk sizes are chosen to fit",
+    )
+    p_dens.add_argument(
+        "--estimate",
+        action="store_true",
+        help="Only print the estimated memory, output size and runtime, then exit",
+    )
+    p_dens.add_argument(
+        "--isosurface",
+        default=None,
+        metavar="LEVELS",
+        help="Export +/- isosurfaces at these comma-separated levels instead of the volume (.obj, .ply or .html output)",
+    )
+    p_dens.add_argument(
+        "--encoding",
+        choices=["ascii", "binary", "raw", "zlib", "lzma"],
+        default=None,
+        help="Volume encoding: ascii (default) or binary for .vtk, zlib (default) or raw for .vti, "
+        "zlib (default), lzma or raw for .owv stores",
+    )
+    p_dens.add_argument(
+        "--promolecular",
+        action="store_true",
+        help="Sum tabulated spherical atomic densities instead of using the wavefunction "
+        "(fast, linear in system size; works for .xyz input and FCHK files without basis data)",
+    )
+    p_dens.add_argument(
+        "--symmetry",
+        action="store_true",
+        help="Detect the point group and evaluate only the symmetry-unique part of the grid "
+        "(the box is made symmetric about the molecule)",
+    )
+    p_dens.add_argument(
+        "--basis-cache",
+        default=None,
+        metavar="DIR",
+        help="Keep evaluated basis-function blocks in DIR so later density/mo exports on the same grid skip them",
     )
-    p_dens.add_argument("--export", required=True, help="Output VTK file path")
 
     # mo
     p_mo = subparsers.add_parser(
@@ -165,15 +246,141 @@ def main() -> int:
         help=argparse.SUPPRESS,
         description="Experimental developer preview: molecular-orbital export pathway.",
     )
-    p_mo.add_argument("index", type=int, help="MO index")
-    p_mo.add_argument("--export", required=True, help="Output VTK file path")
+    p_mo.add_argument(
+        "selection",
+        help="MO selection: 1-based index, HOMO/LUMO offsets or ranges (e.g. HOMO-5:LUMO+5)",
+    )
+    p_mo.add_argument("--beta", action="store_true", help="Use beta-spin orbitals")
+    p_mo.add_argument(
+        "--grid-size",
+        default=None,
+        help="Grid points per axis as NXxNYxNZ (e.g. 80x80x80) or a spacing in Angstroms (default: 0.2)",
+    )
+    p_mo.add_argument("--export", required=True, help="Output .vtk, .vti, .cube, .csv[.gz] or .owv store path (or mesh file with --isosurface)")
+    p_mo.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for grid evaluation (0 uses all available cores)",
+    )
+    p_mo.add_argument(
+        "--precision",
+        choices=["float64", "float32"],
+        default="float64",
+        help="Floating-point precision of grid evaluation (float32 is faster, ~1e-5 relative error)",
+    )
+    p_mo.add_argument(
+        "--out-of-core",
+        action="store_true",
+        help="Stream grid blocks through a disk-backed scratch array (bounded memory for very fine grids)",
+    )
+    p_mo.add_argument(
+        "--max-memory",
+        default=None,
+        help="Cap on estimated peak memory (e.g. 2G, 512M); chunk sizes are chosen to fit",
+    )
+    p_mo.add_argument(
+        "--estimate",
+        action="store_true",
+        help="Only print the estimated memory, output size and runtime, then exit",
+    )
+    p_mo.add_argument(
+        "--isosurface",
+        default=None,
+        metavar="LEVELS",
+        help="Export +/- isosurfaces at these comma-separated levels instead of the volume (.obj, .ply or .html output)",
+    )
+    p_mo.add_argument(
+        "--encoding",
+        choices=["ascii", "binary", "raw", "zlib", "lzma"],
+        default=None,
+        help="Volume encoding: ascii (default) or binary for .vtk, zlib (default) or raw for .vti, "
+        "zlib (default), lzma or raw for .owv stores",
+    )
+    p_mo.add_argument(
+        "--basis-cache",
+        default=None,
+        metavar="DIR",
+        help="Keep evaluated basis-function blocks in DIR so later density/mo exports on the same grid skip them",
+    )
+
+    # integrate
+    p_int = subparsers.add_parser(
+        "integrate",
+        help=argparse.SUPPRESS,
+        description="Experimental developer preview: Becke-grid density integration and atomic populations.",
+    )
+    p_int.add_argument(
+        "--angular-degree",
+        type=int,
+        default=29,
+        help="Angular exactness of the atom-centred grids in the valence region",
+    )
+    p_int.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for grid evaluation (0 uses all available cores)",
+    )
+
+    # slice
+    p_slice = subparsers.add_parser("slice", help="Evaluate density or orbitals on a plane (2-D map)")
+    p_slice.add_argument("--atoms", default=None, help="Three 1-based atom indices defining the plane (e.g. 1,2,3)")
+    p_slice.add_argument("--normal", default=None, help="Plane normal as nx,ny,nz (alternative to --atoms)")
+    p_slice.add_argument("--point", default=None, help="Point on the plane as x,y,z in Angstroms (default: centroid)")
+    p_slice.add_argument("--spacing", type=float, default=0.05, help="Point spacing in Angstroms")
+    p_slice.add_argument("--margin", type=float, default=2.0, help="Padding around the projected atoms in Angstroms")
+    p_slice.add_argument("--mo", default=None, help="Orbital selection (e.g. HOMO or HOMO-1:LUMO); default is the density")
+    p_slice.add_argument("--beta", action="store_true", help="Use beta orbitals with --mo")
+    p_slice.add_argument("--workers", type=int, default=1, help="Worker processes for grid evaluation (0 uses all available cores)")
+    p_slice.add_argument("--export", required=True, help="Output .npz, .npy, .csv[.gz], .cube or .vti path")
+
+    # profile
+    p_profile = subparsers.add_parser("profile", help="Evaluate density or orbitals along the line through two atoms")
+    p_profile.add_argument("i", type=int)
+    p_profile.add_argument("j", type=int)
+    p_profile.add_argument("--points", type=int, default=200, help="Number of points along the line")
+    p_profile.add_argument("--extend", type=float, default=1.0, help="Extension beyond both atoms in Angstroms")
+    p_profile.add_argument("--mo", default=None, help="Orbital selection (e.g. HOMO); default is the density")
+    p_profile.add_argument("--beta", action="store_true", help="Use beta orbitals with --mo")
+    p_profile.add_argument("--export", required=True, help="Output .csv[.gz], .npz or .npy path")
+
+    # volume
+    p_volume = subparsers.add_parser(
+        "volume", help="Inspect, interpolate, export or resample a precomputed .owv store or cube file"
+    )
+    p_volume.add_argument("--export", default=None, help="Output .vtk, .vti, .cube, .csv[.gz] or .owv path")
+    p_volume.add_argument(
+        "--region",
+        default=None,
+        help="Grid points to export as x,y,z indices or start:stop[:step] slices (e.g. 10:50,:,32)",
+    )
+    p_volume.add_argument("--fields", default=None, help="Comma-separated fields to export (default: all)")
+    p_volume.add_argument(
+        "--encoding",
+        choices=["ascii", "binary", "raw", "zlib", "lzma"],
+        default=None,
+        help="Encoding of the exported volume (see `density --encoding`)",
+    )
+    p_volume.add_argument(
+        "--resample",
+        default=None,
+        help="Interpolate the (region of the) volume onto NXxNYxNZ points or a spacing in Angstroms over the same box",
+    )
+    p_volume.add_argument(
+        "--method",
+        choices=["linear", "cubic"],
+        default="linear",
+        help="Interpolation scheme: trilinear or tricubic (Catmull-Rom)",
+    )
+    p_volume.add_argument("--at-atoms", action="store_true", help="Print interpolated values at the atom positions")
 
     # Keep experimental developer commands callable without presenting them as
     # public end-user features in `--help`.
     subparsers._choices_actions = [  # type: ignore[attr-defined]
         action
         for action in subparsers._choices_actions  # type: ignore[attr-defined]
-        if action.dest not in {"density", "mo"}
+        if action.dest not in {"density", "mo", "integrate", "volume", "slice", "profile"}
     ]
 
     args = parser.parse_args()
@@ -187,6 +394,22 @@ def main() -> int:
         utils.print_success(f"Formatted checkpoint ready: {output_path}")
         return 0
 
+    if getattr(args, "command", None) == "volume":
+        try:
+            return cmd.cmd_volume(
+                args.file,
+                args.export,
+                region=args.region,
+                fields=args.fields,
+                encoding=args.encoding,
+                resample=args.resample,
+                method=args.method,
+                at_atoms=args.at_atoms,
+            )
+        except Exception as e:
+            utils.print_error(str(e))
+            return 1
+
     # If no subcommand → default to interactive if it's a TTY, else summary
     if getattr(args, "command", None) is None:
         if sys.stdin.isatty():
@@ -201,7 +424,8 @@ def main() -> int:
         utils.print_error(str(e))
         return 1
 
-    lines = read_fchk(fchk_file)
+    # XYZ input carries only the geometry.
+    lines = [] if fchk_file.endswith(".xyz") else read_fchk(fchk_file)
 
     # -----------------------------
     # Commands
@@ -227,13 +451,86 @@ def main() -> int:
             return cmd.cmd_bonds(atomic_numbers, coordinates)
 
         if args.command == "graph": # type: ignore
-            return cmd.cmd_graph(atomic_numbers, coordinates)
+            from .fchk import parse_fchk_charges  # type: ignore
+
+            return cmd.cmd_graph(atomic_numbers, coordinates, parse_fchk_charges(lines))
 
         if args.command == "density": # type: ignore
-            return cmd.cmd_density(filename, args.grid_size, args.export, lines, coordinates)
+            return cmd.cmd_density(
+                filename,
+                args.grid_size,
+                args.export,
+                lines,
+                coordinates,
+                workers=args.workers,
+                spin=args.spin,
+                adaptive=args.adaptive,
+                to_uniform=args.to_uniform,
+                precision=args.precision,
+                out_of_core=args.out_of_core,
+                max_memory=args.max_memory,
+                estimate_only=args.estimate,
+                isosurface=args.isosurface,
+                encoding=args.encoding,
+                basis_cache=args.basis_cache,
+                symmetry=args.symmetry,
+                promolecular=args.promolecular,
+                atomic_numbers=atomic_numbers,
+            )
+
+        if args.command == "integrate": # type: ignore
+            return cmd.cmd_integrate(
+                atomic_numbers, coordinates, lines, angular_degree=args.angular_degree, workers=args.workers
+            )
 
         if args.command == "mo": # type: ignore
-            return cmd.cmd_mo(filename, args.index, args.export, lines, coordinates)
+            return cmd.cmd_mo(
+                filename,
+                args.selection,
+                args.export,
+                lines,
+                coordinates,
+                beta=args.beta,
+                workers=args.workers,
+                precision=args.precision,
+                out_of_core=args.out_of_core,
+                grid_size=args.grid_size,
+                max_memory=args.max_memory,
+                estimate_only=args.estimate,
+                isosurface=args.isosurface,
+                encoding=args.encoding,
+                basis_cache=args.basis_cache,
+            )
+
+        if args.command == "slice": # type: ignore
+            return cmd.cmd_slice(
+                lines,
+                atomic_numbers,
+                coordinates,
+                args.export,
+                atoms=args.atoms,
+                normal=args.normal,
+                point=args.point,
+                spacing=args.spacing,
+                margin=args.margin,
+                mo=args.mo,
+                beta=args.beta,
+                workers=args.workers,
+            )
+
+        if args.command == "profile": # type: ignore
+            return cmd.cmd_profile(
+                lines,
+                atomic_numbers,
+                coordinates,
+                args.export,
+                args.i,
+                args.j,
+                n_points=args.points,
+                extend=args.extend,
+                mo=args.mo,
+                beta=args.beta,
+            )
 
         if args.command == "xyz": # type: ignore
             return cmd.cmd_xyz(args.output, atomic_numbers, coordinates)
@@ -18,6 +18,9 @@ from .geometry import (  # type: ignore
 from .xyz import write_xyz  # type: ignore
 from . import utils  # type: ignore
 
+# `summary` skips point-group detection for larger systems to stay interactive.
+SUMMARY_SYMMETRY_MAX_ATOMS = 2000
+
 
 def cmd_summary(
     scalars: dict[str, Any],
@@ -37,6 +40,11 @@ def cmd_summary(
     print(f"{utils.highlight('Charge:')}     {scalars.get('Charge', 'N/A')}")
     print(f"{utils.highlight('Spin Mult:')}  {scalars.get('Multiplicity', 'N/A')}")
     print(f"{utils.highlight('COM (Å):')}    ({com[0]:.3f}, {com[1]:.3f}, {com[2]:.3f})")
+    if len(atomic_numbers) > SUMMARY_SYMMETRY_MAX_ATOMS:
+        print(f"{utils.highlight('Point Grp:')}  unavailable (more than {SUMMARY_SYMMETRY_MAX_ATOMS} atoms)")
+    elif atomic_numbers:
+        from .symmetry import point_group  # type: ignore
+        print(f"{utils.highlight('Point Grp:')}  {point_group(atomic_numbers, coordinates)['name']}")
     
     # Electronics
     if "Total Energy" in scalars:
@@ -170,75 +178,889 @@ def cmd_view(
     return 0
 
 
+def _export_grid(
+    output: str,
+    grid: Any,
+    basis: Any,
+    kernel: str,
+    matrix: np.ndarray,
+    write: Any,
+    dtype: Any,
+    workers: int | None,
+    out_of_core: bool = False,
+    plan: dict[str, Any] | None = None,
+    store: Any = None,
+    cache_dir: str | None = None,
+    symmetry: np.ndarray | None = None,
+) -> None:
+    """Evaluate a kernel block by block on a regular grid and pass the values to `write`.
+
+    With `out_of_core` the values go to a scratch memory map beside the
+    output (removed afterwards) instead of RAM. With `store` (a
+    `VolumeStore`) each block is compressed into the store as it is
+    evaluated and `write` is not called. Chunk sizes come from `plan` (see
+    `_report_grid_plan`) when given. With `cache_dir` basis-function blocks
+    are read from and spilled to that directory, so a later export on the
+    same grid only pays for the contractions. With `symmetry` (lattice
+    maps from `lattice_operations`) only the symmetry-unique points are
+    evaluated.
+    """
+    if cache_dir is not None:
+        from .cache import basis_cache  # type: ignore
+
+        with basis_cache(max_bytes=0, spill_dir=cache_dir) as cache:
+            _export_grid(output, grid, basis, kernel, matrix, write, dtype, workers, out_of_core, plan, store, symmetry=symmetry)
+        stats = cache.stats()
+        reused, looked_up = stats["disk_hits"], stats["disk_hits"] + stats["misses"]
+        # Worker processes consult the directory themselves.
+        usage = f"{reused} of {looked_up} blocks reused from" if looked_up else "shared by the workers in"
+        utils.print_key_value_rows([("Basis cache", f"{usage} {cache_dir}")])
+        return
+
+    import tempfile
+
+    from numpy.lib.format import open_memmap  # type: ignore
+
+    from .parallel import evaluate_grid_into, kernel_output_shape  # type: ignore
+
+    shape = kernel_output_shape(kernel, grid.n_points, matrix)
+    sizing = {} if plan is None else {"chunk_points": plan["chunk_points"], "memory_budget": plan["memory_budget"]}
+    sizing["symmetry"] = symmetry
+    if store is not None:
+        evaluate_grid_into(store.writer(shape), grid, basis, kernel, matrix, workers=workers, **sizing).close()
+        return
+    if not out_of_core:
+        values = evaluate_grid_into(np.empty(shape, dtype=dtype), grid, basis, kernel, matrix, workers=workers, **sizing)
+        write(values)
+        return
+    with tempfile.TemporaryDirectory(prefix="openwfn-", dir=Path(output).resolve().parent) as scratch:
+        values = open_memmap(str(Path(scratch) / "values.npy"), mode="w+", dtype=dtype, shape=shape)
+        evaluate_grid_into(values, grid, basis, kernel, matrix, workers=workers, **sizing)
+        write(values)
+        del values
+
+
+def parse_iso_levels(text: str | None) -> list[float]:
+    """Parse comma-separated isosurface levels such as `0.05` or `0.02,0.05`."""
+    if text is None:
+        return []
+    try:
+        levels = [abs(float(item)) for item in text.split(",") if item.strip()]
+    except ValueError:
+        raise ValueError(f"Invalid isosurface levels '{text}' (use e.g. 0.05 or 0.02,0.05).") from None
+    if not levels:
+        raise ValueError("At least one isosurface level is required.")
+    return levels
+
+
+def _check_surface_output(output: str) -> None:
+    if Path(output).suffix.lower() not in (".obj", ".ply", ".html"):
+        raise ValueError(f"Isosurfaces are exported as .obj, .ply or .html (got '{output}').")
+
+
+def _volume_format(output: str) -> str:
+    """Lower-case output suffix, with `.csv.gz` reported as `.csv`."""
+    name = Path(output).name.lower()
+    return ".csv" if name.endswith((".csv", ".csv.gz")) else Path(name).suffix
+
+
+def _create_store(
+    output: str,
+    grid: Any,
+    fields: list[str],
+    dtype: Any,
+    encoding: str,
+    atomic_numbers: list[int],
+    coordinates: list[tuple[float, float, float]],
+) -> Any:
+    """Create a chunked volume store for `fields`, replacing an existing one."""
+    import shutil
+
+    from .volume import VolumeStore  # type: ignore
+
+    if Path(output).exists():
+        if not (Path(output) / "volume.json").is_file():
+            raise ValueError(f"{output} exists and is not an openWFN volume store.")
+        shutil.rmtree(output)
+    return VolumeStore.create(
+        output,
+        grid,
+        fields,
+        dtype=dtype,
+        compression=encoding,
+        atomic_numbers=atomic_numbers,
+        coordinates=coordinates,
+    )
+
+
+def resolve_encoding(output: str, encoding: str | None) -> str:
+    """
+    Check `--encoding` against the output format and fill in its default.
+
+    Legacy .vtk files are `ascii` (default) or `binary`; .vti files are
+    `zlib` (default) or `raw`; .owv volume stores are `zlib` (default),
+    `lzma` or `raw`. Other formats (cube, CSV, meshes) have a
+    single encoding; CSV is gzip-compressed when the name ends in `.gz`.
+    """
+    suffix = _volume_format(output)
+    choices = {".vti": ("zlib", "raw"), ".owv": ("zlib", "lzma", "raw")}.get(suffix, ("ascii", "binary") if suffix not in (".cube", ".csv", ".obj", ".ply", ".html") else ())
+    if encoding is None:
+        return choices[0] if choices else "ascii"
+    if encoding not in choices:
+        allowed = f"use {' or '.join(choices)}" if choices else "it has a fixed encoding"
+        raise ValueError(f"Encoding '{encoding}' does not apply to {suffix or 'this'} output ({allowed}).")
+    return encoding
+
+
+def _write_fields(
+    output: str,
+    grid: Any,
+    fields: dict[str, np.ndarray],
+    iso_levels: list[float],
+    atomic_numbers: list[int],
+    coordinates: list[tuple[float, float, float]],
+    encoding: str = "ascii",
+) -> None:
+    """Write grid fields as a VTK, VTI, cube, CSV or .owv volume, or as isosurface meshes when levels are given."""
+    from .export import export_csv, export_cube, export_obj, export_ply, export_vti, export_vtk_grid  # type: ignore
+    from .isosurface import isosurfaces  # type: ignore
+
+    if not iso_levels:
+        suffix = _volume_format(output)
+        if suffix == ".cube":
+            export_cube(output, grid, fields, atomic_numbers, coordinates)
+        elif suffix == ".csv":
+            export_csv(output, grid, fields)
+        elif suffix == ".owv":
+            dtype = np.asarray(next(iter(fields.values()))).dtype
+            store = _create_store(output, grid, list(fields), dtype, encoding, atomic_numbers, coordinates)
+            writer = store.writer((grid.n_points, len(fields)))
+            for start, stop, _ in grid.iter_blocks(block_points=1 << 20):
+                writer[start:stop] = np.column_stack([values[start:stop] for values in fields.values()])
+            writer.close()
+        elif suffix == ".vti":
+            export_vti(output, grid, fields, encoding=encoding)
+        else:
+            export_vtk_grid(output, grid, fields, binary=encoding == "binary")
+        return
+    meshes = isosurfaces(fields, grid, iso_levels)
+    # Positive lobes blue, negative lobes red.
+    colors = {name: (59, 130, 246) if name.rsplit("_", 1)[1].startswith("+") else (239, 68, 68) for name in meshes}
+    suffix = Path(output).suffix.lower()
+    if suffix == ".obj":
+        export_obj(output, meshes)
+    elif suffix == ".ply":
+        export_ply(output, meshes, colors)
+    else:
+        surfaces = [
+            {"name": name, "vertices": v, "faces": f, "color": "#{:02x}{:02x}{:02x}".format(*colors[name]), "opacity": 0.75}
+            for name, (v, f) in meshes.items()
+        ]
+        export_molecule_viewer(output, atomic_numbers, coordinates, title=f"openWFN {Path(output).stem}", surfaces=surfaces)
+    n_vertices = sum(len(v) for v, _ in meshes.values())
+    n_faces = sum(len(f) for _, f in meshes.values())
+    print(f"Isosurfaces: {len(meshes)} mesh(es), {n_vertices} vertices, {n_faces} triangles.")
+
+
+def _report_grid_plan(
+    grid: Any,
+    basis: Any,
+    kernel: str,
+    matrix: np.ndarray,
+    dtype: Any,
+    workers: int | None,
+    out_of_core: bool,
+    max_memory: str | int | None,
+    encoding: str = "ascii",
+    symmetry: np.ndarray | None = None,
+) -> dict[str, Any]:
+    """Estimate memory, output size and runtime of a grid job and print them."""
+    from .estimate import format_bytes, format_duration, parse_memory_size, plan_grid_job  # type: ignore
+
+    limit = None if max_memory is None else parse_memory_size(max_memory)
+    plan = plan_grid_job(
+        basis,
+        grid,
+        kernel,
+        matrix,
+        dtype=dtype,
+        workers=workers,
+        out_of_core=out_of_core,
+        max_memory=limit,
+        binary_output=encoding in ("binary", "raw", "zlib"),
+        symmetry_order=1 if symmetry is None else len(symmetry),
+    )
+    rows = [
+        ("Grid", f"{grid} ({plan['n_points']} points x {plan['n_fields']} field(s), {np.dtype(dtype).name})"),
+        ("Peak memory (est.)", format_bytes(plan["peak_memory"]) + ("" if limit is None else f" of {format_bytes(limit)}")),
+        ("Chunk size", f"{plan['chunk_points']} points, {format_bytes(plan['memory_budget'])} block budget per worker"),
+        ("Output written (est.)", format_bytes(plan["bytes_written"])),
+    ]
+    if plan["scratch_bytes"]:
+        rows.append(("Scratch on disk", format_bytes(plan["scratch_bytes"])))
+    if plan["runtime"] is not None:
+        rows.append(("Runtime (est.)", format_duration(plan["runtime"])))
+    utils.print_key_value_rows(rows)
+    return plan
+
+
 def cmd_density(
     filename: str,
-    grid_size: str,
+    grid_size: str | None,
     output: str,
     lines: list[str],
     coordinates: list[tuple[float, float, float]],
+    workers: int | None = 1,
+    spin: bool = False,
+    adaptive: bool = False,
+    to_uniform: bool = False,
+    precision: str = "float64",
+    out_of_core: bool = False,
+    max_memory: str | int | None = None,
+    estimate_only: bool = False,
+    isosurface: str | None = None,
+    encoding: str | None = None,
+    basis_cache: str | None = None,
+    symmetry: bool = False,
+    promolecular: bool = False,
+    atomic_numbers: list[int] | None = None,
 ) -> int:
-    """Calculate electron density on a grid and export to VTK."""
-    del filename, grid_size
-    from .fchk import parse_fchk_density  # type: ignore
-    from .grid import make_bounding_box_grid  # type: ignore
-    from .density import compute_density  # type: ignore
-    from .export import export_vtk  # type: ignore
+    """Calculate electron density (optionally with spin fields) on a grid and export to VTK or isosurfaces.
 
-    density_data = parse_fchk_density(lines)
-    if not density_data or "total_scf_density" not in density_data:
-        utils.print_error("Total SCF Density not found in FCHK.")
-        return 1
-        
-    P_mu_nu = density_data["total_scf_density"]
-    
-    utils.print_header("Electron Density Computation")
-    print(f"Generating grid for {len(coordinates)} atoms...")
-    
-    # Simple grid sizing parsing (e.g., 40x40x40 parsing stub or use spacing)
-    points, shape = make_bounding_box_grid(coordinates, margin=3.0, spacing=0.2)
-    try:
-        rho = compute_density(points, np.array(P_mu_nu))
-    except NotImplementedError as e:
-        utils.print_error(str(e))
-        return 1
-    
-    export_vtk(output, points, shape, rho, data_name="SCF_Density")
-    utils.print_success(f"Grid exported: {points.shape[0]} points captured in {output}")
+    With `promolecular` the density is the sum of tabulated spherical atomic
+    densities, which needs only the geometry (no basis or density matrix).
+    """
+    del filename
+    from .basis import BasisSet  # type: ignore
+    from .fchk import parse_fchk_arrays, parse_fchk_basis, parse_fchk_density  # type: ignore
+    from .grid import parse_grid_size  # type: ignore
+    from .density import SPIN_DENSITY_FIELDS, unpack_triangular  # type: ignore
+    from .export import export_vtk_unstructured  # type: ignore
+    from .parallel import evaluate_grid, resolve_workers  # type: ignore
+
+    if atomic_numbers is None:
+        atomic_numbers, _ = parse_fchk_arrays(lines)
+
+    if promolecular:
+        from .promolecular import compile_promolecule  # type: ignore
+
+        if spin:
+            utils.print_error("--spin needs the wavefunction and cannot be combined with --promolecular.")
+            return 1
+        basis = compile_promolecule(atomic_numbers, coordinates)
+        kernel, matrix, labels = "promolecular", np.zeros((0, 0)), ["Promolecular_Density"]
+        grid = parse_grid_size(grid_size, coordinates, margin=3.0)
+        utils.print_header("Promolecular Density Computation")
+        print(
+            f"Generating grid for {len(coordinates)} atoms (tabulated atomic densities, "
+            f"{resolve_workers(workers)} worker(s))..."
+        )
+    else:
+        density_data = parse_fchk_density(lines)
+        if not density_data or not density_data.get("total_scf_density"):
+            utils.print_error("Total SCF Density not found in FCHK (use --promolecular for a geometry-only density).")
+            return 1
+        if spin and not density_data.get("spin_scf_density"):
+            utils.print_error("Spin SCF Density not found in FCHK (closed-shell wavefunction?).")
+            return 1
+
+        basis_data = parse_fchk_basis(lines)
+        if not basis_data.get("shell_types"):
+            utils.print_error("Basis set information not found in FCHK (use --promolecular for a geometry-only density).")
+            return 1
+
+        basis = BasisSet.from_basis_data(basis_data, coordinates)
+        P_mu_nu = unpack_triangular(density_data["total_scf_density"], basis["n_basis"])
+        grid = parse_grid_size(grid_size, coordinates, margin=3.0)
+
+        utils.print_header("Electron Density Computation")
+        print(
+            f"Generating grid for {len(coordinates)} atoms ({basis['n_basis']} basis functions, "
+            f"{resolve_workers(workers)} worker(s))..."
+        )
+
+        if spin:
+            P_spin = unpack_triangular(density_data["spin_scf_density"], basis["n_basis"])
+            kernel, matrix = "spin_density", np.hstack([P_mu_nu, P_spin])
+            labels = ["SCF_Density", "Spin_Density", "Alpha_Density", "Beta_Density"]
+        else:
+            kernel, matrix, labels = "density", P_mu_nu, ["SCF_Density"]
+
+    def as_fields(values: np.ndarray) -> dict[str, np.ndarray]:
+        if kernel != "spin_density":
+            return {labels[0]: values}
+        return {label: values[:, SPIN_DENSITY_FIELDS.index(name)] for label, name in zip(labels, SPIN_DENSITY_FIELDS)}
+
+    dtype = np.dtype(precision)
+    iso_levels = parse_iso_levels(isosurface)
+    if iso_levels:
+        _check_surface_output(output)
+    encoding = resolve_encoding(output, encoding)
+    if adaptive:
+        if out_of_core or iso_levels or symmetry:
+            utils.print_error(
+                "--out-of-core, --isosurface and --symmetry apply to uniform grids and cannot be combined with --adaptive."
+            )
+            return 1
+        from .octree import build_octree, resample_octree  # type: ignore
+
+        tree = build_octree(
+            coordinates, lambda pts: evaluate_grid(pts.astype(dtype), basis, kernel, matrix, workers=workers), margin=3.0
+        )
+        print(f"Adaptive octree: {tree['n_evaluated']} points evaluated, {len(tree['cells'])} leaf cells.")
+        if to_uniform:
+            _write_fields(
+                output, grid, as_fields(resample_octree(tree, grid.points())), [], atomic_numbers, coordinates, encoding
+            )
+            utils.print_success(f"Octree resampled to {grid.n_points} uniform grid points in {output}")
+        else:
+            export_vtk_unstructured(output, tree["points"], tree["cells"], as_fields(tree["values"]))
+            utils.print_success(f"Octree exported: {tree['points'].shape[0]} vertices captured in {output}")
+        return 0
+
+    lattice = None
+    if symmetry:
+        from .symmetry import lattice_operations, point_group, symmetric_grid  # type: ignore
+
+        group = point_group(atomic_numbers, coordinates)
+        grid = symmetric_grid(grid, group["operations"], group["center"])
+        lattice = lattice_operations(grid, group["operations"], group["center"])
+        utils.print_key_value_rows(
+            [("Point group", f"{group['name']} ({group['order']} operations, {len(lattice)} mapping the grid onto itself)")]
+        )
+
+    plan = _report_grid_plan(grid, basis, kernel, matrix, dtype, workers, out_of_core, max_memory, encoding, lattice)
+    if estimate_only:
+        return 0
+    store = None
+    if _volume_format(output) == ".owv":
+        store = _create_store(output, grid, labels, dtype, encoding, atomic_numbers, coordinates)
+    _export_grid(
+        output,
+        grid,
+        basis,
+        kernel,
+        matrix,
+        lambda values: _write_fields(output, grid, as_fields(values), iso_levels, atomic_numbers, coordinates, encoding),
+        dtype,
+        workers,
+        out_of_core=out_of_core,
+        plan=plan,
+        store=store,
+        cache_dir=None if promolecular else basis_cache,
+        symmetry=lattice,
+    )
+    mode = "streamed out of core" if out_of_core else "exported"
+    utils.print_success(f"Grid {mode}: {grid.n_points} points captured in {output}")
     return 0
 
 
 def cmd_mo(
     filename: str,
-    index: int,
+    selection: str,
     output: str,
     lines: list[str],
     coordinates: list[tuple[float, float, float]],
+    beta: bool = False,
+    workers: int | None = 1,
+    precision: str = "float64",
+    out_of_core: bool = False,
+    grid_size: str | None = None,
+    max_memory: str | int | None = None,
+    estimate_only: bool = False,
+    isosurface: str | None = None,
+    encoding: str | None = None,
+    basis_cache: str | None = None,
 ) -> int:
-    """Evaluate a specific molecular orbital on a grid."""
-    del filename, index, output, lines, coordinates
-    utils.print_error(
-        "Molecular orbital grid evaluation is not implemented yet. "
-        "The 'mo' command is currently unavailable."
+    """Evaluate one or more molecular orbitals on a grid and export to VTK or as +/- lobe isosurfaces."""
+    del filename
+    from .basis import BasisSet  # type: ignore
+    from .fchk import parse_fchk_arrays, parse_fchk_basis, parse_fchk_mos, parse_fchk_scalars  # type: ignore
+    from .grid import parse_grid_size  # type: ignore
+    from .mo import mo_coefficient_matrix, mo_label, parse_mo_selection  # type: ignore
+
+    spin = "beta" if beta else "alpha"
+    mo_data = parse_fchk_mos(lines)
+    coeffs = mo_data.get(f"{spin}_coeffs")
+    if not coeffs:
+        utils.print_error(f"{spin.capitalize()} MO coefficients not found in FCHK.")
+        return 1
+
+    basis_data = parse_fchk_basis(lines)
+    if not basis_data.get("shell_types"):
+        utils.print_error("Basis set information not found in FCHK.")
+        return 1
+
+    scalars = parse_fchk_scalars(lines)
+    n_alpha = int(scalars.get("Number of alpha electrons", 0))
+    n_beta = int(scalars.get("Number of beta electrons", 0))
+    basis = BasisSet.from_basis_data(basis_data, coordinates)
+    C = mo_coefficient_matrix(coeffs, basis["n_basis"])
+    indices = parse_mo_selection(selection, n_alpha, n_beta, C.shape[1], spin=spin)
+    homo = (n_beta if beta else n_alpha) - 1
+
+    utils.print_header("Molecular Orbital Computation")
+    labels = [mo_label(i, homo) for i in indices]
+    print(f"Evaluating {len(indices)} {spin} orbital(s): {', '.join(labels)}")
+
+    grid = parse_grid_size(grid_size, coordinates, margin=3.0)
+    dtype = np.dtype(precision)
+    iso_levels = parse_iso_levels(isosurface)
+    if iso_levels:
+        _check_surface_output(output)
+    encoding = resolve_encoding(output, encoding)
+    plan = _report_grid_plan(grid, basis, "mo", C[:, indices], dtype, workers, out_of_core, max_memory, encoding)
+    if estimate_only:
+        return 0
+    atomic_numbers, _ = parse_fchk_arrays(lines)
+    store = None
+    if _volume_format(output) == ".owv":
+        store = _create_store(output, grid, labels, dtype, encoding, atomic_numbers, coordinates)
+    _export_grid(
+        output,
+        grid,
+        basis,
+        "mo",
+        C[:, indices],
+        lambda psi: _write_fields(
+            output,
+            grid,
+            {label: psi[:, k] for k, label in enumerate(labels)},
+            iso_levels,
+            atomic_numbers,
+            coordinates,
+            encoding,
+        ),
+        dtype,
+        workers,
+        out_of_core=out_of_core,
+        plan=plan,
+        store=store,
+        cache_dir=basis_cache,
     )
-    return 1
+    mode = "streamed out of core" if out_of_core else "exported"
+    utils.print_success(f"Grid {mode}: {grid.n_points} points x {len(indices)} orbital(s) captured in {output}")
+    return 0
 
 
-def cmd_graph(atomic_numbers: list[int], coordinates: list[tuple[float, float, float]]) -> int:
-    """Build and display molecular graph fragments."""
-    from .graph import build_graph  # type: ignore
+def _sample_fields(
+    lines: list[str],
+    coordinates: list[tuple[float, float, float]],
+    mo: str | None = None,
+    beta: bool = False,
+) -> tuple[Any, str, np.ndarray, list[str]]:
+    """
+    Basis, grid kernel, kernel matrix and field labels for the total
+    density (default) or the MOs selected by `mo`.
+    """
+    from .basis import BasisSet  # type: ignore
+    from .density import unpack_triangular  # type: ignore
+    from .fchk import parse_fchk_basis, parse_fchk_density, parse_fchk_mos, parse_fchk_scalars  # type: ignore
+    from .mo import mo_coefficient_matrix, mo_label, parse_mo_selection  # type: ignore
+
+    basis_data = parse_fchk_basis(lines)
+    if not basis_data.get("shell_types"):
+        raise ValueError("Basis set information not found in FCHK.")
+    basis = BasisSet.from_basis_data(basis_data, coordinates)
+    if mo is None:
+        density_data = parse_fchk_density(lines)
+        if not density_data or not density_data.get("total_scf_density"):
+            raise ValueError("Total SCF Density not found in FCHK.")
+        return basis, "density", unpack_triangular(density_data["total_scf_density"], basis["n_basis"]), ["SCF_Density"]
+
+    spin = "beta" if beta else "alpha"
+    coeffs = parse_fchk_mos(lines).get(f"{spin}_coeffs")
+    if not coeffs:
+        raise ValueError(f"{spin.capitalize()} MO coefficients not found in FCHK.")
+    scalars = parse_fchk_scalars(lines)
+    n_alpha = int(scalars.get("Number of alpha electrons", 0))
+    n_beta = int(scalars.get("Number of beta electrons", 0))
+    C = mo_coefficient_matrix(coeffs, basis["n_basis"])
+    indices = parse_mo_selection(mo, n_alpha, n_beta, C.shape[1], spin=spin)
+    homo = (n_beta if beta else n_alpha) - 1
+    return basis, "mo", C[:, indices], [mo_label(i, homo) for i in indices]
+
+
+def _atom_positions(atoms: str, count: int, coordinates: list[tuple[float, float, float]]) -> np.ndarray:
+    """Coordinates of `count` comma-separated 1-based atom indices."""
+    try:
+        indices = [int(item) for item in atoms.split(",")]
+    except ValueError:
+        raise ValueError(f"Invalid atom list '{atoms}' (use 1-based indices such as 1,2,3).") from None
+    if len(indices) != count:
+        raise ValueError(f"Expected {count} atom indices, got '{atoms}'.")
+    for index in indices:
+        if index < 1 or index > len(coordinates):
+            raise ValueError(f"Atom index out of range: {index} (valid range: 1..{len(coordinates)})")
+    return np.asarray([coordinates[index - 1] for index in indices], dtype=float)
+
+
+def _parse_vector(text: str, what: str) -> np.ndarray:
+    try:
+        vector = np.array([float(item) for item in text.split(",")])
+    except ValueError:
+        vector = np.empty(0)
+    if vector.shape != (3,):
+        raise ValueError(f"{what} must be three comma-separated numbers (got '{text}').")
+    return vector
+
+
+def _write_samples(
+    output: str,
+    grid: Any,
+    fields: dict[str, np.ndarray],
+    axes: dict[str, np.ndarray],
+    atomic_numbers: list[int],
+    coordinates: list[tuple[float, float, float]],
+) -> None:
+    """
+    Write plane or line samples.
+
+    `.npz` holds each field as an image-ready array (rows along v, columns
+    along u for planes) with the `axes` coordinates, origin and grid axes;
+    `.npy` holds a single field. CSV rows carry the `axes` coordinates
+    before x, y and z. Other suffixes go through the volume writers.
+    """
+    from .export import export_csv  # type: ignore
+
+    suffix = _volume_format(output)
+    shape = tuple(n for n in grid.shape if n > 1)
+    arrays = {name: np.asarray(values).reshape(shape).T for name, values in fields.items()}
+    if suffix == ".npz":
+        np.savez_compressed(output, **arrays, **axes, origin=grid.origin, axes=grid.vectors)
+    elif suffix == ".npy":
+        if len(arrays) != 1:
+            raise ValueError("A .npy file holds one field; use .npz for several.")
+        np.save(output, next(iter(arrays.values())))
+    elif suffix == ".csv":
+        columns = np.meshgrid(*axes.values(), indexing="ij")
+        export_csv(output, grid.points(), fields, extra_columns={name: c.ravel() for name, c in zip(axes, columns)})
+    else:
+        _write_fields(output, grid, fields, [], atomic_numbers, coordinates, resolve_encoding(output, None))
+
+
+def cmd_slice(
+    lines: list[str],
+    atomic_numbers: list[int],
+    coordinates: list[tuple[float, float, float]],
+    output: str,
+    atoms: str | None = None,
+    normal: str | None = None,
+    point: str | None = None,
+    spacing: float = 0.05,
+    margin: float = 2.0,
+    mo: str | None = None,
+    beta: bool = False,
+    workers: int | None = 1,
+) -> int:
+    """Evaluate the density or MOs on a plane only and export the 2-D map."""
+    from .grid import plane_grid  # type: ignore
+    from .parallel import evaluate_grid  # type: ignore
+
+    if atoms is not None:
+        a, b, c = _atom_positions(atoms, 3, coordinates)
+        plane_normal = np.cross(b - a, c - a)
+        if np.linalg.norm(plane_normal) < 1e-6 * max(np.linalg.norm(b - a) * np.linalg.norm(c - a), 1e-12):
+            raise ValueError(f"Atoms {atoms} are collinear and do not define a plane.")
+        grid = plane_grid((a + b + c) / 3.0, plane_normal, coordinates, spacing=spacing, margin=margin, in_plane=b - a)
+    elif normal is not None:
+        origin = _parse_vector(point, "Plane point") if point is not None else np.mean(coordinates, axis=0)
+        grid = plane_grid(origin, _parse_vector(normal, "Plane normal"), coordinates, spacing=spacing, margin=margin)
+    else:
+        raise ValueError("Define the plane with --atoms i,j,k or --normal nx,ny,nz [--point x,y,z].")
+
+    basis, kernel, matrix, labels = _sample_fields(lines, coordinates, mo=mo, beta=beta)
+    utils.print_header("Plane Slice")
+    nu, nv, _ = grid.shape
+    print(f"Evaluating {', '.join(labels)} on {nu}x{nv} plane points ({spacing:g} A spacing)...")
+    values = evaluate_grid(grid.points(), basis, kernel, matrix, workers=workers).reshape(grid.n_points, -1)
+    u = np.arange(nu) * grid.spacing[0]
+    v = np.arange(nv) * grid.spacing[1]
+    fields = {label: values[:, k] for k, label in enumerate(labels)}
+    _write_samples(output, grid, fields, {"u": u, "v": v}, atomic_numbers, coordinates)
+    utils.print_success(f"Plane exported: {grid.n_points} points x {len(labels)} field(s) captured in {output}")
+    return 0
+
+
+def cmd_profile(
+    lines: list[str],
+    atomic_numbers: list[int],
+    coordinates: list[tuple[float, float, float]],
+    output: str,
+    i: int,
+    j: int,
+    n_points: int = 200,
+    extend: float = 1.0,
+    mo: str | None = None,
+    beta: bool = False,
+) -> int:
+    """Evaluate the density or MOs along the line through atoms i and j and export the profile."""
+    from .grid import line_grid  # type: ignore
+    from .parallel import evaluate_grid  # type: ignore
+
+    a, b = _atom_positions(f"{i},{j}", 2, coordinates)
+    grid = line_grid(a, b, n_points=n_points, extend=extend)
+    basis, kernel, matrix, labels = _sample_fields(lines, coordinates, mo=mo, beta=beta)
+    values = evaluate_grid(grid.points(), basis, kernel, matrix).reshape(grid.n_points, -1)
+    s = np.arange(grid.n_points) * grid.spacing[0] - extend
+
+    utils.print_header("Line Profile")
+    length = float(np.linalg.norm(b - a))
+    rows = [("Line", f"atom {i} -> atom {j} ({length:.4f} A, {n_points} points, {extend:g} A beyond each end)")]
+    for k, label in enumerate(labels):
+        between = (s >= 0.0) & (s <= length)
+        lowest = int(np.argmin(np.where(between, np.abs(values[:, k]), np.inf)))
+        rows.append((label, f"min |value| between the atoms {abs(values[lowest, k]):.6e} at s = {s[lowest]:.4f} A"))
+    utils.print_key_value_rows(rows)
+    fields = {label: values[:, k] for k, label in enumerate(labels)}
+    _write_samples(output, grid, fields, {"s": s}, atomic_numbers, coordinates)
+    utils.print_success(f"Profile exported: {grid.n_points} points x {len(labels)} field(s) captured in {output}")
+    return 0
+
+
+def _open_volume(path: str) -> dict[str, Any]:
+    """
+    Grid, fields and atoms of a precomputed volume: an .owv store or a cube file.
+
+    `read(name, selection, out=None)` returns one field over a region as an
+    (nx, ny, nz) array; `rows` describe the source for `cmd_volume`. Cube
+    values are parsed into memory (`in_memory`); stores are decompressed
+    chunk by chunk into `out`, which may be a memory map of `dtype`.
+    """
+    from .estimate import format_bytes  # type: ignore
+    from .volume import VolumeStore, region_slices  # type: ignore
+
+    if Path(path).suffix.lower() != ".cube":
+        store = VolumeStore(path)
+        return {
+            "title": "Volume Store",
+            "grid": store.grid,
+            "fields": store.fields,
+            "read": store.read,
+            "in_memory": False,
+            "dtype": store.dtype,
+            "atomic_numbers": store.atomic_numbers,
+            "coordinates": store.coordinates,
+            "rows": [
+                ("Chunks", f"{'x'.join(str(c) for c in store.chunks)} points, {store.compression}, {store.dtype.name}"),
+                ("Stored size", format_bytes(store.stored_bytes())),
+            ],
+        }
+
+    from .cube import read_cube  # type: ignore
+
+    cube = read_cube(path)
+    grid, ids = cube["grid"], cube["value_ids"]
+    # openWFN cubes name their fields before ';' on the second comment line.
+    names = [name.strip() for name in cube["comments"][1].split(";")[0].split(",")] if ";" in cube["comments"][1] else []
+    if len(names) != len(ids) or len(set(names)) != len(names):
+        names = ["value"] if len(ids) == 1 else [f"value_{i}" for i in ids]
+    values = np.asarray(cube["values"]).reshape(grid.shape + (len(names),))
+    return {
+        "title": "Cube File",
+        "grid": grid,
+        "fields": names,
+        "read": lambda name, selection=None, out=None: values[region_slices(selection, grid.shape) + (names.index(name),)],
+        "in_memory": True,
+        "dtype": values.dtype,
+        "atomic_numbers": cube["atomic_numbers"],
+        "coordinates": cube["coordinates"],
+        "rows": [("Comment", cube["comments"][0].strip())],
+    }
+
+
+def cmd_volume(
+    path: str,
+    output: str | None = None,
+    region: str | None = None,
+    fields: str | None = None,
+    encoding: str | None = None,
+    resample: str | None = None,
+    method: str = "linear",
+    at_atoms: bool = False,
+) -> int:
+    """
+    Describe a precomputed volume (.owv store or cube file) and reuse it
+    without re-evaluating the wavefunction: interpolate values at the atoms,
+    export a region, or resample it onto a coarser or finer grid.
+
+    Store fields are decompressed into scratch memory maps beside the
+    output (removed afterwards), so only one chunk at a time is held in RAM.
+    """
+    import tempfile
+
+    from numpy.lib.format import open_memmap  # type: ignore
+
+    from .volume import parse_region, region_grid  # type: ignore
+
+    volume = _open_volume(path)
+    utils.print_header(volume["title"])
+    utils.print_key_value_rows(
+        [("Grid", str(volume["grid"])), ("Fields", ", ".join(volume["fields"]))] + volume["rows"]
+    )
+    if output is None and not at_atoms:
+        return 0
+
+    names = volume["fields"] if fields is None else [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in volume["fields"]]
+    if unknown:
+        raise ValueError(f"Unknown field(s) {', '.join(unknown)} (volume has {', '.join(volume['fields'])}).")
+    encoding = resolve_encoding(output, encoding) if output is not None else None
+    selection = parse_region(region)
+    grid = region_grid(volume["grid"], selection)
+    scratch_dir = None if output is None else Path(output).resolve().parent
+    with tempfile.TemporaryDirectory(prefix="openwfn-", dir=scratch_dir) as scratch:
+        values = {}
+        for i, name in enumerate(names):
+            out = None
+            if not volume["in_memory"]:
+                out = open_memmap(str(Path(scratch) / f"{i}.npy"), mode="w+", dtype=volume["dtype"], shape=grid.shape)
+            values[name] = volume["read"](name, selection, out=out)
+        _reuse_volume(volume, grid, values, output, encoding, resample, method, at_atoms)
+        del values
+    return 0
+
+
+def _reuse_volume(
+    volume: dict[str, Any],
+    grid: Any,
+    values: dict[str, np.ndarray],
+    output: str | None,
+    encoding: str | None,
+    resample: str | None,
+    method: str,
+    at_atoms: bool,
+) -> None:
+    """Interpolate, resample and export the fields read by `cmd_volume`."""
+    from .constants import Z_TO_SYMBOL  # type: ignore
+    from .grid import parse_resample_size  # type: ignore
+    from .interpolate import interpolate_grid, resample_grid  # type: ignore
+
+    names = list(values)
+    if at_atoms:
+        atomic_numbers, coordinates = volume["atomic_numbers"], volume["coordinates"]
+        if not atomic_numbers:
+            raise ValueError("The volume does not record atom positions.")
+        at = {name: interpolate_grid(v, grid, coordinates, method=method) for name, v in values.items()}
+        utils.print_header(f"Values at Atoms ({method})")
+        utils.print_key_value_rows(
+            [
+                (f"{Z_TO_SYMBOL.get(z, 'X')}{i + 1}", ", ".join(f"{name} {at[name][i]:.6e}" for name in names))
+                for i, z in enumerate(atomic_numbers)
+            ]
+        )
+    if output is None:
+        return
+
+    if resample is not None:
+        target = parse_resample_size(resample, grid)
+        values = {name: resample_grid(v, grid, target, method=method) for name, v in values.items()}
+        grid = target
+    flat = {name: np.asarray(v).reshape(-1) for name, v in values.items()}
+    _write_fields(output, grid, flat, [], volume["atomic_numbers"], volume["coordinates"], encoding)
+    what = f"resampled ({method}) to {grid}" if resample is not None else "exported"
+    utils.print_success(f"Volume {what}: {grid.n_points} points x {len(names)} field(s) captured in {output}")
+
+
+def cmd_integrate(
+    atomic_numbers: list[int],
+    coordinates: list[tuple[float, float, float]],
+    lines: list[str],
+    angular_degree: int = 29,
+    workers: int | None = 1,
+) -> int:
+    """
+    Integrate the SCF density on a Becke grid: electron count and atomic populations.
+
+    Atomic charges use the FCHK "Nuclear charges" (Z minus any ECP core
+    electrons) and fall back to Z when the array is absent.
+    """
+    from .basis import BasisSet  # type: ignore
+    from .constants import Z_TO_SYMBOL  # type: ignore
+    from .fchk import parse_fchk_basis, parse_fchk_density, parse_fchk_nuclear_charges, parse_fchk_scalars  # type: ignore
+    from .density import unpack_triangular  # type: ignore
+    from .integration import atomic_integrals, molecular_grid  # type: ignore
+    from .parallel import evaluate_grid  # type: ignore
+
+    density_data = parse_fchk_density(lines)
+    if not density_data or not density_data.get("total_scf_density"):
+        utils.print_error("Total SCF Density not found in FCHK.")
+        return 1
+    basis_data = parse_fchk_basis(lines)
+    if not basis_data.get("shell_types"):
+        utils.print_error("Basis set information not found in FCHK.")
+        return 1
+
+    basis = BasisSet.from_basis_data(basis_data, coordinates)
+    P_mu_nu = unpack_triangular(density_data["total_scf_density"], basis["n_basis"])
+    points, weights, owners = molecular_grid(atomic_numbers, coordinates, angular_degree=angular_degree)
+    rho = evaluate_grid(points, basis, "density", P_mu_nu, workers=workers)
+    populations = atomic_integrals(rho, weights, owners, len(atomic_numbers))
+    nuclear_charges = parse_fchk_nuclear_charges(lines)
+    if len(nuclear_charges) != len(atomic_numbers):
+        nuclear_charges = [float(z) for z in atomic_numbers]
+
+    utils.print_header("Density Integration (Becke partitioning)")
+    rows = [("Grid points", str(points.shape[0])), ("Integrated electrons", f"{populations.sum():.6f}")]
+    expected = parse_fchk_scalars(lines).get("Number of electrons")
+    if expected is not None:
+        rows.append(("Expected electrons", str(expected)))
+    utils.print_key_value_rows(rows)
+
+    print()
+    utils.print_table_header([("Atom", 6), ("Element", 8), ("Population", 12), ("Charge", 10)])
+    for i, (z, q, pop) in enumerate(zip(atomic_numbers, nuclear_charges, populations), start=1):
+        utils.print_table_row([
+            (str(i), 6),
+            (Z_TO_SYMBOL.get(z, f"Z{z}"), 8),
+            (f"{pop:.5f}", 12),
+            (f"{q - pop:+.5f}", 10),
+        ])
+    print()
+    return 0
+
+
+def cmd_graph(
+    atomic_numbers: list[int],
+    coordinates: list[tuple[float, float, float]],
+    charges: list[float] | None = None,
+) -> int:
+    """Build and display molecular graph fragments, collapsing identical ones."""
+    from .graph import build_graph, fragment_table, group_identical_fragments  # type: ignore
 
     bonds = detect_bonds(atomic_numbers, coordinates)
     g = build_graph(len(atomic_numbers), bonds)
     comps = g.connected_components()
-    
+    table = fragment_table(atomic_numbers, coordinates, comps, charges=charges or None)
+    groups = group_identical_fragments(table["formula"])
+
     utils.print_header("Molecular Topology & Fragments")
-    
-    for i, nodes in enumerate(comps, 1):
-        # Determine formula for this fragment
-        comp_atomic_nums = [atomic_numbers[n-1] for n in nodes]
-        formula = molecular_formula(comp_atomic_nums)
-        
-        print(f"Fragment {i}: {utils.highlight(formula)}")
-        print(f"  Atoms ({len(nodes)}): {', '.join(map(str, nodes))}")
+
+    for formula, members in groups:
+        if len(members) == 1:
+            nodes = comps[members[0]]
+            print(f"Fragment {members[0] + 1}: {utils.highlight(formula)}")
+            print(f"  Atoms ({len(nodes)}): {', '.join(map(str, nodes))}")
+        else:
+            first = comps[members[0]]
+            print(f"Fragments: {utils.highlight(f'{len(members)} × {formula}')}")
+            print(f"  Atoms per fragment ({len(first)}), first: {', '.join(map(str, first))}")
+
+    columns = [("Formula", 14), ("Count", 7), ("Mass (amu)", 11), ("Rg (Å)", 8)]
+    if "charge" in table:
+        columns.append(("Charge", 8))
+    print()
+    utils.print_table_header(columns)
+    for formula, members in groups:
+        row = [
+            (formula, 14),
+            (str(len(members)), 7),
+            (f"{table['mass'][members[0]]:.3f}", 11),
+            (f"{np.mean(table['radius_of_gyration'][members]):.3f}", 8),
+        ]
+        if "charge" in table:
+            row.append((f"{np.mean(table['charge'][members]):+.3f}", 8))
+        utils.print_table_row(row)
+    print(f"\nTotal: {utils.highlight(str(len(comps)))} fragments, {len(groups)} distinct.")
     print()
     return 0
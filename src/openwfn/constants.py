@@ -65,3 +65,108 @@ COVALENT_RADII = {
     "Tl": 1.45, "Pb": 1.46, "Bi": 1.48, "Po": 1.40, "At": 1.50, "Rn": 1.50, "Fr": 2.60, "Ra": 2.21,
     "Ac": 2.15, "Th": 2.06, "Pa": 2.00, "U": 1.96,  "Np": 1.90, "Pu": 1.87, "Am": 1.80, "Cm": 1.69
 }
+
+# Bragg-Slater radii in Angstroms (J. C. Slater, 1964), used to scale atom-centred
+# integration grids. Hydrogen uses 0.35 A as recommended by Becke (1988); elements
+# missing from Slater's table fall back to COVALENT_RADII.
+BRAGG_SLATER_RADII = {
+    "H": 0.35,  "Li": 1.45, "Be": 1.05, "B": 0.85,  "C": 0.70,  "N": 0.65,  "O": 0.60,  "F": 0.50,
+    "Na": 1.80, "Mg": 1.50, "Al": 1.25, "Si": 1.10, "P": 1.00,  "S": 1.00,  "Cl": 1.00, "K": 2.20,
+    "Ca": 1.80, "Sc": 1.60, "Ti": 1.40, "V": 1.35,  "Cr": 1.40, "Mn": 1.40, "Fe": 1.40, "Co": 1.35,
+    "Ni": 1.35, "Cu": 1.35, "Zn": 1.35, "Ga": 1.30, "Ge": 1.25, "As": 1.15, "Se": 1.15, "Br": 1.15
+}
+
+# Spherical free-atom densities for promolecular densities (see promolecular.py):
+# rho(r) = sum_i c_i * exp(-r / zeta_i) as (c_i [e/bohr^3], zeta_i [bohr]) pairs.
+# Least-squares fits (relative error where rho > 1e-7, electron count kept
+# exact) to spherically averaged LDA (Slater exchange, Latter tail) densities
+# of the ground-state configurations: rms error below 1% through Kr, 2% through
+# Xe and 4% through Rn. Hydrogen is the exact 1s density.
+PROMOLECULAR_DENSITY = {
+    "H": ((0.3183099, 0.5),),
+    "He": ((1.702694, 0.1873748), (0.6812319, 0.3277435), (0.670741, 0.4045027)),
+    "Li": ((6.520613, 0.1342913), (6.843601, 0.2091466), (0.2946128, 0.5561464), (-0.5847979, 0.7186921), (0.3134526, 0.871354)),
+    "Be": ((7.969854, 0.08274844), (26.79422, 0.1413017), (-0.808954, 0.6244514), (0.7021414, 0.7325566)),
+    "B": ((19.86535, 0.07204577), (52.69121, 0.1155598), (-2.241036, 0.2563146), (0.4870254, 0.5729357), (0.08155069, 0.8840469)),
+    "C": ((60.38597, 0.06735501), (83.35117, 0.1093955), (-18.89331, 0.1608396), (1.322122, 0.4460191), (0.1729509, 0.7482751)),
+    "N": ((70.99992, 0.0522148), (179.818, 0.09086452), (-48.41293, 0.126636), (2.843605, 0.377207), (0.2876697, 0.6505759)),
+    "O": ((307.4125, 0.06599465), (-22.09677, 0.1710292), (10.74914, 0.251601), (1.540657, 0.3950929), (0.3734895, 0.5837014)),
+    "F": ((446.373, 0.05833524), (-34.73852, 0.1492632), (17.49366, 0.2286547), (2.082774, 0.3670117), (0.4934717, 0.5286698)),
+    "Ne": ((622.1996, 0.05225139), (-50.94601, 0.1310224), (25.78663, 0.2108283), (2.758105, 0.3427683), (0.6241584, 0.4845195)),
+    "Na": ((863.6078, 0.04810278), (-83.03035, 0.09549427), (26.47946, 0.2358778), (0.5497602, 0.5218896), (-0.6560838, 0.7860995), (0.410793, 0.9073908)),
+    "Mg": ((1124.001, 0.04362347), (-106.7273, 0.09651498), (47.1611, 0.2026874), (0.5141094, 0.5302768), (-1.196606, 0.6884464), (0.737756, 0.8162317)),
+    "Al": ((1449.264, 0.04024382), (-156.004, 0.09143903), (76.33178, 0.1803971), (-3.302439, 0.4229723), (1.910369, 0.5047613), (0.07666618, 1.085881)),
+    "Si": ((1846.323, 0.03748248), (-221.0894, 0.08213831), (108.5015, 0.1720639), (-14.15767, 0.3084566), (4.842903, 0.3999538), (0.1685876, 0.9292531)),
+    "P": ((2279.029, 0.03476641), (-299.6087, 0.08236493), (179.0995, 0.1514383), (-21.34153, 0.2702913), (5.530739, 0.3817874), (0.306992, 0.8049173)),
+    "S": ((2787.453, 0.03257955), (-427.7862, 0.08044239), (290.2454, 0.1363607), (-36.99786, 0.2256668), (5.003467, 0.3807143), (0.4858449, 0.7129541)),
+    "Cl": ((3378.06, 0.03080438), (-617.9128, 0.07703983), (452.0293, 0.1243581), (-67.05497, 0.1950522), (6.049223, 0.3681541), (0.7034863, 0.6425394)),
+    "Ar": ((4063.146, 0.02935188), (-883.5013, 0.0726566), (665.502, 0.114066), (-108.5819, 0.1745445), (8.130581, 0.3497086), (0.9629898, 0.5865269)),
+    "K": ((4898.2, 0.02810753), (-1138.383, 0.06484801), (743.4593, 0.105705), (-102.1468, 0.1838485), (17.26861, 0.3298907), (0.8942382, 0.7095883), (-1.073573, 0.8908626), (0.4837509, 1.033415)),
+    "Ca": ((5797.755, 0.02685072), (-1477.862, 0.06121468), (983.1168, 0.09955302), (-163.7057, 0.1722215), (33.10146, 0.2871613), (1.108101, 0.6511453), (-1.796585, 0.8088674), (0.8971964, 0.9419309)),
+    "Sc": ((6777.144, 0.02564959), (-1874.23, 0.0586637), (1319.863, 0.09438586), (-272.7539, 0.1572979), (56.85765, 0.2433718), (4.301882, 0.4645497), (-2.347232, 0.5615665), (0.207864, 1.013079)),
+    "Ti": ((7960.95, 0.02475229), (-2424.344, 0.05459314), (1620.373, 0.08760998), (-304.5641, 0.1478875), (61.07957, 0.2432659), (1.055723, 0.5232348), (-1.004526, 0.6995428), (0.4942339, 0.8979935)),
+    "V": ((9265.856, 0.02387324), (-3052.741, 0.0513945), (1996.699, 0.08219912), (-371.0398, 0.1383005), (71.78437, 0.2318662), (1.077671, 0.5151025), (-1.187113, 0.7082555), (0.7607895, 0.8429379)),
+    "Cr": ((10744.5, 0.02306308), (-3768.003, 0.04816859), (2357.537, 0.07711174), (-409.0636, 0.1302986), (74.77182, 0.2263054), (0.9193812, 0.4020479), (0.2187156, 0.8440493), (0.00614454, 1.187897)),
+    "Mn": ((12335.83, 0.0222667), (-4575.687, 0.04587158), (2864.634, 0.07337208), (-531.4474, 0.1232221), (101.2191, 0.2099364), (1.667894, 0.4417201), (-1.104262, 0.6863003), (0.8823345, 0.7927948)),
+    "Fe": ((14120.12, 0.02153438), (-5486.093, 0.04349316), (3360.904, 0.06967936), (-625.4396, 0.1171143), (120.1498, 0.1999974), (2.243084, 0.4073576), (-1.031206, 0.6783237), (0.9053997, 0.7750678)),
+    "Co": ((16086.95, 0.02084912), (-6514.092, 0.04132857), (3905.576, 0.0663361), (-728.5247, 0.1116001), (141.2311, 0.1911092), (2.975849, 0.3812313), (-0.9731435, 0.6703794), (0.9205997, 0.7595434)),
+    "Ni": ((18249.85, 0.02020677), (-7672.7, 0.03935287), (4503.545, 0.06328225), (-840.5918, 0.1065407), (163.9928, 0.1832814), (3.810071, 0.3611285), (-0.9568903, 0.6649599), (0.966041, 0.7444763)),
+    "Cu": ((20701.25, 0.01963374), (-9055.244, 0.03734856), (5114.357, 0.06013763), (-902.087, 0.1012095), (165.8549, 0.1816199), (3.708437, 0.3541224), (0.3049256, 0.6830186), (0.05709072, 0.8606255)),
+    "Zn": ((23208.79, 0.01903471), (-10414.96, 0.03588236), (5864.965, 0.05792052), (-1093.987, 0.09765526), (216.0853, 0.1698612), (5.757348, 0.331702), (-0.8887471, 0.6504807), (0.9909225, 0.7197232)),
+    "Ga": ((25959.15, 0.0184656), (-11862.04, 0.03439297), (6563.406, 0.05582392), (-1257.663, 0.09512941), (271.7284, 0.1631355), (3.954232, 0.327915), (0.7110641, 0.726623), (-0.5477219, 0.875606), (0.268343, 1.001101)),
+    "Ge": ((29084.73, 0.01799765), (-13848.15, 0.03306936), (7599.431, 0.0536096), (-1473.725, 0.09059722), (306.7726, 0.1600042), (1.332171, 0.5218683), (-0.4768282, 0.8279731), (0.4893782, 0.8978163)),
+    "As": ((31272.46, 0.01721798), (-13994.67, 0.03235492), (8084.447, 0.05352195), (-2036.193, 0.0921092), (597.5556, 0.1406704), (2.206086, 0.5384487), (-1.019933, 0.6352653), (0.4222448, 0.8200367)),
+    "Se": ((36038.56, 0.01707695), (-18094.15, 0.03062222), (9646.649, 0.04988554), (-1938.897, 0.08535562), (458.9692, 0.1528629), (-34.59603, 0.2616925), (10.53394, 0.3558608), (0.4826831, 0.7540682)),
+    "Br": ((39459.71, 0.01658666), (-20014.57, 0.02979523), (10896.59, 0.0486672), (-2408.766, 0.08334159), (632.7296, 0.1442724), (-53.74944, 0.2316014), (8.742717, 0.3620725), (0.7165374, 0.6876252)),
+    "Kr": ((43100.06, 0.01614127), (-22277.39, 0.02909989), (12522.17, 0.04748071), (-3043.766, 0.08079842), (858.1719, 0.1366972), (-87.61796, 0.2106189), (9.517409, 0.3581866), (0.9968618, 0.6343284)),
+    "Rb": ((48154.9, 0.01589169), (-26552.18, 0.02815167), (14836.82, 0.04559882), (-3623.472, 0.07678084), (960.155, 0.1315176), (-92.38134, 0.221726), (16.94184, 0.3616103), (1.121053, 0.7615542), (-1.320617, 0.9376084), (0.581199, 1.073932)),
+    "Sr": ((52840.45, 0.01554886), (-30086.46, 0.02743278), (17081.47, 0.04433759), (-4424.323, 0.07437782), (1237.109, 0.1262587), (-155.8685, 0.2093714), (32.17111, 0.3227078), (1.456182, 0.7054933), (-2.209335, 0.8601519), (1.054656, 0.9889943)),
+    "Y": ((57636.21, 0.01522967), (-34084.08, 0.02692119), (20107.01, 0.04325778), (-5678.402, 0.07186533), (1678.063, 0.1191352), (-226.3336, 0.1876278), (32.97659, 0.3169484), (-0.676148, 0.8555928), (0.5320926, 0.9843043), (0.006039107, 1.407659)),
+    "Zr": ((63563.89, 0.01497034), (-39115.01, 0.02614562), (23022.86, 0.04192525), (-6668.669, 0.06945857), (2015.302, 0.1152), (-327.1509, 0.1841654), (68.03573, 0.2714494), (1.726126, 0.5679937), (-1.382921, 0.6836998), (0.3754726, 0.9700521)),
+    "Nb": ((10068.85, 0.007316402), (77102.01, 0.01641231), (-60374.63, 0.02447251), (27690.67, 0.04015464), (-7901.159, 0.06654105), (2357.475, 0.1099982), (-366.6262, 0.175815), (70.06056, 0.2614479), (2.988873, 0.4820439), (-1.137613, 0.560838), (0.1479367, 1.057825)),
+    "Mo": ((10372.97, 0.006900309), (86678.48, 0.01611187), (-69829.26, 0.02381792), (32067.8, 0.03883111), (-9265.277, 0.06402026), (2744.602, 0.1055508), (-420.0544, 0.1693522), (77.8528, 0.2573015), (1.714955, 0.5199437), (-0.5560203, 0.6758892), (0.2449555, 0.9639498)),
+    "Tc": ((10798.41, 0.006546128), (96842.79, 0.01583225), (-80196.69, 0.02323214), (37066.42, 0.03767164), (-10974.57, 0.06182758), (3298.616, 0.1014883), (-539.4264, 0.1620928), (103.0009, 0.2436329), (1.960021, 0.5285897), (-1.427283, 0.7014174), (0.8686653, 0.8340913)),
+    "Ru": ((10848.57, 0.00612721), (108361.3, 0.01551032), (-91549.63, 0.02258745), (42147.66, 0.03643924), (-12487.8, 0.05959118), (3699.776, 0.09773363), (-573.5406, 0.1567968), (100.2292, 0.2419289), (2.243511, 0.4729804), (-0.6231002, 0.7638455), (0.6060748, 0.8561263)),
+    "Rh": ((11000.17, 0.005757575), (120605.5, 0.01521037), (-103962.7, 0.02200342), (47878.25, 0.03533236), (-14316.91, 0.05760251), (4247.919, 0.09429164), (-664.4653, 0.1513199), (113.5121, 0.2351599), (2.676151, 0.457535), (-0.6488314, 0.7613144), (0.6672276, 0.8367972)),
+    "Pd": ((11084.66, 0.005412978), (133492.6, 0.01490287), (-116927.1, 0.02143259), (53782.47, 0.03428435), (-16169.55, 0.05575908), (4796.714, 0.0912218), (-756.1001, 0.146701), (127.3939, 0.2274915), (3.913549, 0.3977546), (0.400265, 0.6061543), (0.1040299, 0.9325666)),
+    "Ag": ((11185.56, 0.005071911), (147925.4, 0.01462401), (-132018.4, 0.02090316), (60812.27, 0.03329461), (-18474.98, 0.05399423), (5507.81, 0.08813325), (-883.117, 0.1415574), (146.7813, 0.2222338), (3.737786, 0.4283798), (-0.5410662, 0.7593523), (0.6193156, 0.8205127)),
+    "Cd": ((152279.3, 0.01369307), (-129728.5, 0.02054352), (66033.97, 0.03252252), (-20861.87, 0.05251634), (6367.112, 0.0854797), (-1094.352, 0.1369278), (193.6986, 0.2101482), (4.787406, 0.4101124), (-1.055666, 0.6899873), (0.9516212, 0.7763932)),
+    "In": ((168368.9, 0.01351877), (-146953.4, 0.02002813), (73916.6, 0.03166154), (-23606.47, 0.0510631), (7313.621, 0.08309084), (-1346.314, 0.1331045), (257.3021, 0.2012377), (4.452695, 0.450307), (-2.040563, 0.5719673), (1.318923, 0.7320457), (-0.6470927, 0.9075268), (0.298373, 1.039532)),
+    "Sn": ((186455.4, 0.01334313), (-166513.7, 0.019512), (82496.79, 0.03078432), (-26405.56, 0.04958371), (8190.922, 0.08071829), (-1524.652, 0.1299578), (306.083, 0.2029403), (-20.84773, 0.2957518), (7.492937, 0.374488), (0.9200906, 0.7183225), (-1.057518, 0.8351389), (0.6063793, 0.9357337)),
+    "Sb": ((205934.9, 0.01317218), (-188064.7, 0.01904438), (92255.51, 0.02997559), (-29752.63, 0.04820679), (9307.478, 0.07841981), (-1796.239, 0.1264266), (377.8561, 0.1988341), (-32.96564, 0.295348), (8.217981, 0.3890952), (0.7666051, 0.6569577), (-0.9977809, 0.7631745), (0.7465155, 0.8559275)),
+    "Te": ((225395.3, 0.01298726), (-209560.8, 0.01862361), (102351.6, 0.02925713), (-33375.57, 0.04701634), (10625.02, 0.0765144), (-2206.579, 0.1235762), (530.4238, 0.1938773), (-87.361, 0.2811328), (24.51077, 0.3498403), (0.4923077, 0.8137239)),
+    "I": ((249407.5, 0.01283922), (-237616.3, 0.01821854), (115623.9, 0.02852081), (-38227.35, 0.04571032), (12324.95, 0.07412519), (-2652.38, 0.1191685), (642.181, 0.1867367), (-101.5013, 0.2746934), (24.74876, 0.3509717), (0.7362887, 0.7475435)),
+    "Xe": ((275917.1, 0.01269386), (-269222.4, 0.01783451), (130763.9, 0.02781304), (-43846.16, 0.04444941), (14321.95, 0.0718148), (-3199.686, 0.1149152), (788.6569, 0.1794423), (-124.5206, 0.2654885), (26.71651, 0.3480593), (1.037761, 0.6937241)),
+    "Cs": ((305122.6, 0.01253048), (-304001.3, 0.01743281), (146871.6, 0.02707249), (-49436.25, 0.04314105), (16117.03, 0.06952416), (-3585.171, 0.1112495), (865.389, 0.175655), (-129.9772, 0.2697858), (25.85157, 0.3828443), (1.476164, 0.8377354), (-1.679263, 1.007951), (0.6894626, 1.145782)),
+    "Ba": ((336082.1, 0.01238055), (-341985, 0.01708971), (165639.6, 0.02643614), (-56615.41, 0.04201343), (18765.23, 0.06748241), (-4392.609, 0.1074962), (1122.65, 0.1684738), (-198.596, 0.2557403), (42.58849, 0.3559821), (2.025484, 0.7887608), (-2.962416, 0.9340848), (1.329624, 1.05872)),
+    "La": ((370552.2, 0.01222859), (-384937.5, 0.01674995), (186961, 0.02579826), (-64758.55, 0.04087257), (21733.2, 0.06539371), (-5265.026, 0.1036407), (1380.554, 0.1612968), (-255.0778, 0.2429797), (54.15444, 0.3385024), (1.341802, 0.7432272), (-2.067406, 0.890443), (0.9789598, 1.029663)),
+    "Ce": ((400227.3, 0.01202456), (-419432.7, 0.01639367), (203109.8, 0.0251871), (-70287.72, 0.03984557), (23540.41, 0.06371122), (-5696.706, 0.1009695), (1488.504, 0.1572415), (-272.1939, 0.2370701), (58.22755, 0.3310817), (1.293368, 0.728667), (-1.931394, 0.8783874), (0.9085647, 1.022851)),
+    "Pr": ((410397.6, 0.01176158), (-424800, 0.01610757), (205440.2, 0.02483714), (-70967.6, 0.03949038), (24264.8, 0.06374501), (-6455.417, 0.1023597), (2141.608, 0.1591046), (-707.2795, 0.2277727), (217.1447, 0.2825442), (0.4916077, 1.734479), (-0.7179517, 1.835779), (0.2802764, 1.933867)),
+    "Nd": ((464306.5, 0.01163675), (-494967.4, 0.0157377), (239231.3, 0.02405955), (-83068.02, 0.03794202), (27961.81, 0.06045537), (-6885.138, 0.09517091), (1797.872, 0.1451085), (-252.659, 0.2012834), (17.04695, 0.4043273), (-2.101097, 0.9100149), (1.681856, 0.9756036), (0.000549931, 2.55239)),
+    "Pm": ((493406.2, 0.011424), (-527099.3, 0.01541359), (253619.4, 0.02353306), (-87469.61, 0.03709875), (29220.44, 0.05917631), (-7069.194, 0.09348321), (1812.449, 0.143851), (-250.8068, 0.2042838), (22.28008, 0.3792457), (-1.4844, 0.9367684), (1.2108, 1.009348), (0.000423055, 2.339607)),
+    "Sm": ((524924, 0.01122512), (-562718.7, 0.01510822), (270008.3, 0.02303187), (-92783.78, 0.03628433), (30877.24, 0.05789281), (-7409.199, 0.09159588), (1880.402, 0.1415015), (-254.6844, 0.2028755), (25.35132, 0.3672118), (-1.221156, 0.9440874), (0.9961202, 1.02399), (0.0002454022, 2.237456)),
+    "Eu": ((558094.1, 0.01103568), (-600589, 0.01481833), (287651.7, 0.02255539), (-98650.54, 0.03550679), (32777.1, 0.05664882), (-7847.24, 0.08968369), (1984.029, 0.1387053), (-262.8173, 0.1989089), (26.60691, 0.361017), (-1.160587, 0.9440007), (0.9520375, 1.024971), (8.958182e-05, 2.29667)),
+    "Gd": ((591318.2, 0.01085051), (-638203.4, 0.01454293), (305188.8, 0.02211139), (-104455.5, 0.03480076), (34662.6, 0.05559299), (-8306.346, 0.0883952), (2141.733, 0.1385116), (-368.825, 0.2093136), (85.02354, 0.2915663), (2.553934, 0.6142495), (-2.001566, 0.7110872), (0.2940502, 1.059878)),
+    "Tb": ((621909, 0.01066169), (-671019.8, 0.01427425), (319739.2, 0.02168986), (-108837.8, 0.03413833), (35987.35, 0.05459109), (-8575.402, 0.08696884), (2213.999, 0.136419), (-382.8118, 0.204802), (90.71484, 0.2783339), (6.623634, 0.568816), (-4.314298, 0.6436887), (0.2086574, 1.104203)),
+    "Dy": ((657109.9, 0.01048486), (-710543.6, 0.01401308), (337834.6, 0.02126754), (-114618.6, 0.03345504), (37778.61, 0.05351035), (-8936.443, 0.08536279), (2287.146, 0.1343975), (-385.3364, 0.2030609), (93.30536, 0.278291), (5.335969, 0.5864743), (-3.667175, 0.6655859), (0.2399572, 1.082356)),
+    "Ho": ((693781.4, 0.01031377), (-751867.6, 0.01376093), (356784.6, 0.02085936), (-120684.5, 0.03279203), (39657.78, 0.05245006), (-9307.565, 0.08374648), (2352.124, 0.1322629), (-377.2767, 0.2011744), (91.71166, 0.2791315), (4.194648, 0.5985322), (-2.983217, 0.6861923), (0.2695259, 1.064599)),
+    "Er": ((731602, 0.01014948), (-794620.6, 0.01352067), (376533.9, 0.02047209), (-127112.1, 0.03216477), (41715.87, 0.05144689), (-9766.656, 0.08220006), (2458.658, 0.130048), (-385.53, 0.1982559), (94.82004, 0.275737), (4.176902, 0.5961531), (-2.98842, 0.6832795), (0.2762873, 1.055877)),
+    "Tm": ((770468.3, 0.009990195), (-838543.4, 0.01328958), (396857.3, 0.02010111), (-133748.3, 0.03156528), (43862.06, 0.05048912), (-10262.09, 0.08072116), (2581.546, 0.1278867), (-399.7667, 0.1951326), (99.79648, 0.2710903), (4.49775, 0.5881056), (-3.191108, 0.6715896), (0.271049, 1.051595)),
+    "Yb": ((810423.9, 0.009836056), (-883711.2, 0.01306735), (417789.6, 0.01974568), (-140610.9, 0.03099227), (46106.99, 0.049575), (-10801.02, 0.07930808), (2724.877, 0.1257721), (-421.8804, 0.1917586), (107.2338, 0.2651019), (5.221146, 0.5743984), (-3.632175, 0.6518364), (0.2562295, 1.05111)),
+    "Lu": ((856267.7, 0.009689434), (-939176.2, 0.01285188), (443572.4, 0.01934947), (-148201.1, 0.03046615), (49255.83, 0.04849952), (-11405.26, 0.0776404), (2830.804, 0.1233607), (-395.1305, 0.1906279), (96.5049, 0.276446), (-1.101984, 0.7200946), (0.8628935, 0.8426595), (0.007356471, 1.271373)),
+    "Hf": ((906509.6, 0.009560614), (-998860, 0.01265458), (474243.3, 0.0190637), (-161031.6, 0.02986013), (53428.8, 0.04766639), (-12931.72, 0.07604148), (3358.564, 0.1199184), (-544.0833, 0.1813134), (137.5711, 0.2503294), (4.456491, 0.5227945), (-3.041405, 0.5891157), (0.280943, 0.9944567)),
+    "Ta": ((958226, 0.009425874), (-1062293, 0.01245474), (505360.7, 0.01871405), (-171673.6, 0.02932023), (57419.16, 0.04668081), (-13952, 0.07442708), (3623.353, 0.1172854), (-568.8482, 0.177788), (140.5791, 0.2482577), (1.397612, 0.5069847), (-1.038249, 0.7625625), (0.797619, 0.8883167)),
+    "W": ((1012845, 0.009295141), (-1127727, 0.01225607), (537744.2, 0.01840288), (-184060.6, 0.02874625), (61501.24, 0.04578517), (-15152.47, 0.07284927), (3942.863, 0.1147502), (-613.9101, 0.1740583), (149.0918, 0.2436698), (1.77191, 0.5513253), (-1.57369, 0.7250852), (0.9928125, 0.8496143)),
+    "Re": ((1069722, 0.009167294), (-1197077, 0.01206461), (572046, 0.01808743), (-196697.6, 0.02821716), (66018.72, 0.04488866), (-16427.14, 0.07133617), (4288.141, 0.1123244), (-660.6206, 0.1705441), (155.9642, 0.2396569), (2.471882, 0.5515462), (-1.812129, 0.6830488), (0.8594852, 0.8370381)),
+    "Os": ((1129208, 0.009042588), (-1269774, 0.01187798), (608251.1, 0.01778383), (-210277.5, 0.02769552), (70791.02, 0.04402666), (-17809.38, 0.06988345), (4669.464, 0.1100269), (-716.0792, 0.1672713), (163.9566, 0.2359039), (2.742007, 0.5233422), (-1.523492, 0.6729492), (0.794744, 0.8275657)),
+    "Ir": ((1190312, 0.00891996), (-1346105, 0.01169928), (646691.8, 0.01747644), (-224074, 0.02721128), (76005.98, 0.04316761), (-19261.36, 0.0684922), (5077.13, 0.1078355), (-773.1566, 0.1643079), (170.5767, 0.2334132), (3.199072, 0.5116272), (-1.508154, 0.6553978), (0.7275878, 0.8207842)),
+    "Pt": ((1252194, 0.008797582), (-1420955, 0.01151902), (683587.3, 0.01719011), (-237898, 0.02672007), (80783.32, 0.04237097), (-20572.03, 0.06718315), (5392.307, 0.1059832), (-785.2228, 0.162431), (160.667, 0.2349317), (3.302062, 0.4665562), (-0.4305082, 0.718587), (0.4472512, 0.8438841)),
+    "Au": ((1315510, 0.008678992), (-1505535, 0.01135956), (727936.5, 0.01686859), (-251865.4, 0.02632203), (87261.05, 0.04150579), (-22229.24, 0.06590884), (5901.076, 0.1038877), (-867.0465, 0.1595254), (172.1874, 0.232254), (3.669403, 0.4580797), (-0.3580148, 0.7174448), (0.4046849, 0.8403193)),
+    "Hg": ((1392028, 0.008569546), (-1596316, 0.01118145), (774012, 0.01664101), (-273194.4, 0.02575897), (93449.2, 0.04080625), (-24572.85, 0.06452136), (6609.95, 0.1016408), (-1032.549, 0.1557139), (209.5321, 0.2245707), (4.418381, 0.4596874), (-1.123316, 0.6542607), (0.7132059, 0.7975768)),
+    "Tl": ((1465239, 0.008459893), (-1690365, 0.01102317), (822142.5, 0.01636624), (-291022.8, 0.02535531), (100877.1, 0.04005664), (-26863.84, 0.06336323), (7402.097, 0.09987554), (-1271.9, 0.1534061), (282.0249, 0.2170301), (2.504217, 0.4985596), (0.07520409, 1.148977)),
+    "Pb": ((1546354, 0.008352211), (-1802601, 0.01087114), (879243.9, 0.0160428), (-309249.3, 0.02502905), (111095.1, 0.03914759), (-29568.4, 0.06200298), (8311.207, 0.09730554), (-1437.3, 0.1485975), (298.3274, 0.214638), (1.731358, 0.5676451), (-0.4142993, 0.8357495), (0.3249101, 0.9876211)),
+    "Bi": ((1626276, 0.008250657), (-1898076, 0.01071677), (931594.1, 0.01586188), (-334733.3, 0.02451699), (118015.7, 0.03865228), (-32734.22, 0.0610569), (9511.69, 0.09617184), (-1923.514, 0.1477132), (536.8378, 0.2157684), (-119.8069, 0.2913274), (39.50232, 0.3468191), (0.294316, 0.9299086)),
+    "Po": ((1715904, 0.008146903), (-2015407, 0.01056272), (993930.8, 0.01560447), (-359819.4, 0.02408137), (127839, 0.03790174), (-36034.89, 0.05976429), (10626.45, 0.09395533), (-2216.757, 0.1442373), (622.2307, 0.2117903), (-134.3124, 0.2891537), (39.40514, 0.3472692), (0.4833007, 0.8470053)),
+    "At": ((1810875, 0.008043812), (-2140693, 0.01040983), (1061036, 0.01534862), (-387092.6, 0.02364695), (138608.1, 0.03714958), (-39694.98, 0.05845855), (11871.93, 0.0916878), (-2548.138, 0.1405985), (721.0198, 0.2073665), (-153.4138, 0.2866487), (40.73802, 0.3487808), (0.7272882, 0.7814696)),
+    "Rn": ((1911626, 0.007941847), (-2274778, 0.01025825), (1133420, 0.01509421), (-416811.3, 0.0232135), (150456.1, 0.03639584), (-43781.91, 0.05714103), (13283, 0.08936991), (-2934.472, 0.1367547), (839.7833, 0.2021176), (-178.1585, 0.2821448), (43.72125, 0.3481529), (1.02729, 0.7283175)),
+}
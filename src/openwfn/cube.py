@@ -0,0 +1,105 @@
+# src/openwfn/cube.py
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np  # type: ignore
+
+from .constants import BOHR_TO_ANGSTROM  # type: ignore
+from .grid import RegularGrid  # type: ignore
+
+# Values parsed per read when loading cube data.
+_READ_CHUNK = 1 << 20
+
+
+def read_cube(filename: str | Path, out: np.ndarray | None = None) -> dict[str, Any]:
+    """
+    Read a Gaussian cube file.
+
+    Values are parsed straight from the file in large chunks by NumPy's text
+    reader (no per-value Python strings) and written into `out` when given,
+    so big cubes can be loaded into a memory map (see
+    `numpy.lib.format.open_memmap`).
+
+    Args:
+        filename: Path to a .cube file (Bohr or, with negative voxel
+            counts, Angstrom lengths).
+        out: Optional (N,) or (N, n_values) destination array.
+
+    Returns:
+        Dictionary with `comments`, `grid` (a `RegularGrid` in Angstroms),
+        `atomic_numbers`, `coordinates` (Angstroms), `value_ids` (MO numbers
+        or 1..n for multi-value cubes) and `values`, shaped (N,) for one value
+        per point and (N, n_values) otherwise.
+
+    Raises:
+        ValueError: If the header is malformed, the voxel axes are not
+            orthogonal, or the file holds fewer values than the grid needs.
+    """
+    with open(filename, "r") as f:
+        comments = (f.readline().rstrip("\n"), f.readline().rstrip("\n"))
+        try:
+            fields = f.readline().split()
+            n_atoms = int(fields[0])
+            origin = np.array([float(v) for v in fields[1:4]])
+            n_values = int(fields[4]) if len(fields) > 4 else 1
+            shape, vectors = [], []
+            for _ in range(3):
+                fields = f.readline().split()
+                shape.append(int(fields[0]))
+                vectors.append([float(v) for v in fields[1:4]])
+            atoms = [f.readline().split() for _ in range(abs(n_atoms))]
+            atomic_numbers = [int(a[0]) for a in atoms]
+            positions = np.array([[float(v) for v in a[2:5]] for a in atoms]).reshape(-1, 3)
+            value_ids = list(range(1, n_values + 1))
+            if n_atoms < 0:
+                # Orbital cubes list the number of values and their MO numbers.
+                ids = [int(v) for v in f.readline().split()]
+                n_values, value_ids = ids[0], ids[1:ids[0] + 1]
+        except (IndexError, ValueError):
+            raise ValueError(f"Malformed cube header in {filename}.") from None
+
+        # Negative voxel counts mark lengths in Angstroms.
+        scale = BOHR_TO_ANGSTROM if shape[0] > 0 else 1.0
+        shape = [abs(n) for n in shape]
+        vectors = np.asarray(vectors) * scale
+        spacing = np.linalg.norm(vectors, axis=1)
+        if np.any(spacing <= 0.0):
+            raise ValueError(f"Cube file {filename} has a zero-length voxel axis.")
+        axes = vectors / spacing[:, None]
+        if not np.allclose(axes @ axes.T, np.eye(3), atol=1e-4):
+            raise ValueError(f"Cube file {filename} has non-orthogonal voxel axes.")
+        # Snap axes rounded to six decimals back onto an orthonormal frame.
+        u, _, vt = np.linalg.svd(axes)
+        grid = RegularGrid(origin * scale, spacing, tuple(shape), axes=u @ vt)
+
+        total = grid.n_points * n_values
+        flat_shape = (grid.n_points,) if n_values == 1 else (grid.n_points, n_values)
+        values = np.empty(flat_shape) if out is None else out
+        if tuple(values.shape) != flat_shape:
+            raise ValueError(f"Output shape {tuple(values.shape)} does not match cube data {flat_shape}.")
+        flat = values.reshape(-1) if values.flags.c_contiguous else None
+        read = 0
+        while read < total:
+            chunk = np.fromfile(f, dtype=float, count=min(_READ_CHUNK, total - read), sep=" ")
+            if chunk.size == 0:
+                break
+            if flat is not None:
+                flat[read:read + chunk.size] = chunk
+            else:
+                index = np.unravel_index(np.arange(read, read + chunk.size), flat_shape)
+                values[index] = chunk
+            read += chunk.size
+        if read < total:
+            raise ValueError(f"Cube file {filename} holds {read} values but its grid needs {total}.")
+
+    if isinstance(values, np.memmap):
+        values.flush()
+    return {
+        "comments": comments,
+        "grid": grid,
+        "atomic_numbers": atomic_numbers,
+        "coordinates": [tuple(float(v) for v in xyz) for xyz in positions * scale],
+        "value_ids": value_ids,
+        "values": values,
+    }
@@ -0,0 +1,219 @@
+# src/openwfn/estimate.py
+
+import io
+import itertools
+import os
+import re
+import time
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np  # type: ignore
+
+from .density import DEFAULT_MEMORY_BUDGET  # type: ignore
+from .grid import RegularGrid  # type: ignore
+from .parallel import evaluate_grid, kernel_output_shape, resolve_workers  # type: ignore
+
+# Bookkeeping bytes per point of a grid chunk beyond the points and values
+# themselves (index unravelling, float64 lattice coordinates, block ordering).
+_CHUNK_OVERHEAD_PER_POINT = 96
+# Characters per value in ASCII VTK output ("%.6e\n", sign included), and
+# bytes per value of binary (float32) output before compression.
+_VTK_BYTES_PER_VALUE = 14
+_BINARY_BYTES_PER_VALUE = 4
+# Smallest per-worker block budget and chunk accepted when fitting --max-memory.
+_MIN_MEMORY_BUDGET = 8 * 1024 ** 2
+_MIN_CHUNK_POINTS = 4096
+
+_UNITS = {"": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3, "t": 1024 ** 4}
+
+
+def parse_memory_size(text: str | int) -> int:
+    """
+    Parse a memory size such as `512M`, `4G`, `1.5GiB` or a plain byte count.
+
+    Units are binary (K = 1024 bytes).
+    """
+    if isinstance(text, (int, np.integer)):
+        size = int(text)
+    else:
+        match = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*([kmgt]?)(?:i?b)?\s*", str(text).lower())
+        if not match:
+            raise ValueError(f"Invalid memory size '{text}' (use e.g. 512M, 4G or a byte count).")
+        size = int(float(match.group(1)) * _UNITS[match.group(2)])
+    if size <= 0:
+        raise ValueError("Memory size must be positive.")
+    return size
+
+
+def format_bytes(n_bytes: float) -> str:
+    """Human-readable binary size (e.g. `1.50 GiB`)."""
+    value = float(n_bytes)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(value) < 1024.0:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.2f} {unit}"
+        value /= 1024.0
+    return f"{value:.2f} TiB"
+
+
+def format_duration(seconds: float) -> str:
+    """Compact duration such as `45 s`, `12 min` or `3.2 h`."""
+    if seconds < 1.0:
+        return f"{seconds * 1000:.0f} ms"
+    if seconds < 120.0:
+        return f"{seconds:.1f} s"
+    if seconds < 7200.0:
+        return f"{seconds / 60:.0f} min"
+    return f"{seconds / 3600:.1f} h"
+
+
+def _sample_patches(grid: RegularGrid, sample_points: int) -> list[RegularGrid]:
+    """
+    Eight full-resolution sub-boxes at stratified positions of `grid`.
+
+    Each patch is at most one screening block (2 A) wide, so per-block
+    overheads and basis screening match those of the full job.
+    """
+    if grid.n_points <= sample_points:
+        return [grid]
+    shape = np.asarray(grid.shape)
+    side = min(int(round((sample_points / 8) ** (1.0 / 3.0))), *np.ceil(2.0 / grid.spacing).astype(int))
+    patch = np.minimum(shape, max(side, 2))
+    patches = []
+    for corner in itertools.product((0.25, 0.75), repeat=3):
+        start = np.clip(np.round(np.asarray(corner) * shape - patch / 2), 0, shape - patch)
+        origin = grid.origin + start @ grid.vectors
+        patches.append(RegularGrid(origin, grid.spacing, tuple(int(n) for n in patch), axes=grid.axes))
+    return patches
+
+
+def benchmark_kernel(
+    basis: Mapping[str, Any],
+    grid: RegularGrid,
+    kernel: str,
+    matrix: np.ndarray,
+    dtype: Any = np.float64,
+    sample_points: int = 16384,
+) -> float:
+    """
+    Time a grid kernel on this machine and return seconds per point.
+
+    The sample consists of full-resolution patches spread over the box of
+    `grid`, so basis screening (and hence the per-point cost) is
+    representative of the full job.
+    """
+    patches = [p.points(dtype=dtype) for p in _sample_patches(grid, sample_points)]
+    evaluate_grid(patches[0][:64], basis, kernel, matrix)
+    start = time.perf_counter()
+    for points in patches:
+        evaluate_grid(points, basis, kernel, matrix)
+    return (time.perf_counter() - start) / max(sum(len(p) for p in patches), 1)
+
+
+def benchmark_export(n_values: int = 1 << 15, binary: bool = False) -> float:
+    """Time ASCII value formatting (or float32 packing) on this machine and return seconds per value."""
+    values = np.linspace(-1.0, 1.0, n_values)
+    start = time.perf_counter()
+    if binary:
+        io.BytesIO().write(values[::-1].astype(">f4").tobytes())
+    else:
+        np.savetxt(io.StringIO(), values, fmt="%.6e")
+    return (time.perf_counter() - start) / n_values
+
+
+def plan_grid_job(
+    basis: Mapping[str, Any],
+    grid: RegularGrid,
+    kernel: str,
+    matrix: np.ndarray,
+    dtype: Any = np.float64,
+    workers: int | None = 1,
+    out_of_core: bool = False,
+    max_memory: int | None = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    chunk_points: int = 1 << 21,
+    calibrate: bool = True,
+    binary_output: bool = False,
+    symmetry_order: int = 1,
+) -> dict[str, Any]:
+    """
+    Predict the cost of evaluating a kernel on a regular grid and size its chunks.
+
+    Peak memory is the working set of the job on top of the interpreter:
+    the result array (unless written out of core), the kernel matrix, one
+    chunk of grid points and values, and every worker's block budget plus
+    its gathered density-matrix block. With `max_memory` the chunk size and
+    per-worker block budget are shrunk until that estimate fits.
+
+    Args:
+        basis: Compiled basis from `compile_basis` or a `BasisSet`.
+        grid: `RegularGrid` to evaluate on.
+        kernel: Name in `GRID_KERNELS`.
+        matrix: Kernel matrix, as for `evaluate_grid`.
+        dtype: Evaluation precision (float32 or float64).
+        workers: Worker processes (None/0 for all cores).
+        out_of_core: Whether results stream to a disk-backed array.
+        max_memory: Optional cap on the estimated peak memory in bytes.
+        memory_budget: Preferred per-worker block budget in bytes.
+        chunk_points: Preferred number of grid points per chunk.
+        calibrate: Time the kernel on a small sample to predict runtime.
+        binary_output: Whether values are written as float32 (binary VTK or
+            VTI; an upper bound for compressed output) rather than ASCII.
+        symmetry_order: Number of grid symmetry operations; only about
+            1/`symmetry_order` of the points are evaluated.
+
+    Returns:
+        Dictionary with `n_points`, `n_fields`, `chunk_points`,
+        `memory_budget`, `peak_memory`, `output_memory`, `bytes_written`,
+        `scratch_bytes`, `seconds_per_point` and `runtime` (evaluation plus
+        export; None without calibration).
+
+    Raises:
+        ValueError: If the job cannot fit in `max_memory`.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    n_workers = resolve_workers(workers)
+    matrix = np.asarray(matrix)
+    n_points = grid.n_points
+    out_shape = kernel_output_shape(kernel, n_points, matrix)
+    n_fields = int(np.prod(out_shape[1:], dtype=np.int64))
+    n_basis = int(basis["n_basis"])
+
+    result_bytes = n_points * n_fields * itemsize
+    output_memory = 0 if out_of_core else result_bytes
+    fixed = output_memory + matrix.size * (8 + itemsize) + n_workers * n_basis * n_basis * itemsize
+    copies = 2 if n_workers > 1 else 1
+    per_point = _CHUNK_OVERHEAD_PER_POINT + copies * (3 + 2 * n_fields) * itemsize
+
+    chunk_points = max(1, min(int(chunk_points), n_points))
+    if max_memory is not None:
+        available = max_memory - fixed
+        floor = n_workers * _MIN_MEMORY_BUDGET + min(_MIN_CHUNK_POINTS, n_points) * per_point
+        if available < floor:
+            hint = " (try --out-of-core)" if not out_of_core and result_bytes > max_memory // 2 else ""
+            raise ValueError(
+                f"Grid job needs at least {format_bytes(fixed + floor)} but --max-memory is "
+                f"{format_bytes(max_memory)}{hint}."
+            )
+        memory_budget = int(min(memory_budget, max(_MIN_MEMORY_BUDGET, available // (2 * n_workers))))
+        chunk_points = int(min(chunk_points, (available - n_workers * memory_budget) // per_point))
+
+    seconds_per_point = None
+    runtime = None
+    if calibrate:
+        seconds_per_point = benchmark_kernel(basis, grid, kernel, matrix, dtype=dtype)
+        cores = min(n_workers, os.cpu_count() or 1)
+        evaluated = n_points / max(int(symmetry_order), 1)
+        runtime = seconds_per_point * evaluated / cores + benchmark_export(binary=binary_output) * n_points * n_fields
+    return {
+        "n_points": n_points,
+        "n_fields": n_fields,
+        "chunk_points": chunk_points,
+        "memory_budget": memory_budget,
+        "peak_memory": fixed + chunk_points * per_point + n_workers * memory_budget,
+        "output_memory": output_memory,
+        "bytes_written": n_points * n_fields * (_BINARY_BYTES_PER_VALUE if binary_output else _VTK_BYTES_PER_VALUE),
+        "scratch_bytes": result_bytes if out_of_core else 0,
+        "seconds_per_point": seconds_per_point,
+        "runtime": runtime,
+    }
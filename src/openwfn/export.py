@@ -1,13 +1,32 @@
 # src/openwfn/export.py
 
+import gzip
 import json
+import zlib
 from pathlib import Path
+from typing import Any, Iterator
+
 import numpy as np  # type: ignore
 
 from .constants import Z_TO_SYMBOL  # type: ignore
+from .grid import RegularGrid  # type: ignore
+from .isosurface import mesh_normals  # type: ignore
+
+
+# Values formatted per write when streaming fields to text files.
+_WRITE_CHUNK = 1 << 16
+# Values per compressed block in zlib-encoded VTI files (1 MiB of float32).
+_VTI_BLOCK = 1 << 18
 
 
-def export_vtk(filename: str, grid_points: np.ndarray, grid_shape: tuple[int, int, int], data: np.ndarray, data_name: str = "density") -> None:
+def export_vtk(
+    filename: str,
+    grid_points: np.ndarray,
+    grid_shape: tuple[int, int, int],
+    data: np.ndarray | dict[str, np.ndarray],
+    data_name: str = "density",
+    binary: bool = False,
+) -> None:
     """
     Export 3D volumetric data to VTK format for ParaView/Mayavi.
     
@@ -15,51 +34,412 @@ def export_vtk(filename: str, grid_points: np.ndarray, grid_shape: tuple[int, in
         filename: output .vtk file path.
         grid_points: (N, 3) matrix of coordinates.
         grid_shape: (nx, ny, nz) grid dimensions.
-        data: (N,) flat array of values at each grid point.
-        data_name: Name of the scalar field.
+        data: (N,) flat array of values at each grid point, or a mapping of
+            field names to such arrays to write several scalar fields.
+        data_name: Name of the scalar field (ignored when `data` is a mapping).
+        binary: Write big-endian float32 instead of ASCII values.
     """
     nx, ny, nz = grid_shape
     if nx <= 0 or ny <= 0 or nz <= 0:
         raise ValueError("grid_shape must have positive dimensions.")
     if grid_points.shape[0] != nx * ny * nz:
         raise ValueError("grid_points size does not match grid_shape.")
-    if len(data) != nx * ny * nz:
-        raise ValueError("data size does not match grid_shape.")
-    
+
+    # Origin (assume grid_points[0] is the min bound since we used meshgrid)
+    origin = grid_points[0]
+    # Infer spacing from neighboring points in flattened ijk-order grid.
+    spacing_x = (grid_points[ny * nz][0] - grid_points[0][0]) if nx > 1 else 1.0
+    spacing_y = (grid_points[nz][1] - grid_points[0][1]) if ny > 1 else 1.0
+    spacing_z = (grid_points[1][2] - grid_points[0][2]) if nz > 1 else 1.0
+    grid = RegularGrid(origin, (spacing_x, spacing_y, spacing_z), grid_shape)
+    export_vtk_grid(filename, grid, data, data_name, binary=binary)
+
+
+def _grid_fields(
+    grid: RegularGrid,
+    data: np.ndarray | dict[str, np.ndarray],
+    data_name: str,
+) -> dict[str, np.ndarray]:
+    fields = dict(data) if isinstance(data, dict) else {data_name: data}
+    if min(grid.shape) <= 0:
+        raise ValueError("grid_shape must have positive dimensions.")
+    for values in fields.values():
+        if len(values) != grid.n_points:
+            raise ValueError("data size does not match grid_shape.")
+    return fields
+
+
+def _x_fastest(values: np.ndarray, shape: tuple[int, int, int], dtype: Any = np.float32) -> Iterator[np.ndarray]:
+    """
+    Re-order values stored in grid order (z fastest) into the x-fastest
+    order of VTK image data, a slab of z-planes at a time.
+    """
+    nx, ny, nz = shape
+    volume = values.reshape(shape)
+    planes = max(1, _WRITE_CHUNK // (nx * ny))
+    for k0 in range(0, nz, planes):
+        yield np.ascontiguousarray(volume[:, :, k0:k0 + planes].transpose(2, 1, 0), dtype=dtype).ravel()
+
+
+def export_vtk_grid(
+    filename: str,
+    grid: RegularGrid,
+    data: np.ndarray | dict[str, np.ndarray],
+    data_name: str = "density",
+    binary: bool = False,
+) -> None:
+    """
+    Export values on a `RegularGrid` to legacy VTK without materializing its points.
+
+    Field values are read and written in chunks, so memory-mapped arrays
+    (e.g. from `evaluate_grid_into`) are streamed from disk rather than loaded.
+    VTK stores image data x fastest, so values are transposed slab by slab.
+
+    Args:
+        filename: output .vtk file path.
+        grid: Axis-aligned `RegularGrid` the values were evaluated on.
+        data: (N,) values in grid order, or a mapping of field names to such
+            arrays.
+        data_name: Name of the scalar field (ignored when `data` is a mapping).
+        binary: Write big-endian float32 (about 3.5x smaller and much faster
+            than ASCII).
+    """
+    fields = _grid_fields(grid, data, data_name)
+    header = grid.vtk_header()
+
+    with open(filename, 'wb' if binary else 'w') as f:
+        def write_text(text: str) -> None:
+            f.write(text.encode("ascii") if binary else text)
+
+        write_text("# vtk DataFile Version 3.0\n")
+        write_text(f"openWFN {', '.join(fields)} export\n")
+        write_text("BINARY\n" if binary else "ASCII\n")
+        write_text("DATASET STRUCTURED_POINTS\n")
+        for line in header:
+            write_text(line + "\n")
+
+        write_text(f"\nPOINT_DATA {grid.n_points}\n")
+        for name, values in fields.items():
+            write_text(f"SCALARS {name} float 1\n")
+            write_text("LOOKUP_TABLE default\n")
+            for chunk in _x_fastest(np.asarray(values), grid.shape, ">f4" if binary else float):
+                if binary:
+                    f.write(chunk.tobytes())
+                else:
+                    np.savetxt(f, chunk, fmt="%.6e")
+            if binary:
+                write_text("\n")
+
+
+def export_vti(
+    filename: str,
+    grid: RegularGrid,
+    data: np.ndarray | dict[str, np.ndarray],
+    data_name: str = "density",
+    encoding: str = "zlib",
+) -> None:
+    """
+    Export values on a `RegularGrid` as VTK XML image data (.vti).
+
+    Each field is a Float32 point-data array in the raw appended section,
+    either uncompressed (`raw`) or split into zlib-compressed blocks
+    (`zlib`, as written by vtkZLibDataCompressor). Rotated grids are stored
+    with a `Direction` matrix (VTK 9 and later).
+
+    Args:
+        filename: output .vti file path.
+        grid: `RegularGrid` the values were evaluated on.
+        data: (N,) values in grid order, or a mapping of field names to such
+            arrays.
+        data_name: Name of the scalar field (ignored when `data` is a mapping).
+        encoding: `raw` or `zlib`.
+    """
+    if encoding not in ("raw", "zlib"):
+        raise ValueError(f"Unknown VTI encoding '{encoding}' (choose raw or zlib).")
+    fields = _grid_fields(grid, data, data_name)
+    nx, ny, nz = grid.shape
+    n_bytes = grid.n_points * 4
+
+    if encoding == "zlib":
+        # Compressed blocks are kept until every field's size (and hence its
+        # offset in the appended section) is known.
+        payloads = []
+        for values in fields.values():
+            blocks, pending = [], bytearray()
+            for chunk in _x_fastest(np.asarray(values), grid.shape, "<f4"):
+                pending += chunk.tobytes()
+                while len(pending) >= _VTI_BLOCK * 4:
+                    blocks.append(zlib.compress(pending[:_VTI_BLOCK * 4], 1))
+                    del pending[:_VTI_BLOCK * 4]
+            if pending:
+                blocks.append(zlib.compress(pending, 1))
+            last = n_bytes - (len(blocks) - 1) * _VTI_BLOCK * 4
+            header = np.array([len(blocks), _VTI_BLOCK * 4, last, *(len(b) for b in blocks)], dtype="<u8")
+            payloads.append([header.tobytes(), *blocks])
+        sizes = [sum(len(part) for part in payload) for payload in payloads]
+    else:
+        sizes = [8 + n_bytes] * len(fields)
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(int)
+
+    direction = "" if grid.is_axis_aligned else ' Direction="' + " ".join(f"{v:.12g}" for v in grid.axes.T.ravel()) + '"'
+    compressor = ' compressor="vtkZLibDataCompressor"' if encoding == "zlib" else ""
+    arrays = "".join(
+        f'        <DataArray type="Float32" Name="{name}" format="appended" offset="{offset}"/>\n'
+        for name, offset in zip(fields, offsets)
+    )
+    xml = (
+        '<?xml version="1.0"?>\n'
+        f'<VTKFile type="ImageData" version="1.0" byte_order="LittleEndian" header_type="UInt64"{compressor}>\n'
+        f'  <ImageData WholeExtent="0 {nx - 1} 0 {ny - 1} 0 {nz - 1}" '
+        f'Origin="{" ".join(f"{v:.12g}" for v in grid.origin)}" '
+        f'Spacing="{" ".join(f"{v:.12g}" for v in grid.spacing)}"{direction}>\n'
+        f'    <Piece Extent="0 {nx - 1} 0 {ny - 1} 0 {nz - 1}">\n'
+        f'      <PointData Scalars="{next(iter(fields))}">\n{arrays}      </PointData>\n'
+        "    </Piece>\n  </ImageData>\n"
+        '  <AppendedData encoding="raw">\n   _'
+    )
+    with open(filename, 'wb') as f:
+        f.write(xml.encode("ascii"))
+        if encoding == "zlib":
+            for payload in payloads:
+                for part in payload:
+                    f.write(part)
+        else:
+            for values in fields.values():
+                f.write(np.array([n_bytes], dtype="<u8").tobytes())
+                for chunk in _x_fastest(np.asarray(values), grid.shape, "<f4"):
+                    f.write(chunk.tobytes())
+        f.write(b"\n  </AppendedData>\n</VTKFile>\n")
+
+
+def export_cube(
+    filename: str,
+    grid: RegularGrid,
+    data: np.ndarray | dict[str, np.ndarray],
+    atomic_numbers: list[int],
+    coordinates: list[tuple[float, float, float]],
+    data_name: str = "density",
+) -> None:
+    """
+    Export values on a `RegularGrid` as a Gaussian cube file.
+
+    The header comes from `RegularGrid.cube_header` (Bohr) and values are
+    streamed a few thousand z-rows at a time in the standard layout: six
+    `%13.5E` values per line, each (x, y) row starting on a new line. Several
+    fields become a multi-value cube with values interleaved per point.
+
+    Args:
+        filename: output .cube file path.
+        grid: `RegularGrid` the values were evaluated on (may be rotated).
+        data: (N,) values in grid order (atomic units), or a mapping of
+            field names to such arrays.
+        atomic_numbers: Atomic numbers of the molecule.
+        coordinates: Atomic coordinates in Angstroms.
+        data_name: Name of the scalar field (ignored when `data` is a mapping).
+    """
+    fields = _grid_fields(grid, data, data_name)
+    nz = grid.shape[2]
+    row_length = nz * len(fields)
+    full, rest = divmod(row_length, 6)
+    row_format = ("%13.5E" * 6 + "\n") * full + ("%13.5E" * rest + "\n" if rest else "")
+    rows_per_chunk = max(1, _WRITE_CHUNK // row_length)
+    comments = ("openWFN cube file", f"{', '.join(fields)}; outer loop: X, middle: Y, inner: Z")
+
+    with open(filename, 'w') as f:
+        f.write(grid.cube_header(atomic_numbers, coordinates, comments=comments, n_values=len(fields)))
+        for start in range(0, grid.n_points, rows_per_chunk * nz):
+            stop = min(start + rows_per_chunk * nz, grid.n_points)
+            block = np.column_stack([np.asarray(values[start:stop], dtype=float) for values in fields.values()])
+            f.write((row_format * ((stop - start) // nz)) % tuple(block.ravel().tolist()))
+
+
+def export_vtk_unstructured(
+    filename: str,
+    points: np.ndarray,
+    cells: np.ndarray,
+    data: np.ndarray | dict[str, np.ndarray],
+    data_name: str = "density",
+) -> None:
+    """
+    Export point data on hexahedral cells (e.g. an octree grid) as a legacy
+    VTK unstructured grid of VTK_VOXEL cells.
+
+    Args:
+        filename: output .vtk file path.
+        points: (P, 3) vertex coordinates.
+        cells: (L, 8) vertex indices per cell in VTK_VOXEL order.
+        data: (P,) values per vertex, or a mapping of field names to such arrays.
+        data_name: Name of the scalar field (ignored when `data` is a mapping).
+    """
+    fields = dict(data) if isinstance(data, dict) else {data_name: data}
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    cells = np.asarray(cells, dtype=np.int64).reshape(-1, 8)
+    for values in fields.values():
+        if len(values) != points.shape[0]:
+            raise ValueError("data size does not match number of points.")
+
     with open(filename, 'w') as f:
         f.write("# vtk DataFile Version 3.0\n")
-        f.write(f"openWFN {data_name} export\n")
+        f.write(f"openWFN {', '.join(fields)} export\n")
         f.write("ASCII\n")
-        f.write("DATASET STRUCTURED_POINTS\n")
-        
-        # Dimensions
-        f.write(f"DIMENSIONS {nx} {ny} {nz}\n")
-        
-        # Origin (assume grid_points[0] is the min bound since we used meshgrid)
-        origin = grid_points[0]
-        f.write(f"ORIGIN {origin[0]} {origin[1]} {origin[2]}\n")
-        
-        # Infer spacing from neighboring points in flattened ijk-order grid.
-        spacing_x = (grid_points[ny * nz][0] - grid_points[0][0]) if nx > 1 else 1.0
-        spacing_y = (grid_points[nz][1] - grid_points[0][1]) if ny > 1 else 1.0
-        spacing_z = (grid_points[1][2] - grid_points[0][2]) if nz > 1 else 1.0
-        f.write(f"SPACING {spacing_x} {spacing_y} {spacing_z}\n")
-        
-        f.write(f"\nPOINT_DATA {len(data)}\n")
-        f.write(f"SCALARS {data_name} float 1\n")
-        f.write("LOOKUP_TABLE default\n")
-        
-        # Write data chunked
-        for val in data:
-            f.write(f"{val:.6e}\n")
-
-
-def export_csv(filename: str, grid_points: np.ndarray, data: np.ndarray, data_name: str = "value") -> None:
-    """Export points and values to a simple CSV."""
+        f.write("DATASET UNSTRUCTURED_GRID\n")
+        f.write(f"POINTS {points.shape[0]} float\n")
+        np.savetxt(f, points, fmt="%.6f")
+        f.write(f"\nCELLS {cells.shape[0]} {cells.shape[0] * 9}\n")
+        np.savetxt(f, np.column_stack([np.full(cells.shape[0], 8), cells]), fmt="%d")
+        f.write(f"\nCELL_TYPES {cells.shape[0]}\n")
+        np.savetxt(f, np.full(cells.shape[0], 11), fmt="%d")
+
+        f.write(f"\nPOINT_DATA {points.shape[0]}\n")
+        for name, values in fields.items():
+            f.write(f"SCALARS {name} float 1\n")
+            f.write("LOOKUP_TABLE default\n")
+            np.savetxt(f, np.asarray(values, dtype=float), fmt="%.6e")
+
+
+def export_obj(filename: str, meshes: dict[str, tuple[np.ndarray, np.ndarray]]) -> None:
+    """
+    Export triangle meshes (e.g. isosurfaces) as a Wavefront OBJ file.
+
+    Args:
+        filename: output .obj file path.
+        meshes: Mapping of object names to (V, 3) vertices and (F, 3)
+            0-based triangle indices; each becomes an OBJ object with
+            per-vertex normals.
+    """
+    offset = 1
     with open(filename, 'w') as f:
-        f.write(f"x,y,z,{data_name}\n")
-        for (x, y, z), val in zip(grid_points, data):
-            f.write(f"{x:.6f},{y:.6f},{z:.6f},{val:.6e}\n")
+        f.write("# openWFN isosurface export\n")
+        for name, (vertices, faces) in meshes.items():
+            faces = np.asarray(faces, dtype=np.int64) + offset
+            f.write(f"o {name}\n")
+            np.savetxt(f, vertices, fmt="v %.5f %.5f %.5f")
+            np.savetxt(f, mesh_normals(vertices, faces - offset), fmt="vn %.4f %.4f %.4f")
+            np.savetxt(f, np.repeat(faces, 2, axis=1), fmt="f %d//%d %d//%d %d//%d")
+            offset += len(vertices)
+
+
+def export_ply(
+    filename: str,
+    meshes: dict[str, tuple[np.ndarray, np.ndarray]],
+    colors: dict[str, tuple[int, int, int]] | None = None,
+) -> None:
+    """
+    Export triangle meshes as one binary little-endian PLY file.
+
+    Args:
+        filename: output .ply file path.
+        meshes: Mapping of names to (V, 3) vertices and (F, 3) 0-based
+            triangle indices; all meshes are merged.
+        colors: Optional RGB colour per mesh name, stored per vertex
+            (light grey when missing).
+    """
+    colors = colors or {}
+    vertex_type = np.dtype([("xyz", "<f4", 3), ("rgb", "u1", 3)])
+    face_type = np.dtype([("n", "u1"), ("index", "<i4", 3)])
+    vertex_blocks, face_blocks = [], []
+    offset = 0
+    for name, (vertices, faces) in meshes.items():
+        block = np.empty(len(vertices), dtype=vertex_type)
+        block["xyz"] = vertices
+        block["rgb"] = colors.get(name, (200, 200, 200))
+        vertex_blocks.append(block)
+        tri = np.empty(len(faces), dtype=face_type)
+        tri["n"] = 3
+        tri["index"] = np.asarray(faces, dtype=np.int64) + offset
+        face_blocks.append(tri)
+        offset += len(vertices)
+    vertex_data = np.concatenate(vertex_blocks) if vertex_blocks else np.empty(0, dtype=vertex_type)
+    face_data = np.concatenate(face_blocks) if face_blocks else np.empty(0, dtype=face_type)
+
+    header = (
+        "ply\nformat binary_little_endian 1.0\ncomment openWFN isosurface export\n"
+        f"element vertex {len(vertex_data)}\nproperty float x\nproperty float y\nproperty float z\n"
+        "property uchar red\nproperty uchar green\nproperty uchar blue\n"
+        f"element face {len(face_data)}\nproperty list uchar int vertex_indices\nend_header\n"
+    )
+    with open(filename, 'wb') as f:
+        f.write(header.encode("ascii"))
+        f.write(vertex_data.tobytes())
+        f.write(face_data.tobytes())
+
+
+def export_csv(
+    filename: str,
+    grid_points: np.ndarray | RegularGrid,
+    data: np.ndarray | dict[str, np.ndarray],
+    data_name: str = "value",
+    compress: bool | None = None,
+    extra_columns: dict[str, np.ndarray] | None = None,
+) -> None:
+    """
+    Export points and values to CSV, optionally gzip-compressed.
+
+    Rows are formatted `_WRITE_CHUNK` at a time with a single %-format call
+    per block, so memory stays bounded and memory-mapped values stream.
+
+    Args:
+        filename: output .csv (or .csv.gz) file path.
+        grid_points: (N, 3) coordinates, or a `RegularGrid` whose points are
+            generated block by block.
+        data: (N,) values, or a mapping of column names to such arrays.
+        data_name: Name of the value column (ignored when `data` is a mapping).
+        compress: Write gzip; by default when `filename` ends in `.gz`.
+        extra_columns: Optional (N,) coordinate columns (e.g. in-plane u, v)
+            written before x, y and z.
+    """
+    fields = dict(data) if isinstance(data, dict) else {data_name: data}
+    n_points = len(grid_points)
+    extra = dict(extra_columns or {})
+    for values in [*fields.values(), *extra.values()]:
+        if len(values) != n_points:
+            raise ValueError("data size does not match number of points.")
+    if compress is None:
+        compress = str(filename).lower().endswith(".gz")
+
+    opener = gzip.open(filename, 'wt', compresslevel=1) if compress else open(filename, 'w')
+    with opener as f:
+        f.write(",".join([*extra, "x", "y", "z", *fields]) + "\n")
+        for start, stop, text in _csv_blocks(grid_points, fields, extra):
+            block = np.column_stack([np.asarray(v[start:stop], dtype=float) for v in fields.values()])
+            f.write(text % tuple(block.ravel().tolist()))
+
+
+def _csv_blocks(
+    grid_points: np.ndarray | RegularGrid,
+    fields: dict[str, np.ndarray],
+    extra: dict[str, np.ndarray],
+) -> Iterator[tuple[int, int, str]]:
+    """
+    Yield (start, stop, template) for consecutive CSV blocks, where the
+    template holds the formatted coordinates and a `%.6e` slot per value.
+    """
+    value_slots = ",%.6e" * len(fields) + "\n"
+    n_points = len(grid_points)
+    if isinstance(grid_points, RegularGrid) and grid_points.is_axis_aligned and n_points and not extra:
+        # Coordinates repeat along the axes, so each is formatted once and a
+        # z-row template is assembled from the pieces.
+        grid = grid_points
+        nx, ny, nz = grid.shape
+        axes = [grid.origin[a] + np.arange(n, dtype=float) * grid.spacing[a] for a, n in enumerate(grid.shape)]
+        x_text = [f"{c:.6f}," for c in axes[0]]
+        y_text = [f"{c:.6f}," for c in axes[1]]
+        z_tail = [f"{c:.6f}" + value_slots for c in axes[2]]
+        rows = max(1, _WRITE_CHUNK // nz)
+        for row0 in range(0, nx * ny, rows):
+            row1 = min(row0 + rows, nx * ny)
+            prefixes = (x_text[r // ny] + y_text[r % ny] for r in range(row0, row1))
+            yield row0 * nz, row1 * nz, "".join(prefix + prefix.join(z_tail) for prefix in prefixes)
+        return
+    row_format = "%.6f," * len(extra) + "%.6f,%.6f,%.6f" + value_slots.replace("%", "%%")
+    for start in range(0, n_points, _WRITE_CHUNK):
+        stop = min(start + _WRITE_CHUNK, n_points)
+        if isinstance(grid_points, RegularGrid):
+            points = grid_points.points(start, stop)
+        else:
+            points = np.asarray(grid_points[start:stop], dtype=float).reshape(-1, 3)
+        columns = np.column_stack([*(np.asarray(c[start:stop], dtype=float) for c in extra.values()), points])
+        yield start, stop, (row_format * (stop - start)) % tuple(columns.ravel().tolist())
 
 
 def export_json(filename: str, properties: dict[str, object]) -> None:
@@ -75,8 +455,15 @@ def export_molecule_viewer(
     title: str = "openWFN Molecule Viewer",
     show_labels: bool = True,
     style: str = "ballstick",
+    surfaces: list[dict[str, Any]] | None = None,
 ) -> None:
-    """Export a standalone HTML molecule viewer using the vendored 3Dmol.js asset."""
+    """
+    Export a standalone HTML molecule viewer using the vendored 3Dmol.js asset.
+
+    `surfaces` optionally embeds triangle meshes (e.g. isosurfaces), each a
+    dict with `name`, `vertices` (V, 3), `faces` (F, 3) and optional
+    `color` and `opacity`.
+    """
     from .geometry import detect_bonds, molecular_formula  # type: ignore
 
     asset_path = Path(__file__).resolve().parent / "assets" / "3Dmol-min.js"
@@ -115,6 +502,21 @@ def export_molecule_viewer(
     file_base_json = json.dumps(base_name)
     initial_style = json.dumps(style)
     initial_labels = str(show_labels).lower()
+    surface_records = [
+        {
+            "name": surface["name"],
+            "vertices": np.round(np.asarray(surface["vertices"], dtype=float), 4).ravel().tolist(),
+            "normals": np.round(mesh_normals(surface["vertices"], surface["faces"]), 3).ravel().tolist(),
+            "faces": np.asarray(surface["faces"], dtype=np.int64).ravel().tolist(),
+            "color": surface.get("color", "#38bdf8"),
+            "opacity": float(surface.get("opacity", 0.8)),
+        }
+        for surface in surfaces or []
+    ]
+    surfaces_json = json.dumps(surface_records, separators=(",", ":"))
+    surfaces_chip = (
+        f'\n      <div class="chip"><strong>Surfaces</strong>{len(surface_records)}</div>' if surface_records else ""
+    )
 
     html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -332,7 +734,7 @@ def export_molecule_viewer(
       <div class="chip"><strong>Atoms</strong>{len(atomic_numbers)}</div>
       <div class="chip"><strong>Formula</strong>{formula}</div>
       <div class="chip"><strong>Labels</strong>{"On" if show_labels else "Off"}</div>
-      <div class="chip"><strong>Style</strong>{style}</div>
+      <div class="chip"><strong>Style</strong>{style}</div>{surfaces_chip}
     </div>
     <div class="workspace">
       <div class="viewer-panel">
@@ -399,6 +801,7 @@ def export_molecule_viewer(
     const bonds = {bonds_json};
     const xyzData = {xyz_json};
     const fileBase = {file_base_json};
+    const surfaces = {surfaces_json};
     const viewer = $3Dmol.createViewer("viewer", {{ backgroundColor: "#111827" }});
     const labelsToggle = document.getElementById("labels-toggle");
     const resetViewButton = document.getElementById("reset-view");
@@ -587,6 +990,21 @@ def export_molecule_viewer(
     }}
 
     viewer.addModel(xyzData, "xyz");
+    for (const surface of surfaces) {{
+      const vertexArr = [];
+      const normalArr = [];
+      for (let i = 0; i < surface.vertices.length; i += 3) {{
+        vertexArr.push({{ x: surface.vertices[i], y: surface.vertices[i + 1], z: surface.vertices[i + 2] }});
+        normalArr.push({{ x: surface.normals[i], y: surface.normals[i + 1], z: surface.normals[i + 2] }});
+      }}
+      viewer.addCustom({{
+        vertexArr: vertexArr,
+        normalArr: normalArr,
+        faceArr: surface.faces,
+        color: surface.color,
+        opacity: surface.opacity
+      }});
+    }}
     applyStyle();
     viewer.zoomTo();
     viewer.render();
@@ -154,6 +154,19 @@ def parse_fchk_density(lines: list[str]) -> dict[str, list[float]]:
     return density_data
 
 
+def parse_fchk_charges(lines: list[str]) -> list[float]:
+    """Parse Mulliken atomic charges, returning an empty list when absent."""
+    return _get_array(lines, "Mulliken Charges", float)
+
+
+def parse_fchk_nuclear_charges(lines: list[str]) -> list[float]:
+    """
+    Parse the nuclear charges seen by the electrons, returning an empty list when absent.
+    With effective core potentials these are Z minus the core electrons.
+    """
+    return _get_array(lines, "Nuclear charges", float)
+
+
 def print_atom_table(atomic_numbers: list[int], coordinates: list[tuple[float, float, float]]) -> None:
     """Print a formatted table of atomic coordinates."""
     print("Atom index table")
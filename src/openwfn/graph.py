@@ -1,6 +1,13 @@
 # src/openwfn/graph.py
 
 from collections import deque
+from typing import Any
+
+import numpy as np  # type: ignore
+
+from .constants import ATOMIC_MASS, Z_TO_SYMBOL  # type: ignore
+from .geometry import molecular_formula  # type: ignore
+
 
 class MolecularGraph:
     """A lightweight representation of a molecular graph."""
@@ -45,3 +52,99 @@ def build_graph(num_atoms: int, bonds: list[tuple[int, int, float]]) -> Molecula
     for i, j, distance in bonds:
         graph.add_edge(i, j, distance)
     return graph
+
+
+def fragment_labels(num_atoms: int, components: list[list[int]]) -> np.ndarray:
+    """Return a (num_atoms,) array mapping each atom to its 0-based fragment index."""
+    labels = np.full(num_atoms, -1, dtype=np.intp)
+    if components:
+        sizes = [len(nodes) for nodes in components]
+        members = np.concatenate([np.asarray(nodes, dtype=np.intp) for nodes in components]) - 1
+        labels[members] = np.repeat(np.arange(len(components)), sizes)
+    return labels
+
+
+def fragment_table(
+    atomic_numbers: list[int],
+    coordinates: list[tuple[float, float, float]],
+    components: list[list[int]],
+    charges: list[float] | None = None,
+) -> dict[str, Any]:
+    """
+    Compute per-fragment properties with grouped array reductions.
+
+    All reductions are performed in one pass over the atoms with `np.bincount`,
+    so the cost is linear in the number of atoms regardless of fragment count.
+
+    Args:
+        atomic_numbers: Atomic number for each atom.
+        coordinates: List of (x, y, z) tuples in Angstroms.
+        components: Fragment membership as returned by `connected_components`.
+        charges: Optional per-atom partial charges (e.g. Mulliken).
+
+    Returns:
+        Dictionary of per-fragment arrays keyed by `formula`, `n_atoms`, `mass`,
+        `center_of_mass` (F, 3), `radius_of_gyration` and, when charges are
+        given, `charge`.
+    """
+    n_frag = len(components)
+    z_arr = np.asarray(atomic_numbers, dtype=np.intp)
+    xyz = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+    labels = fragment_labels(len(z_arr), components)
+
+    unknown = sorted({int(z) for z in z_arr if int(z) not in ATOMIC_MASS})
+    if unknown:
+        symbol = Z_TO_SYMBOL.get(unknown[0], f"Z={unknown[0]}")
+        raise ValueError(f"Unknown atomic mass for element: {symbol}")
+    masses = np.array([ATOMIC_MASS[int(z)] for z in z_arr], dtype=float)
+
+    n_atoms = np.bincount(labels, minlength=n_frag)
+    total_mass = np.bincount(labels, weights=masses, minlength=n_frag)
+    safe_mass = np.where(total_mass > 0.0, total_mass, 1.0)
+    com = np.column_stack([
+        np.bincount(labels, weights=masses * xyz[:, axis], minlength=n_frag) / safe_mass
+        for axis in range(3)
+    ])
+    sq_dev = np.sum((xyz - com[labels]) ** 2, axis=1)
+    rg = np.sqrt(np.bincount(labels, weights=masses * sq_dev, minlength=n_frag) / safe_mass)
+
+    # Element count matrix (F, E): one bincount over combined (fragment, element) keys.
+    elements, elem_idx = np.unique(z_arr, return_inverse=True)
+    counts = np.bincount(
+        labels * len(elements) + elem_idx,
+        minlength=n_frag * len(elements),
+    ).reshape(n_frag, len(elements))
+
+    # Formulas are only built once per distinct composition.
+    compositions, composition_idx = np.unique(counts, axis=0, return_inverse=True)
+    unique_formulas = [
+        molecular_formula(np.repeat(elements, row).tolist())
+        for row in compositions
+    ]
+    formulas = [unique_formulas[k] for k in np.asarray(composition_idx).ravel()]
+
+    table: dict[str, Any] = {
+        "formula": formulas,
+        "n_atoms": n_atoms,
+        "mass": total_mass,
+        "center_of_mass": com,
+        "radius_of_gyration": rg,
+    }
+    if charges is not None:
+        if len(charges) != len(z_arr):
+            raise ValueError("charges size does not match number of atoms.")
+        table["charge"] = np.bincount(labels, weights=np.asarray(charges, dtype=float), minlength=n_frag)
+    return table
+
+
+def group_identical_fragments(formulas: list[str]) -> list[tuple[str, list[int]]]:
+    """
+    Collapse fragments with identical formulas.
+
+    Returns:
+        List of (formula, fragment indices) in order of first appearance.
+    """
+    groups: dict[str, list[int]] = {}
+    for index, formula in enumerate(formulas):
+        groups.setdefault(formula, []).append(index)
+    return list(groups.items())
@@ -1,43 +1,324 @@
 # src/openwfn/grid.py
 
+import re
 import numpy as np  # type: ignore
-from typing import Tuple
+from typing import Any, Iterator, Tuple
+
+from .constants import BOHR_TO_ANGSTROM  # type: ignore
+
+
+class RegularGrid:
+    """
+    Implicit description of a regular (optionally rotated) lattice of points.
+
+    Point (i, j, k) sits at `origin + i*spacing[0]*axes[0] + j*spacing[1]*axes[1]
+    + k*spacing[2]*axes[2]` and points are numbered in C order (k fastest),
+    matching `np.meshgrid(..., indexing='ij')`. Blocks of points are generated
+    on demand, so no full-size coordinate array is ever needed.
+    """
+
+    def __init__(
+        self,
+        origin: Any,
+        spacing: float | Any,
+        shape: Tuple[int, int, int],
+        axes: Any = None,
+    ):
+        self.origin = np.asarray(origin, dtype=float).reshape(3)
+        self.spacing = np.broadcast_to(np.asarray(spacing, dtype=float), (3,)).copy()
+        self.shape = tuple(int(n) for n in shape)
+        self.axes = np.eye(3) if axes is None else np.asarray(axes, dtype=float).reshape(3, 3)
+        if len(self.shape) != 3 or min(self.shape) < 0:
+            raise ValueError(f"Grid shape must be three non-negative integers (got {shape}).")
+        if np.any(self.spacing <= 0.0):
+            raise ValueError("Grid spacing must be positive.")
+        if not np.allclose(self.axes @ self.axes.T, np.eye(3), atol=1e-10):
+            raise ValueError("Grid axes must be orthonormal.")
+
+    @classmethod
+    def around(
+        cls,
+        coordinates: list[Tuple[float, float, float]],
+        margin: float = 3.0,
+        spacing: float = 0.2,
+    ) -> "RegularGrid":
+        """Axis-aligned box around the atoms with a fixed spacing (Angstroms)."""
+        lo, hi = _padded_bounds(coordinates, margin)
+        # Same point count as np.arange(lo, hi, spacing) along each axis.
+        nx, ny, nz = (int(n) for n in np.maximum(np.ceil((hi - lo) / spacing), 0))
+        return cls(lo, spacing, (nx, ny, nz))
+
+    @classmethod
+    def with_shape(
+        cls,
+        coordinates: list[Tuple[float, float, float]],
+        shape: Tuple[int, int, int],
+        margin: float = 3.0,
+    ) -> "RegularGrid":
+        """Axis-aligned box around the atoms with exactly `shape` points spanning it."""
+        if min(shape) < 2:
+            raise ValueError("Each grid dimension needs at least 2 points.")
+        lo, hi = _padded_bounds(coordinates, margin)
+        return cls(lo, (hi - lo) / (np.asarray(shape) - 1), shape)
+
+    @property
+    def n_points(self) -> int:
+        return int(np.prod(self.shape))
+
+    def __len__(self) -> int:
+        return self.n_points
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """(3, 3) step vectors along i, j and k (rows) in Angstroms."""
+        return self.axes * self.spacing[:, None]
+
+    @property
+    def is_axis_aligned(self) -> bool:
+        return bool(np.allclose(self.axes, np.eye(3)))
+
+    def points(self, start: int = 0, stop: int | None = None, dtype: Any = float) -> np.ndarray:
+        """(stop - start, 3) coordinates of points `start:stop` in grid order."""
+        stop = self.n_points if stop is None else min(int(stop), self.n_points)
+        return self.points_at(np.arange(start, stop), dtype=dtype)
+
+    def points_at(self, index: np.ndarray, dtype: Any = float) -> np.ndarray:
+        """(len(index), 3) coordinates of the points with flat (C-order) indices `index`."""
+        ijk = np.column_stack(np.unravel_index(np.asarray(index, dtype=np.int64), self.shape)).astype(float)
+        if self.is_axis_aligned:
+            pts = self.origin + ijk * self.spacing
+        else:
+            pts = self.origin + ijk @ self.vectors
+        return pts.astype(dtype, copy=False)
+
+    def iter_blocks(self, block_points: int = 1 << 20, dtype: Any = float) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """
+        Stream the grid as consecutive blocks of points.
+
+        Yields:
+            (start, stop, points) with points the (stop - start, 3) rows of
+            the flattened grid.
+        """
+        block_points = max(1, int(block_points))
+        for start in range(0, self.n_points, block_points):
+            stop = min(start + block_points, self.n_points)
+            yield start, stop, self.points(start, stop, dtype=dtype)
+
+    def vtk_header(self) -> list[str]:
+        """DIMENSIONS/ORIGIN/SPACING lines of a legacy VTK STRUCTURED_POINTS dataset."""
+        if not self.is_axis_aligned:
+            raise ValueError("VTK STRUCTURED_POINTS cannot represent a rotated grid; use a .vti or cube file.")
+        nx, ny, nz = self.shape
+        sx, sy, sz = self.spacing
+        ox, oy, oz = self.origin
+        return [f"DIMENSIONS {nx} {ny} {nz}", f"ORIGIN {ox} {oy} {oz}", f"SPACING {sx} {sy} {sz}"]
+
+    def cube_header(
+        self,
+        atomic_numbers: list[int],
+        coordinates: list[Tuple[float, float, float]],
+        comments: Tuple[str, str] = ("openWFN cube file", "Outer loop: X, middle: Y, inner: Z"),
+        n_values: int = 1,
+    ) -> str:
+        """
+        Gaussian cube header (lengths in Bohr) for this grid.
+
+        A negative atom count with a trailing value-count line is written when
+        `n_values` > 1, as Gaussian does for multi-value cubes.
+        """
+        origin = self.origin / BOHR_TO_ANGSTROM
+        n_atoms = len(atomic_numbers)
+        lines = list(comments)
+        lines.append(f"{-n_atoms if n_values > 1 else n_atoms:5d}{origin[0]:12.6f}{origin[1]:12.6f}{origin[2]:12.6f}")
+        for n, vector in zip(self.shape, self.vectors / BOHR_TO_ANGSTROM):
+            lines.append(f"{n:5d}{vector[0]:12.6f}{vector[1]:12.6f}{vector[2]:12.6f}")
+        for z, xyz in zip(atomic_numbers, np.asarray(coordinates, dtype=float).reshape(-1, 3) / BOHR_TO_ANGSTROM):
+            lines.append(f"{int(z):5d}{float(z):12.6f}{xyz[0]:12.6f}{xyz[1]:12.6f}{xyz[2]:12.6f}")
+        if n_values > 1:
+            lines.append(f"{n_values:5d}" + "".join(f"{i + 1:5d}" for i in range(n_values)))
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self) -> str:
+        nx, ny, nz = self.shape
+        spacing = ", ".join(f"{s:.4g}" for s in self.spacing)
+        rotated = "" if self.is_axis_aligned else ", rotated"
+        return f"RegularGrid({nx}x{ny}x{nz}, spacing=({spacing}) A{rotated})"
+
+
+def _padded_bounds(coordinates: list[Tuple[float, float, float]], margin: float) -> Tuple[np.ndarray, np.ndarray]:
+    coords_arr = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+    if coords_arr.shape[0] == 0:
+        raise ValueError("At least one atom is required to place a grid.")
+    return coords_arr.min(axis=0) - margin, coords_arr.max(axis=0) + margin
+
+
+def parse_grid_size(
+    spec: str | None,
+    coordinates: list[Tuple[float, float, float]],
+    margin: float = 3.0,
+    default_spacing: float = 0.2,
+) -> RegularGrid:
+    """
+    Build the grid requested on the command line.
+
+    Args:
+        spec: `NXxNYxNZ` (e.g. `80x80x80`) for an explicit point count, a
+            single number for the spacing in Angstroms (e.g. `0.1`), or None
+            for `default_spacing`.
+        coordinates: Atomic coordinates in Angstroms.
+        margin: Padding around the atoms in Angstroms.
+        default_spacing: Spacing used when `spec` is None.
+    """
+    if spec is None or not spec.strip():
+        return RegularGrid.around(coordinates, margin=margin, spacing=default_spacing)
+    text = spec.strip().lower()
+    match = re.fullmatch(r"(\d+)\s*x\s*(\d+)\s*x\s*(\d+)", text)
+    if match:
+        return RegularGrid.with_shape(coordinates, tuple(int(n) for n in match.groups()), margin=margin)
+    try:
+        spacing = float(text)
+    except ValueError:
+        raise ValueError(f"Invalid grid size '{spec}': use NXxNYxNZ (e.g. 80x80x80) or a spacing in Angstroms.") from None
+    if spacing <= 0.0:
+        raise ValueError("Grid spacing must be positive.")
+    return RegularGrid.around(coordinates, margin=margin, spacing=spacing)
+
+
+def parse_resample_size(spec: str, grid: RegularGrid) -> RegularGrid:
+    """
+    Grid spanning the same box as `grid` (same origin and axes) at a new resolution.
+
+    Args:
+        spec: `NXxNYxNZ` for an explicit point count or a single spacing in
+            Angstroms, as for `parse_grid_size`.
+        grid: Grid whose box is resampled.
+    """
+    extent = (np.asarray(grid.shape) - 1) * grid.spacing
+    text = spec.strip().lower()
+    match = re.fullmatch(r"(\d+)\s*x\s*(\d+)\s*x\s*(\d+)", text)
+    if match:
+        shape = np.array([int(n) for n in match.groups()])
+        if np.any(shape < 1) or np.any((shape > 1) & (extent <= 0.0)):
+            raise ValueError(f"Cannot resample a {'x'.join(str(n) for n in grid.shape)} grid to {spec}.")
+        spacing = np.where(shape > 1, extent / np.maximum(shape - 1, 1), grid.spacing)
+    else:
+        try:
+            step = float(text)
+        except ValueError:
+            raise ValueError(f"Invalid resample size '{spec}': use NXxNYxNZ (e.g. 40x40x40) or a spacing in Angstroms.") from None
+        if step <= 0.0:
+            raise ValueError("Grid spacing must be positive.")
+        shape = np.floor(extent / step + 1e-9).astype(int) + 1
+        spacing = np.full(3, step)
+    return RegularGrid(grid.origin, spacing, tuple(int(n) for n in shape), axes=grid.axes)
+
+
+def _unit(vector: Any, what: str) -> np.ndarray:
+    v = np.asarray(vector, dtype=float).reshape(3)
+    norm = np.linalg.norm(v)
+    if norm < 1e-10:
+        raise ValueError(f"{what} must be a non-zero vector.")
+    return v / norm
+
+
+def _perpendicular(direction: np.ndarray, hint: Any = None) -> np.ndarray:
+    """Unit vector perpendicular to `direction`, as close to `hint` as possible."""
+    if hint is None:
+        hint = np.eye(3)[np.argmin(np.abs(direction))]
+    hint = np.asarray(hint, dtype=float).reshape(3)
+    return _unit(hint - (hint @ direction) * direction, "In-plane direction (not parallel to the normal)")
+
+
+def plane_grid(
+    point: Any,
+    normal: Any,
+    coordinates: list[Tuple[float, float, float]],
+    spacing: float = 0.05,
+    margin: float = 2.0,
+    in_plane: Any = None,
+    size: Tuple[float, float] | None = None,
+) -> RegularGrid:
+    """
+    Single-layer `RegularGrid` spanning a plane.
+
+    The grid axes are (u, v, normal), with u the in-plane projection of
+    `in_plane` (default: the Cartesian axis least aligned with the normal)
+    and v = normal x u, so the grid has shape (nu, nv, 1).
+
+    Args:
+        point: A point on the plane in Angstroms.
+        normal: Plane normal.
+        coordinates: Atomic coordinates; the plane covers their projections
+            plus `margin` unless `size` is given.
+        spacing: Point spacing in Angstroms.
+        margin: Padding around the projected atoms in Angstroms.
+        in_plane: Optional direction of the u axis.
+        size: Optional (width, height) in Angstroms, centred on `point`.
+    """
+    if spacing <= 0.0:
+        raise ValueError("Grid spacing must be positive.")
+    point = np.asarray(point, dtype=float).reshape(3)
+    n = _unit(normal, "Plane normal")
+    u = _perpendicular(n, in_plane)
+    v = np.cross(n, u)
+    if size is not None:
+        half = np.asarray(size, dtype=float) / 2.0
+        lo, hi = -half, half
+    else:
+        projected = (np.asarray(coordinates, dtype=float).reshape(-1, 3) - point) @ np.column_stack([u, v])
+        lo = np.minimum(projected.min(axis=0, initial=0.0), 0.0) - margin
+        hi = np.maximum(projected.max(axis=0, initial=0.0), 0.0) + margin
+    nu, nv = (int(k) for k in np.floor((hi - lo) / spacing + 1e-9).astype(int) + 1)
+    return RegularGrid(point + lo[0] * u + lo[1] * v, spacing, (nu, nv, 1), axes=[u, v, n])
+
+
+def line_grid(
+    start: Any,
+    end: Any,
+    n_points: int = 200,
+    extend: float = 0.0,
+) -> RegularGrid:
+    """
+    `RegularGrid` of `n_points` evenly spaced points from `start` to `end`.
+
+    The line is lengthened by `extend` Angstroms beyond both ends, and the
+    grid has shape (n_points, 1, 1) with its first axis along the line.
+    """
+    if n_points < 2:
+        raise ValueError("A line profile needs at least 2 points.")
+    start = np.asarray(start, dtype=float).reshape(3)
+    direction = np.asarray(end, dtype=float).reshape(3) - start
+    length = float(np.linalg.norm(direction))
+    d = _unit(direction, "Line direction")
+    p = _perpendicular(d)
+    spacing = (length + 2.0 * extend) / (n_points - 1)
+    if spacing <= 0.0:
+        raise ValueError("Line profile must have positive length.")
+    return RegularGrid(start - extend * d, spacing, (n_points, 1, 1), axes=[d, p, np.cross(d, p)])
+
 
 def make_bounding_box_grid(
     coordinates: list[Tuple[float, float, float]],
     margin: float = 3.0,
-    spacing: float = 0.2
+    spacing: float = 0.2,
+    dtype: Any = float,
 ) -> Tuple[np.ndarray, Tuple[int, int, int]]:
     """
     Create a 3D rectangular grid around the molecule.
-    
+
     Args:
         coordinates: List of (x, y, z) tuples for each atom in Angstroms.
         margin: Padding around the min/max coordinates in Angstroms.
         spacing: Grid spacing in Angstroms.
-        
+        dtype: Floating-point type of the returned points (float32 selects
+            single-precision evaluation downstream).
+
     Returns:
         points: (N, 3) array of Cartesian coordinates for all grid points.
         shape: (nx, ny, nz) shape of the grid for reshaping.
     """
     if not coordinates:
-        return np.empty((0, 3)), (0, 0, 0)
-
-    coords_arr = np.array(coordinates)
-    min_bounds = coords_arr.min(axis=0) - margin
-    max_bounds = coords_arr.max(axis=0) + margin
-
-    # Generate points in each dimension
-    x_points = np.arange(min_bounds[0], max_bounds[0], spacing)
-    y_points = np.arange(min_bounds[1], max_bounds[1], spacing)
-    z_points = np.arange(min_bounds[2], max_bounds[2], spacing)
-
-    # Make 3D meshgrid
-    # indexing='ij' gives (nx, ny, nz) shape matrix matching xyz ordering
-    X, Y, Z = np.meshgrid(x_points, y_points, z_points, indexing='ij')
-
-    # Flatten into (N, 3) for vectorized evaluations
-    points = np.column_stack([X.ravel(), Y.ravel(), Z.ravel()])
-    shape = X.shape
+        return np.empty((0, 3), dtype=dtype), (0, 0, 0)
 
-    return points, shape
+    grid = RegularGrid.around(coordinates, margin=margin, spacing=spacing)
+    return grid.points(dtype=dtype), grid.shape
@@ -0,0 +1,433 @@
+# src/openwfn/integration.py
+
+import itertools
+import math
+from functools import lru_cache
+
+import numpy as np  # type: ignore
+
+from .constants import BOHR_TO_ANGSTROM, BRAGG_SLATER_RADII, COVALENT_RADII, Z_TO_SYMBOL  # type: ignore
+
+# -------------------------------------------------
+# Angular grids
+# -------------------------------------------------
+
+# Lebedev rules: n_points -> (algebraic degree, [(generator, weight)]).
+# Generators are expanded over all signed permutations (octahedral orbits);
+# weights are normalized to sum to one over the sphere.
+_S2 = 1.0 / math.sqrt(2.0)
+_S3 = 1.0 / math.sqrt(3.0)
+
+
+def _b(l: float) -> tuple[float, float, float]:
+    return (l, l, math.sqrt(1.0 - 2.0 * l * l))
+
+
+def _c(p: float) -> tuple[float, float, float]:
+    return (p, math.sqrt(1.0 - p * p), 0.0)
+
+
+def _d(r: float, s: float) -> tuple[float, float, float]:
+    return (r, s, math.sqrt(1.0 - r * r - s * s))
+
+
+_LEBEDEV_RULES: dict[int, tuple[int, list[tuple[tuple[float, float, float], float]]]] = {
+    6: (3, [((1.0, 0.0, 0.0), 1.0 / 6.0)]),
+    14: (5, [((1.0, 0.0, 0.0), 1.0 / 15.0), ((_S3, _S3, _S3), 3.0 / 40.0)]),
+    26: (7, [
+        ((1.0, 0.0, 0.0), 1.0 / 21.0),
+        ((0.0, _S2, _S2), 4.0 / 105.0),
+        ((_S3, _S3, _S3), 9.0 / 280.0),
+    ]),
+    38: (9, [
+        ((1.0, 0.0, 0.0), 1.0 / 105.0),
+        ((_S3, _S3, _S3), 9.0 / 280.0),
+        (_c(0.4597008433809831), 1.0 / 35.0),
+    ]),
+    50: (11, [
+        ((1.0, 0.0, 0.0), 4.0 / 315.0),
+        ((0.0, _S2, _S2), 64.0 / 2835.0),
+        ((_S3, _S3, _S3), 27.0 / 1280.0),
+        (_b(1.0 / math.sqrt(11.0)), 14641.0 / 725760.0),
+    ]),
+    74: (13, [
+        ((1.0, 0.0, 0.0), 0.5130671797338464e-3),
+        ((0.0, _S2, _S2), 0.1660406956574204e-1),
+        ((_S3, _S3, _S3), -0.2958603896103896e-1),
+        (_b(0.4803844614152614), 0.2657620708215946e-1),
+        (_c(0.3207726489807764), 0.1652217099371571e-1),
+    ]),
+    86: (15, [
+        ((1.0, 0.0, 0.0), 0.1154401154401154e-1),
+        ((_S3, _S3, _S3), 0.1194390908585628e-1),
+        (_b(0.3696028464541502), 0.1111055571060340e-1),
+        (_b(0.6943540066026664), 0.1187650129453714e-1),
+        (_c(0.3742430390903412), 0.1181230374690448e-1),
+    ]),
+    110: (17, [
+        ((1.0, 0.0, 0.0), 0.3828270494937162e-2),
+        ((_S3, _S3, _S3), 0.9793737512487512e-2),
+        (_b(0.1851156353447362), 0.8211737283191111e-2),
+        (_b(0.6904210483822922), 0.9942814891178103e-2),
+        (_b(0.3956894730559419), 0.9595471336070963e-2),
+        (_c(0.4783690288121502), 0.9694996361663028e-2),
+    ]),
+    146: (19, [
+        ((1.0, 0.0, 0.0), 0.5996313688621381e-3),
+        ((0.0, _S2, _S2), 0.7372999718620756e-2),
+        ((_S3, _S3, _S3), 0.7210515360144488e-2),
+        (_b(0.6764410400114264), 0.7116355493117555e-2),
+        (_b(0.4174961227965453), 0.6753829486314477e-2),
+        (_b(0.1574676672039082), 0.7574394159054034e-2),
+        (_d(0.1403553811713183, 0.4493328323269557), 0.6991087353303262e-2),
+    ]),
+    170: (21, [
+        ((1.0, 0.0, 0.0), 0.5544842902037365e-2),
+        ((0.0, _S2, _S2), 0.6071332770670752e-2),
+        ((_S3, _S3, _S3), 0.6383674773515093e-2),
+        (_b(0.2551252621114134), 0.5183387587747790e-2),
+        (_b(0.6743601460362766), 0.6317929009813725e-2),
+        (_b(0.4318910696719410), 0.6201670006589077e-2),
+        (_c(0.2613931360335988), 0.5477143385137348e-2),
+        (_d(0.4990453161796037, 0.1446630744325115), 0.5968383987681156e-2),
+    ]),
+    194: (23, [
+        ((1.0, 0.0, 0.0), 0.1782340447244611e-2),
+        ((0.0, _S2, _S2), 0.5716905949977102e-2),
+        ((_S3, _S3, _S3), 0.5573383178848738e-2),
+        (_b(0.6712973442695226), 0.5608704082587997e-2),
+        (_b(0.2892465627575439), 0.5158237711805383e-2),
+        (_b(0.4446933178717437), 0.5518771467273614e-2),
+        (_b(0.1299335447650067), 0.4106777028169394e-2),
+        (_c(0.3457702197611283), 0.5051846064614808e-2),
+        (_d(0.1590417105383530, 0.8360360154824589), 0.5530248916233094e-2),
+    ]),
+    230: (25, [
+        ((1.0, 0.0, 0.0), -0.5522639919727325e-1),
+        ((_S3, _S3, _S3), 0.4450274607445226e-2),
+        (_b(0.4492044687397611), 0.4496841067921404e-2),
+        (_b(0.2520419490210201), 0.5049153450478750e-2),
+        (_b(0.6981906658447242), 0.3976408018051883e-2),
+        (_b(0.6587405243460960), 0.4401400650381014e-2),
+        (_b(0.4038544050097660e-1), 0.1724544350544401e-1),
+        (_c(0.5823842309715585), 0.4231083095357343e-2),
+        (_c(0.3545877390518688), 0.5198069864064399e-2),
+        (_d(0.2272181808998187, 0.4864661535886647), 0.4695720972568883e-2),
+    ]),
+    266: (27, [
+        ((1.0, 0.0, 0.0), -0.1313769127326952e-2),
+        ((0.0, _S2, _S2), -0.2522728704859336e-2),
+        ((_S3, _S3, _S3), 0.4186853881700583e-2),
+        (_b(0.7039373391585475), 0.5315167977810885e-2),
+        (_b(0.1012526248572414), 0.4047142377086219e-2),
+        (_b(0.4647448726420539), 0.4112482394406990e-2),
+        (_b(0.3277420654971629), 0.3595584899758782e-2),
+        (_b(0.6620338663699974), 0.4256131351428158e-2),
+        (_c(0.8506508083520399), 0.4229582700647240e-2),
+        (_d(0.3233484542692899, 0.1153112011009701), 0.4080914225780505e-2),
+        (_d(0.2314790158712601, 0.5244939240922365), 0.4071467593830964e-2),
+    ]),
+    302: (29, [
+        ((1.0, 0.0, 0.0), 0.8545911725128148e-3),
+        ((_S3, _S3, _S3), 0.3599119285025571e-2),
+        (_b(0.3515640345570105), 0.3449788424305883e-2),
+        (_b(0.6566329410219612), 0.3604822601419882e-2),
+        (_b(0.4729054132581005), 0.3576729661743367e-2),
+        (_b(0.9618308522614784e-1), 0.2352101413689164e-2),
+        (_b(0.2219645236294178), 0.3108953122413675e-2),
+        (_b(0.7011766416089545), 0.3650045807677255e-2),
+        (_c(0.2644152887060663), 0.2982344963171804e-2),
+        (_c(0.5718955891878961), 0.3600820932216460e-2),
+        (_d(0.2510034751770465, 0.8000727494073952), 0.3571540554273387e-2),
+        (_d(0.1233548532583327, 0.4127724083168531), 0.3392312205006170e-2),
+    ]),
+}
+
+
+def _octahedral_orbit(generator: tuple[float, float, float]) -> np.ndarray:
+    """All distinct signed permutations of a unit vector."""
+    points = {
+        tuple(round(s * v, 15) + 0.0 for s, v in zip(signs, perm))
+        for perm in itertools.permutations(generator)
+        for signs in itertools.product((1.0, -1.0), repeat=3)
+    }
+    return np.array(sorted(points))
+
+
+@lru_cache(maxsize=None)
+def lebedev_grid(n_points: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Lebedev angular quadrature on the unit sphere.
+
+    Args:
+        n_points: Number of points; one of 6, 14, 26, 38, 50, 74, 86, 110,
+            146, 170, 194, 230, 266, 302.
+
+    Returns:
+        (n, 3) unit vectors and (n,) weights summing to 4*pi.
+    """
+    if n_points not in _LEBEDEV_RULES:
+        raise ValueError(f"No Lebedev rule with {n_points} points (available: {', '.join(map(str, _LEBEDEV_RULES))}).")
+    _, orbits = _LEBEDEV_RULES[n_points]
+    points = [_octahedral_orbit(generator) for generator, _ in orbits]
+    weights = [np.full(len(p), w) for p, (_, w) in zip(points, orbits)]
+    return np.concatenate(points), 4.0 * math.pi * np.concatenate(weights)
+
+
+@lru_cache(maxsize=None)
+def angular_grid(degree: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Smallest angular grid that integrates spherical polynomials of `degree` exactly.
+
+    Uses a Lebedev rule up to degree 29 (302 points), otherwise a
+    Gauss-Legendre (cos theta) x uniform (phi) product grid.
+
+    Returns:
+        (n, 3) unit vectors and (n,) weights summing to 4*pi.
+    """
+    for n_points, (rule_degree, _) in sorted(_LEBEDEV_RULES.items()):
+        if rule_degree >= degree:
+            return lebedev_grid(n_points)
+    n_theta = (degree + 2) // 2
+    n_phi = degree + 1
+    cos_t, w_t = np.polynomial.legendre.leggauss(n_theta)
+    phi = 2.0 * math.pi * np.arange(n_phi) / n_phi
+    sin_t = np.sqrt(1.0 - cos_t ** 2)
+    points = np.column_stack([
+        np.outer(sin_t, np.cos(phi)).ravel(),
+        np.outer(sin_t, np.sin(phi)).ravel(),
+        np.repeat(cos_t, n_phi),
+    ])
+    return points, np.repeat(w_t, n_phi) * (2.0 * math.pi / n_phi)
+
+
+# -------------------------------------------------
+# Radial grids and pruning
+# -------------------------------------------------
+
+def atomic_radius(atomic_number: int) -> float:
+    """Bragg-Slater radius in Angstroms (covalent radius when not tabulated)."""
+    symbol = Z_TO_SYMBOL.get(atomic_number, "")
+    if symbol in BRAGG_SLATER_RADII:
+        return BRAGG_SLATER_RADII[symbol]
+    if symbol in COVALENT_RADII:
+        return COVALENT_RADII[symbol]
+    raise ValueError(f"No atomic radius available for Z={atomic_number}.")
+
+
+def radial_grid(n_points: int, scale: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Becke radial grid: Gauss-Chebyshev (second kind) mapped by r = R (1 + x) / (1 - x).
+
+    Args:
+        n_points: Number of radial points.
+        scale: Mapping radius R in Bohr (half the points lie inside R).
+
+    Returns:
+        Radii (n,) in Bohr and weights (n,) for integrals of f(r) r^2 dr.
+    """
+    i = np.arange(1, n_points + 1)
+    theta = i * math.pi / (n_points + 1)
+    x = np.cos(theta)
+    r = scale * (1.0 + x) / (1.0 - x)
+    w = math.pi / (n_points + 1) * np.sin(theta) * 2.0 * scale / (1.0 - x) ** 2
+    return r, w * r ** 2
+
+
+def default_radial_points(atomic_number: int) -> int:
+    """Number of radial points by period (denser for heavier atoms)."""
+    if atomic_number <= 2:
+        return 50
+    if atomic_number <= 10:
+        return 75
+    if atomic_number <= 18:
+        return 80
+    return 100
+
+
+def _pruned_degrees(r: np.ndarray, radius: float, degree: int) -> np.ndarray:
+    """
+    Angular degree per radial shell: coarse close to the nucleus, where the
+    density is nearly spherical, and full elsewhere (outer shells overlap
+    the Becke cell boundaries and need the full angular grid).
+    """
+    x = r / radius
+    return np.select([x < 0.25, x < 0.5], [min(degree, 7), min(degree, 11)], default=degree)
+
+
+# -------------------------------------------------
+# Becke partitioning
+# -------------------------------------------------
+
+# Becke cells below this fraction of the largest cell at a point are left
+# out of the partition there (weights change by about this relative amount).
+_BECKE_TOLERANCE = 1e-12
+_BECKE_BLOCK_POINTS = 64
+# Atoms nearest a block whose cell factors bound the other cells there.
+_BECKE_NEIGHBOURS = 8
+
+
+def _spatial_blocks(points: np.ndarray, max_points: int, max_span: float = 4.0, min_points: int = 16) -> list[np.ndarray]:
+    """
+    Split points by repeated median cuts along the longest axis.
+
+    Atom-centred grids are far from uniform, so blocks are cut until they
+    hold at most `max_points` points and, unless down to `min_points`, span
+    at most `max_span` along every axis.
+    """
+    blocks, stack = [], [np.arange(points.shape[0])]
+    while stack:
+        index = stack.pop()
+        coords = points[index]
+        span = coords.max(axis=0) - coords.min(axis=0)
+        if len(index) <= max_points and (len(index) <= min_points or span.max() <= max_span):
+            blocks.append(index)
+            continue
+        axis = int(np.argmax(span))
+        half = len(index) // 2
+        order = np.argpartition(coords[:, axis], half)
+        stack.extend((index[order[:half]], index[order[half:]]))
+    return blocks
+
+
+def _becke_step(mu: np.ndarray, a: np.ndarray) -> np.ndarray:
+    """
+    Becke cell function s = (1 - f(f(f(nu)))) / 2 at nu = mu + a (1 - mu^2).
+
+    Computed in place on `mu`, which is returned. For |a| <= 1/2 it
+    decreases with mu on [-1, 1].
+    """
+    t = np.multiply(mu, mu)
+    np.subtract(1.0, t, out=t)
+    t *= a
+    mu += t
+    for _ in range(3):
+        np.multiply(mu, mu, out=t)
+        t *= -0.5
+        t += 1.5
+        mu *= t
+    mu *= -0.5
+    mu += 0.5
+    return mu
+
+
+def _becke_pairs(coords: np.ndarray, radii: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Interatomic distances (diagonal set to one) and Becke size adjustments `a`."""
+    r_ab = np.sqrt(np.sum((coords[:, None, :] - coords[None, :, :]) ** 2, axis=2))
+    np.fill_diagonal(r_ab, 1.0)
+
+    # Atomic size adjustment (Becke 1988, appendix).
+    chi = radii[:, None] / radii[None, :]
+    u = (chi - 1.0) / (chi + 1.0)
+    a = np.clip(u / (u * u - 1.0), -0.5, 0.5)
+    return r_ab, a
+
+
+def _becke_cell_weights(
+    points: np.ndarray,
+    coords: np.ndarray,
+    r_ab: np.ndarray,
+    a: np.ndarray,
+    atom: int,
+) -> np.ndarray:
+    """
+    Becke fuzzy-cell weight of `atom` at each point (coordinates in Bohr).
+
+    Cell functions are products of factors s <= 1, and s_ji = 1 - s_ij
+    (the size adjustments are antisymmetric), so the factors between all
+    atoms and the `_BECKE_NEIGHBOURS` atoms nearest a block of points give
+    both an upper bound on every cell and the exact cells of those
+    neighbours. Points where `atom` cannot reach `_BECKE_TOLERANCE` of the
+    largest neighbour cell get zero weight, and the block normalizes over
+    the few cells that can, so the cost per point grows linearly rather
+    than quadratically with the number of atoms.
+    """
+    n_atoms = coords.shape[0]
+    if n_atoms == 1:
+        return np.ones(points.shape[0])
+    k = min(_BECKE_NEIGHBOURS, n_atoms)
+    weights = np.zeros(points.shape[0])
+    for index in _spatial_blocks(points, _BECKE_BLOCK_POINTS):
+        block = points[index]
+        dist = np.sqrt(np.sum((block[:, None, :] - coords[None, :, :]) ** 2, axis=2))
+        near = np.argpartition(np.sum((coords - block.mean(axis=0)) ** 2, axis=1), k - 1)[:k]
+        s = _becke_step((dist[:, near].T[:, :, None] - dist[None, :, :]) / r_ab[near, None, :], a[near, None, :])
+        s[np.arange(k), :, near] = 1.0
+        floor = np.prod(s, axis=2).max(axis=0)
+        s[np.arange(k), :, near] = 0.0
+        np.subtract(1.0, s, out=s)
+        bound = np.prod(s, axis=0)
+        alive = bound[:, atom] >= _BECKE_TOLERANCE * floor
+        if not alive.any():
+            continue
+        index, dist = index[alive], dist[alive]
+        cells = np.union1d(np.flatnonzero(np.any(bound[alive] >= _BECKE_TOLERANCE * floor[alive, None], axis=0)), [atom])
+
+        s = _becke_step((dist[:, cells, None] - dist[:, None, :]) / r_ab[cells], a[cells])
+        s[:, np.arange(len(cells)), cells] = 1.0
+        cell = np.prod(s, axis=2)
+        total = cell.sum(axis=1)
+        own = cell[:, int(np.searchsorted(cells, atom))]
+        weights[index] = np.divide(own, total, out=np.zeros_like(total), where=total > 0.0)
+    return weights
+
+
+def molecular_grid(
+    atomic_numbers: list[int],
+    coordinates: list[tuple[float, float, float]],
+    radial_points: int | None = None,
+    angular_degree: int = 29,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Atom-centred Becke integration grid for a molecule.
+
+    Each atom gets a Becke radial grid scaled by its Bragg-Slater radius and
+    pruned Lebedev shells; weights include the fuzzy Voronoi partition, so
+    sum(w * f) integrates f over all space and grouping by atom gives
+    Becke atomic contributions.
+
+    Args:
+        atomic_numbers: Atomic numbers.
+        coordinates: Atomic coordinates in Angstroms.
+        radial_points: Radial points per atom; element-dependent when omitted.
+        angular_degree: Angular exactness in the valence region.
+
+    Returns:
+        points (N, 3) in Angstroms, weights (N,) in Bohr^3, and the owning
+        atom index (N,) of every point (0-based).
+    """
+    coords = np.asarray(coordinates, dtype=float).reshape(-1, 3) / BOHR_TO_ANGSTROM
+    if len(atomic_numbers) != coords.shape[0]:
+        raise ValueError("atomic_numbers and coordinates differ in length.")
+    radii = np.array([atomic_radius(int(z)) for z in atomic_numbers]) / BOHR_TO_ANGSTROM
+    r_ab, a = _becke_pairs(coords, radii)
+
+    all_points, all_weights, owners = [], [], []
+    for atom, z in enumerate(atomic_numbers):
+        n_rad = radial_points or default_radial_points(int(z))
+        scale = radii[atom] if int(z) == 1 else 0.5 * radii[atom]
+        r, w_r = radial_grid(n_rad, scale)
+        degrees = _pruned_degrees(r, radii[atom], angular_degree)
+        shells_p, shells_w = [], []
+        for degree in np.unique(degrees):
+            sel = degrees == degree
+            unit, w_ang = angular_grid(int(degree))
+            shells_p.append((r[sel, None, None] * unit[None, :, :]).reshape(-1, 3))
+            shells_w.append(np.outer(w_r[sel], w_ang).ravel())
+        points = np.concatenate(shells_p) + coords[atom]
+        weights = np.concatenate(shells_w) * _becke_cell_weights(points, coords, r_ab, a, atom)
+        keep = weights > 0.0
+        all_points.append(points[keep])
+        all_weights.append(weights[keep])
+        owners.append(np.full(int(keep.sum()), atom, dtype=np.intp))
+
+    return (
+        np.concatenate(all_points) * BOHR_TO_ANGSTROM,
+        np.concatenate(all_weights),
+        np.concatenate(owners),
+    )
+
+
+def atomic_integrals(values: np.ndarray, weights: np.ndarray, owners: np.ndarray, n_atoms: int) -> np.ndarray:
+    """Sum weighted values per owning atom (Becke atomic integrals)."""
+    return np.bincount(owners, weights=np.asarray(values) * weights, minlength=n_atoms)
@@ -4,7 +4,7 @@ from typing import Callable
 from . import __version__  # type: ignore
 from . import commands as cmd  # type: ignore
 from . import utils  # type: ignore
-from .fchk import parse_fchk_arrays, parse_fchk_scalars, print_atom_table  # type: ignore
+from .fchk import parse_fchk_arrays, parse_fchk_charges, parse_fchk_scalars, print_atom_table  # type: ignore
 from .geometry import molecular_formula  # type: ignore
 
 OPENWFN_ASCII = [
@@ -237,6 +237,7 @@ def run_input_page(title: str, description: str, action: Callable[[], None]) ->
 def run_interactive(lines, filename):
     scalars = parse_fchk_scalars(lines)
     atomic_numbers, coordinates = parse_fchk_arrays(lines)
+    charges = parse_fchk_charges(lines)
     menu_filename = str(Path(filename).name)
 
     def show_summary() -> None:
@@ -283,7 +284,7 @@ def run_interactive(lines, filename):
         cmd.cmd_bonds(atomic_numbers, coordinates)
 
     def show_graph() -> None:
-        cmd.cmd_graph(atomic_numbers, coordinates)
+        cmd.cmd_graph(atomic_numbers, coordinates, charges)
 
     while True:
         print_landing_page(menu_filename, atomic_numbers, scalars)
@@ -0,0 +1,180 @@
+# src/openwfn/isosurface.py
+
+from typing import Any
+
+import numpy as np  # type: ignore
+
+from .grid import RegularGrid  # type: ignore
+
+# Cube corners as (di, dj, dk) and the twelve cube edges as corner pairs.
+_CORNERS = np.array(
+    [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0], [0, 0, 1], [1, 0, 1], [0, 1, 1], [1, 1, 1]],
+    dtype=np.int64,
+)
+_EDGES = np.array(
+    [[0, 1], [2, 3], [4, 5], [6, 7], [0, 2], [1, 3], [4, 6], [5, 7], [0, 4], [1, 5], [2, 6], [3, 7]],
+    dtype=np.int64,
+)
+
+
+def _cell_vertices(g: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Surface-nets vertices of one slab of cells.
+
+    Args:
+        g: (m + 1, ny, nz) field shifted so the surface is g = 0.
+
+    Returns:
+        Flat (C-order) indices of the active cells within the slab and their
+        vertex positions in slab lattice coordinates.
+    """
+    m, ny, nz = g.shape[0] - 1, g.shape[1] - 1, g.shape[2] - 1
+    inside = g > 0.0
+    n_inside = np.zeros((m, ny, nz), dtype=np.uint8)
+    for di, dj, dk in _CORNERS:
+        n_inside += inside[di:di + m, dj:dj + ny, dk:dk + nz]
+    active = np.flatnonzero((n_inside > 0) & (n_inside < 8))
+    ijk = np.column_stack(np.unravel_index(active, (m, ny, nz)))
+    corner_ijk = ijk[:, None, :] + _CORNERS
+    values = g[corner_ijk[..., 0], corner_ijk[..., 1], corner_ijk[..., 2]]
+
+    g0, g1 = values[:, _EDGES[:, 0]], values[:, _EDGES[:, 1]]
+    crossing = (g0 > 0.0) != (g1 > 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(crossing, g0 / (g0 - g1), 0.0)
+    points = _CORNERS[_EDGES[:, 0]] + t[:, :, None] * (_CORNERS[_EDGES[:, 1]] - _CORNERS[_EDGES[:, 0]])
+    weights = crossing[:, :, None]
+    local = np.sum(points * weights, axis=1) / np.count_nonzero(crossing, axis=1)[:, None]
+    return active, ijk + local
+
+
+def _quads(inside: np.ndarray, i0: int, n_cells: tuple[int, int, int], nx: int) -> np.ndarray:
+    """
+    Quads (as global cell keys) around every sign-changing lattice edge whose
+    lower end lies in planes `i0 .. i0 + m - 1` of the slab.
+
+    Quads are ordered counter-clockwise seen from outside (where g <= 0).
+    """
+    m = inside.shape[0] - 1
+    _, ny, nz = inside.shape
+    cy, cz = n_cells[1], n_cells[2]
+
+    def keys(i: np.ndarray, j: np.ndarray, k: np.ndarray) -> np.ndarray:
+        return (i * cy + j) * cz + k
+
+    quads = []
+    # Edges along x: (i, j, k) -> (i + 1, j, k), shared by cells (i, j-1..j, k-1..k).
+    change = inside[:m, 1:ny - 1, 1:nz - 1] != inside[1:m + 1, 1:ny - 1, 1:nz - 1]
+    i, j, k = np.nonzero(change)
+    i, j, k = i + i0, j + 1, k + 1
+    flip = ~inside[i - i0, j, k]
+    quads.append((keys(i, j - 1, k - 1), keys(i, j, k - 1), keys(i, j, k), keys(i, j - 1, k), flip))
+
+    lo = max(i0, 1) - i0
+    hi = min(i0 + m, nx - 1) - i0
+    if hi > lo:
+        plane = inside[lo:hi]
+        # Edges along y: shared by cells (i-1..i, j, k-1..k); (b, c) = (z, x).
+        change = plane[:, 1:ny, 1:nz - 1] != plane[:, :ny - 1, 1:nz - 1]
+        i, j, k = np.nonzero(change)
+        i, k = i + lo + i0, k + 1
+        flip = ~plane[i - lo - i0, j, k]
+        quads.append((keys(i - 1, j, k - 1), keys(i - 1, j, k), keys(i, j, k), keys(i, j, k - 1), flip))
+        # Edges along z: shared by cells (i-1..i, j-1..j, k); (b, c) = (x, y).
+        change = plane[:, 1:ny - 1, 1:nz] != plane[:, 1:ny - 1, :nz - 1]
+        i, j, k = np.nonzero(change)
+        i, j = i + lo + i0, j + 1
+        flip = ~plane[i - lo - i0, j, k]
+        quads.append((keys(i - 1, j - 1, k), keys(i, j - 1, k), keys(i, j, k), keys(i - 1, j, k), flip))
+
+    out = []
+    for a, b, c, d, flip in quads:
+        q = np.column_stack([a, b, c, d])
+        q[flip] = q[flip][:, ::-1]
+        out.append(q)
+    return np.concatenate(out) if out else np.empty((0, 4), dtype=np.int64)
+
+
+def extract_isosurface(
+    values: Any,
+    grid: RegularGrid,
+    iso: float,
+    block_planes: int = 32,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Triangulated isosurface of a scalar field on a regular grid (surface nets).
+
+    The surface encloses the region beyond `iso` (f > iso for iso >= 0,
+    f < iso for negative iso), so orbital lobes are extracted with +iso and
+    -iso. Every grid cell the surface crosses contributes one vertex (the
+    mean of its edge crossings), which makes the mesh watertight and free of
+    duplicate vertices. The volume is read in slabs of `block_planes`
+    planes, so `values` may be a memory map.
+
+    Args:
+        values: (N,) values in grid order, or an (nx, ny, nz) array.
+        grid: `RegularGrid` the values were evaluated on.
+        iso: Iso-value.
+        block_planes: Number of x-planes processed at once.
+
+    Returns:
+        (V, 3) vertex coordinates in Angstroms and (F, 3) triangle vertex
+        indices, wound counter-clockwise seen from outside.
+    """
+    volume = np.asarray(values).reshape(grid.shape)
+    nx, ny, nz = grid.shape
+    if min(grid.shape) < 2:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+    n_cells = (nx - 1, ny - 1, nz - 1)
+    sign = -1.0 if iso < 0.0 else 1.0
+    step = max(1, int(block_planes))
+
+    cell_keys, positions, quads = [], [], []
+    for i0 in range(0, nx - 1, step):
+        i1 = min(i0 + step, nx - 1)
+        g = sign * (np.asarray(volume[i0:i1 + 1], dtype=float) - iso)
+        active, local = _cell_vertices(g)
+        cell_keys.append(active + i0 * n_cells[1] * n_cells[2])
+        positions.append(local + [i0, 0, 0])
+        quads.append(_quads(g > 0.0, i0, n_cells, nx))
+
+    keys = np.concatenate(cell_keys)
+    lattice = np.concatenate(positions)
+    quad = np.searchsorted(keys, np.concatenate(quads))
+    faces = np.concatenate([quad[:, [0, 1, 2]], quad[:, [0, 2, 3]]]).astype(np.int64)
+    vertices = grid.origin + lattice @ grid.vectors
+    return vertices, faces
+
+
+def mesh_normals(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Area-weighted unit vertex normals of a triangle mesh."""
+    v = np.asarray(vertices, dtype=float)
+    f = np.asarray(faces, dtype=np.int64)
+    face_normals = np.cross(v[f[:, 1]] - v[f[:, 0]], v[f[:, 2]] - v[f[:, 0]])
+    normals = np.zeros_like(v)
+    for corner in range(3):
+        np.add.at(normals, f[:, corner], face_normals)
+    length = np.linalg.norm(normals, axis=1, keepdims=True)
+    return np.divide(normals, length, out=np.zeros_like(normals), where=length > 0.0)
+
+
+def isosurfaces(
+    fields: dict[str, Any],
+    grid: RegularGrid,
+    levels: list[float],
+) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """
+    Positive and negative isosurfaces of several fields at several levels.
+
+    Each field yields `<name>_+<level>` and `<name>_-<level>` meshes (e.g.
+    the two lobes of an orbital); empty meshes, such as negative levels of
+    a density, are omitted.
+    """
+    meshes = {}
+    for name, values in fields.items():
+        for level in levels:
+            for iso in (abs(level), -abs(level)) if level else (0.0,):
+                vertices, faces = extract_isosurface(values, grid, iso)
+                if len(faces):
+                    meshes[f"{name}_{iso:+g}"] = (vertices, faces)
+    return meshes
@@ -1,8 +1,13 @@
 # src/openwfn/mo.py
 
+import re
 import numpy as np  # type: ignore
+from collections.abc import Mapping
 from typing import Dict, List, Any
 
+from .basis import iter_basis_blocks, points_per_block, working_dtype  # type: ignore
+from .density import DEFAULT_MEMORY_BUDGET  # type: ignore
+
 def get_homo_lumo_indices(n_alpha_electrons: int, n_beta_electrons: int) -> Dict[str, int]:
     """
     Determine the HOMO and LUMO indices based on the number of electrons.
@@ -21,34 +26,135 @@ def get_homo_lumo_indices(n_alpha_electrons: int, n_beta_electrons: int) -> Dict
     return indices
 
 
+_MO_TOKEN = re.compile(r"^(HOMO|LUMO)\s*([+-]\s*\d+)?$|^(\d+)$", re.IGNORECASE)
+
+
+def _resolve_mo_token(token: str, homo: int, lumo: int) -> int:
+    """Convert `HOMO-2`, `LUMO+1` or a 1-based integer into a 0-based index."""
+    match = _MO_TOKEN.match(token.strip())
+    if not match:
+        raise ValueError(f"Invalid MO selection: '{token}' (use e.g. 5, HOMO, LUMO+2 or HOMO-3:LUMO+3).")
+    if match.group(3) is not None:
+        return int(match.group(3)) - 1
+    base = homo if match.group(1).upper() == "HOMO" else lumo
+    shift = int(match.group(2).replace(" ", "")) if match.group(2) else 0
+    return base + shift
+
+
+def parse_mo_selection(
+    selection: str,
+    n_alpha_electrons: int,
+    n_beta_electrons: int,
+    n_mo: int,
+    spin: str = "alpha",
+) -> List[int]:
+    """
+    Parse an MO selection such as `HOMO-5:LUMO+5`, `HOMO,LUMO` or `3:7`.
+
+    Integers are 1-based (as printed by Gaussian); ranges are inclusive.
+
+    Returns:
+        Sorted list of unique 0-based MO indices.
+    """
+    indices = get_homo_lumo_indices(n_alpha_electrons, n_beta_electrons)
+    homo = indices.get(f"homo_{spin}", indices.get("homo_alpha", -1))
+    lumo = indices.get(f"lumo_{spin}", indices.get("lumo_alpha", 0))
+
+    selected: set[int] = set()
+    for part in selection.split(","):
+        if ":" in part:
+            start_token, stop_token = part.split(":", 1)
+            start = _resolve_mo_token(start_token, homo, lumo)
+            stop = _resolve_mo_token(stop_token, homo, lumo)
+            selected.update(range(min(start, stop), max(start, stop) + 1))
+        else:
+            selected.add(_resolve_mo_token(part, homo, lumo))
+
+    out_of_range = sorted(i + 1 for i in selected if i < 0 or i >= n_mo)
+    if out_of_range:
+        raise ValueError(f"MO index out of range: {out_of_range[0]} (valid range: 1..{n_mo})")
+    return sorted(selected)
+
+
+def mo_label(mo_index: int, homo: int) -> str:
+    """Return a field label such as `MO_5_HOMO` or `MO_7_LUMO+1` for a 0-based index."""
+    if mo_index <= homo:
+        rel = "HOMO" if mo_index == homo else f"HOMO-{homo - mo_index}"
+    else:
+        rel = "LUMO" if mo_index == homo + 1 else f"LUMO+{mo_index - homo - 1}"
+    return f"MO_{mo_index + 1}_{rel}"
+
+
+def mo_coefficient_matrix(mo_coeffs: List[float] | np.ndarray, n_basis: int) -> np.ndarray:
+    """
+    Reshape FCHK MO coefficients into an (n_basis, n_mo) matrix.
+
+    FCHK stores coefficients orbital by orbital, i.e. C[i * n_basis + mu].
+    """
+    flat = np.asarray(mo_coeffs, dtype=float)
+    if flat.ndim == 2:
+        return flat
+    if n_basis == 0 or flat.size % n_basis != 0:
+        raise ValueError(f"MO coefficient count {flat.size} is not a multiple of basis size {n_basis}.")
+    return flat.reshape(-1, n_basis).T
+
+
+def evaluate_mos(
+    r_points: np.ndarray,
+    mo_indices: List[int],
+    mo_coeffs: List[float] | np.ndarray,
+    basis: Mapping[str, Any],
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+) -> np.ndarray:
+    """
+    Evaluate several Molecular Orbitals at given Cartesian points in one pass.
+
+    The basis is evaluated once per block of points and multiplied by the
+    (nbasis, k) slice of selected coefficients, so k orbitals cost about as
+    much as one.
+
+    Args:
+        r_points: (N, 3) matrix of grid points in Angstroms.
+        mo_indices: 0-based indices of the MOs to evaluate.
+        mo_coeffs: Flat FCHK coefficient list or an (nbasis, nmo) matrix.
+        basis: Compiled basis from `compile_basis` or a `BasisSet`.
+        memory_budget: Approximate bytes of transient memory per block.
+
+    Returns:
+        (N, k) array of MO amplitudes, one column per requested index, in
+        single precision when `r_points` is float32.
+    """
+    C = mo_coefficient_matrix(mo_coeffs, basis["n_basis"])
+    if C.shape[0] != basis["n_basis"]:
+        raise ValueError(f"MO coefficient rows {C.shape[0]} do not match basis size {basis['n_basis']}.")
+    dtype = working_dtype(r_points)
+    C_sel = C[:, list(mo_indices)].astype(dtype)
+
+    pts = np.asarray(r_points, dtype=dtype).reshape(-1, 3)
+    psi = np.zeros((pts.shape[0], C_sel.shape[1]), dtype=dtype)
+    max_points = points_per_block(basis, memory_budget, extra_columns=C_sel.shape[1], itemsize=pts.itemsize)
+    for index, phi, ao_index in iter_basis_blocks(pts, basis, max_points=max_points):
+        if len(ao_index):
+            psi[index] = phi @ C_sel[ao_index]
+    return psi
+
+
 def evaluate_mo(
     r_points: np.ndarray,
     mo_index: int,
-    mo_coeffs: List[float],
-    basis_data: Dict[str, List[Any]],
-    coordinates: List[tuple[float, float, float]]
+    mo_coeffs: List[float] | np.ndarray,
+    basis: Mapping[str, Any],
 ) -> np.ndarray:
     """
     Evaluate a specific Molecular Orbital at given Cartesian points.
     
     Args:
-        r_points: (N, 3) matrix of grid points.
+        r_points: (N, 3) matrix of grid points in Angstroms.
         mo_index: 0-based index of the MO to evaluate.
         mo_coeffs: Flat list of MO coefficients.
-        basis_data: Parsed basis set data from FCHK.
-        coordinates: Atomic coordinates from FCHK.
+        basis: Compiled basis from `compile_basis` or a `BasisSet`.
         
     Returns:
         (N,) array of MO amplitude values at each point.
     """
-    # This is a stub for the full evaluation routine which would:
-    # 1. Iterate over contracted shells
-    # 2. Extract specific MO coefficients for each basis function
-    # 3. Call eval_s_type_gto / eval_p_type_gto etc.
-    # 4. Sum up: Psi_i(r) = sum_mu C_{mu, i} * Phi_mu(r)
-
-    N_points = r_points.shape[0]
-    psi = np.zeros(N_points)
-    
-    # Needs full shell iteration implemented here.
-    return psi
+    return evaluate_mos(r_points, [mo_index], mo_coeffs, basis)[:, 0]
@@ -0,0 +1,180 @@
+# src/openwfn/octree.py
+
+from typing import Any, Callable
+
+import numpy as np  # type: ignore
+
+# Corner offsets of a cube in VTK_VOXEL order (x varies fastest).
+_CORNERS = np.array(
+    [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0], [0, 0, 1], [1, 0, 1], [0, 1, 1], [1, 1, 1]],
+    dtype=np.int64,
+)
+
+
+def _lattice_keys(ijk: np.ndarray, dims: np.ndarray) -> np.ndarray:
+    """Pack integer lattice coordinates into unique int64 keys."""
+    return (ijk[..., 0] * dims[1] + ijk[..., 1]) * dims[2] + ijk[..., 2]
+
+
+def build_octree(
+    coordinates: list[tuple[float, float, float]],
+    evaluate: Callable[[np.ndarray], np.ndarray],
+    margin: float = 3.0,
+    base_spacing: float = 0.8,
+    max_level: int = 4,
+    tol: float = 1e-3,
+    rel_tol: float = 1e-2,
+) -> dict[str, Any]:
+    """
+    Build an adaptive octree grid around a molecule for a scalar field.
+
+    The box is first covered with cubes of side `base_spacing`. At every
+    level the field is evaluated (in one call) at the new cell corners and
+    cell centres; a cell is split into eight children when trilinear
+    interpolation of its corners misses the centre value by more than
+    `tol + rel_tol * |f(centre)|`. Smooth or empty regions therefore stay
+    coarse while cusps and valence shells are refined down to
+    `base_spacing / 2**max_level`.
+
+    Args:
+        coordinates: Atomic coordinates in Angstroms.
+        evaluate: Field callback taking (n, 3) points in Angstroms and
+            returning (n,) or (n, k) values; refinement uses the first column.
+        margin: Padding around the atoms in Angstroms.
+        base_spacing: Side of the coarsest cells in Angstroms.
+        max_level: Number of refinement levels.
+        tol: Absolute interpolation error that triggers refinement.
+        rel_tol: Relative interpolation error that triggers refinement.
+
+    Returns:
+        Dictionary with `points` (P, 3) leaf vertices in Angstroms, `values`
+        (P,) or (P, k), `cells` (L, 8) vertex indices in VTK_VOXEL order,
+        `levels` (L,), and the lattice description (`origin`, `unit`,
+        `dims`, `max_level`) used by `resample_octree`. `n_evaluated` counts
+        every point passed to `evaluate`.
+    """
+    if max_level < 0:
+        raise ValueError("max_level must be non-negative.")
+    coords = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+    if coords.shape[0] == 0:
+        raise ValueError("At least one atom is required to build an octree grid.")
+
+    lo = coords.min(axis=0) - margin
+    n_base = np.maximum(np.ceil((coords.max(axis=0) + margin - lo) / base_spacing), 1).astype(np.int64)
+    scale = 2 ** max_level
+    unit = base_spacing / scale
+    dims = n_base * scale + 1
+
+    # Sorted cache of every evaluated lattice point.
+    known_keys = np.empty(0, dtype=np.int64)
+    known_values: np.ndarray | None = None
+    n_evaluated = 0
+
+    def lookup(ijk: np.ndarray) -> np.ndarray:
+        nonlocal known_keys, known_values, n_evaluated
+        keys = _lattice_keys(ijk, dims)
+        flat = keys.ravel()
+        new = np.setdiff1d(flat, known_keys)
+        if len(new):
+            new_ijk = np.column_stack([new // (dims[1] * dims[2]), (new // dims[2]) % dims[1], new % dims[2]])
+            values = np.asarray(evaluate(lo + new_ijk * unit), dtype=float)
+            n_evaluated += len(new)
+            merged = np.concatenate([known_keys, new])
+            order = np.argsort(merged, kind="stable")
+            known_keys = merged[order]
+            known_values = values if known_values is None else np.concatenate([known_values, values])[order]
+        assert known_values is not None
+        return known_values[np.searchsorted(known_keys, flat)].reshape(keys.shape + known_values.shape[1:])
+
+    axes = [np.arange(n) * scale for n in n_base]
+    cells = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+    leaves: list[tuple[np.ndarray, int]] = []
+    for level in range(max_level + 1):
+        size = scale >> level
+        if level == max_level or size < 2:
+            leaves.append((cells, level))
+            break
+        corners = cells[:, None, :] + _CORNERS * size
+        centre = cells + size // 2
+        both = lookup(np.concatenate([corners, centre[:, None, :]], axis=1))
+        both = both if both.ndim == 2 else both[..., 0]
+        f_centre = both[:, 8]
+        error = np.abs(f_centre - both[:, :8].mean(axis=1))
+        refine = error > tol + rel_tol * np.abs(f_centre)
+        leaves.append((cells[~refine], level))
+        cells = (cells[refine][:, None, :] + _CORNERS * (size // 2)).reshape(-1, 3)
+        if len(cells) == 0:
+            break
+
+    leaf_ijk = np.concatenate([c[:, None, :] + _CORNERS * (scale >> lvl) for c, lvl in leaves])
+    levels = np.concatenate([np.full(len(c), lvl, dtype=np.int64) for c, lvl in leaves])
+    vertex_values = lookup(leaf_ijk)
+    keys, inverse = np.unique(_lattice_keys(leaf_ijk, dims).ravel(), return_inverse=True)
+    first = np.zeros(len(keys), dtype=np.intp)
+    first[inverse] = np.arange(inverse.size)
+    vertex_ijk = leaf_ijk.reshape(-1, 3)[first]
+    return {
+        "points": lo + vertex_ijk * unit,
+        "values": vertex_values.reshape((-1,) + vertex_values.shape[2:])[first],
+        "cells": inverse.reshape(-1, 8).astype(np.int64),
+        "levels": levels,
+        "origin": lo,
+        "unit": unit,
+        "dims": dims,
+        "max_level": max_level,
+        "n_evaluated": n_evaluated,
+    }
+
+
+def resample_octree(tree: dict[str, Any], r_points: np.ndarray) -> np.ndarray:
+    """
+    Trilinearly interpolate octree values at arbitrary points.
+
+    Each point is located in its leaf cell (one hash lookup per level) and
+    interpolated from that cell's eight corners; points outside the octree
+    box get zero.
+
+    Args:
+        tree: Output of `build_octree`.
+        r_points: (N, 3) points in Angstroms.
+
+    Returns:
+        (N,) or (N, k) interpolated values.
+    """
+    pts = np.asarray(r_points, dtype=float).reshape(-1, 3)
+    values = tree["values"]
+    out = np.zeros((pts.shape[0],) + values.shape[1:])
+    dims = tree["dims"]
+    scale = 2 ** tree["max_level"]
+    lattice = (pts - tree["origin"]) / tree["unit"]
+    inside = np.all((lattice >= 0) & (lattice <= dims - 1), axis=1)
+
+    corner0 = tree["points"][tree["cells"][:, 0]]
+    cell_ijk = np.rint((corner0 - tree["origin"]) / tree["unit"]).astype(np.int64)
+    for level in np.unique(tree["levels"]):
+        size = scale >> int(level)
+        members = np.nonzero(tree["levels"] == level)[0]
+        cell_keys = _lattice_keys(cell_ijk[members], dims)
+        order = np.argsort(cell_keys)
+        cell_keys = cell_keys[order]
+
+        candidates = np.nonzero(inside)[0]
+        ijk = np.minimum((lattice[candidates] // size).astype(np.int64) * size, dims - 1 - size)
+        keys = _lattice_keys(ijk, dims)
+        pos = np.minimum(np.searchsorted(cell_keys, keys), len(cell_keys) - 1)
+        hit = cell_keys[pos] == keys
+        if not np.any(hit):
+            continue
+        idx = candidates[hit]
+        cells = tree["cells"][members[order[pos[hit]]]]
+        t = (lattice[idx] - ijk[hit]) / size
+        weights = np.ones((len(idx), 8))
+        for c, (dx, dy, dz) in enumerate(_CORNERS):
+            weights[:, c] = (
+                (t[:, 0] if dx else 1.0 - t[:, 0])
+                * (t[:, 1] if dy else 1.0 - t[:, 1])
+                * (t[:, 2] if dz else 1.0 - t[:, 2])
+            )
+        out[idx] = np.einsum("nc,nc...->n...", weights, values[cells])
+        inside[idx] = False
+    return out
@@ -0,0 +1,342 @@
+# src/openwfn/parallel.py
+
+import os
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable
+
+import numpy as np  # type: ignore
+
+from .basis import partition_points, working_dtype  # type: ignore
+from .cache import BasisBlockCache, active_basis_cache, set_basis_cache  # type: ignore
+from .grid import RegularGrid  # type: ignore
+from .density import DEFAULT_MEMORY_BUDGET, SPIN_DENSITY_FIELDS, compute_density, compute_spin_densities  # type: ignore
+from .mo import evaluate_mos  # type: ignore
+from .promolecular import promolecular_density  # type: ignore
+from .symmetry import lattice_representatives  # type: ignore
+
+
+def _density_kernel(points: np.ndarray, matrix: np.ndarray, basis: Mapping[str, Any], memory_budget: int) -> np.ndarray:
+    return compute_density(points, matrix, basis, memory_budget=memory_budget)
+
+
+def _spin_density_kernel(points: np.ndarray, matrix: np.ndarray, basis: Mapping[str, Any], memory_budget: int) -> np.ndarray:
+    n_basis = matrix.shape[0]
+    fields = compute_spin_densities(points, matrix[:, :n_basis], matrix[:, n_basis:], basis, memory_budget=memory_budget)
+    return np.column_stack([fields[name] for name in SPIN_DENSITY_FIELDS])
+
+
+def _mo_kernel(points: np.ndarray, matrix: np.ndarray, basis: Mapping[str, Any], memory_budget: int) -> np.ndarray:
+    return evaluate_mos(points, list(range(matrix.shape[1])), matrix, basis, memory_budget=memory_budget)
+
+
+def _promolecular_kernel(points: np.ndarray, matrix: np.ndarray, basis: Mapping[str, Any], memory_budget: int) -> np.ndarray:
+    del matrix
+    return promolecular_density(points, basis, memory_budget=memory_budget)
+
+
+# Grid kernels: f(points, matrix, basis, memory_budget) -> (n,) or (n, k) values.
+# `promolecular` takes a compiled promolecule in place of the basis and ignores the matrix.
+GRID_KERNELS: dict[str, Callable[..., np.ndarray]] = {
+    "density": _density_kernel,
+    "spin_density": _spin_density_kernel,
+    "mo": _mo_kernel,
+    "promolecular": _promolecular_kernel,
+}
+
+# Kernels whose values are invariant under the molecule's symmetry operations.
+SYMMETRIC_KERNELS = ("density", "spin_density", "promolecular")
+
+# Per-worker state populated once by the pool initializer.
+_WORKER: dict[str, Any] = {}
+
+
+def _attach(spec: tuple[str, tuple[int, ...], str]) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Attach to a shared-memory block described by (name, shape, dtype)."""
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _init_worker(
+    kernel: str,
+    basis: Mapping[str, Any],
+    specs: dict[str, tuple[str, tuple[int, ...], str]],
+    memory_budget: int,
+    cache_spec: tuple[int, str] | None = None,
+) -> None:
+    """
+    Attach shared arrays and keep the (small) compiled basis for all tasks.
+
+    `cache_spec` (max_bytes, spill_dir) gives the worker its own basis block
+    cache over the parent's spill directory.
+    """
+    _WORKER.clear()
+    if cache_spec is not None:
+        set_basis_cache(BasisBlockCache(*cache_spec))
+    _WORKER["kernel"] = GRID_KERNELS[kernel]
+    _WORKER["basis"] = basis
+    _WORKER["memory_budget"] = memory_budget
+    for key, spec in specs.items():
+        shm, array = _attach(spec)
+        _WORKER[f"{key}_shm"] = shm
+        _WORKER[key] = array
+
+
+def _run_task(start: int, stop: int) -> int:
+    """Evaluate one block of the spatially ordered points into the shared output."""
+    index = _WORKER["order"][start:stop]
+    values = _WORKER["kernel"](_WORKER["points"][index], _WORKER["matrix"], _WORKER["basis"], _WORKER["memory_budget"])
+    _WORKER["output"][index] = values
+    return stop - start
+
+
+def _shared_copy(array: np.ndarray, blocks: list[shared_memory.SharedMemory]) -> tuple[np.ndarray, tuple[str, tuple[int, ...], str]]:
+    """Copy an array into a new shared-memory block and describe it for workers."""
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    blocks.append(shm)
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[...] = array
+    return view, (shm.name, array.shape, array.dtype.str)
+
+
+def resolve_workers(workers: int | None) -> int:
+    """Map a user worker count to a positive integer (None or 0 means all cores)."""
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def kernel_output_shape(kernel: str, n_points: int, matrix: np.ndarray) -> tuple[int, ...]:
+    """Shape of the values a grid kernel returns for `n_points` points."""
+    if kernel in ("density", "promolecular"):
+        return (n_points,)
+    if kernel == "spin_density":
+        return (n_points, len(SPIN_DENSITY_FIELDS))
+    return (n_points, matrix.shape[1])
+
+
+class GridPool:
+    """
+    A persistent worker pool evaluating one grid kernel over many point sets.
+
+    The compiled basis is pickled once per worker and the kernel matrix is
+    copied into shared memory once. Points, their spatial ordering and the
+    output go through shared buffers sized for `capacity` points, which are
+    reused by every `evaluate` call, so out-of-core grids keep their workers
+    (and the workers' basis block caches) across chunks. The pool starts on
+    the first call that needs more than one worker; with one worker, or for
+    point sets of at most `block_points`, kernels run in-process.
+
+    Use as a context manager, or call `close` to stop the workers and release
+    the shared memory.
+    """
+
+    def __init__(
+        self,
+        basis: Mapping[str, Any],
+        kernel: str,
+        matrix: np.ndarray,
+        capacity: int,
+        dtype: Any = np.float64,
+        workers: int | None = 1,
+        block_points: int = 32768,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    ) -> None:
+        if kernel not in GRID_KERNELS:
+            raise ValueError(f"Unknown grid kernel: {kernel} (choose from {', '.join(GRID_KERNELS)})")
+        self.basis = basis
+        self.kernel = kernel
+        self.dtype = np.dtype(dtype)
+        self.matrix = np.ascontiguousarray(matrix, dtype=self.dtype)
+        self.capacity = max(int(capacity), 1)
+        self.n_workers = resolve_workers(workers)
+        self.block_points = block_points
+        self.memory_budget = memory_budget
+        self._pool: ProcessPoolExecutor | None = None
+        self._blocks: list[shared_memory.SharedMemory] = []
+        self._shared: dict[str, np.ndarray] = {}
+
+    def __enter__(self) -> "GridPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        """Create the shared buffers and the worker processes."""
+        cache = active_basis_cache()
+        cache_spec = None if cache is None or cache.spill_dir is None else (cache.max_bytes // self.n_workers, cache.spill_dir)
+        specs: dict[str, tuple[str, tuple[int, ...], str]] = {}
+        _, specs["matrix"] = _shared_copy(self.matrix, self._blocks)
+        self._shared["points"], specs["points"] = _shared_copy(np.zeros((self.capacity, 3), dtype=self.dtype), self._blocks)
+        self._shared["order"], specs["order"] = _shared_copy(np.zeros(self.capacity, dtype=np.intp), self._blocks)
+        out_shape = kernel_output_shape(self.kernel, self.capacity, self.matrix)
+        self._shared["output"], specs["output"] = _shared_copy(np.zeros(out_shape, dtype=self.dtype), self._blocks)
+        self._pool = ProcessPoolExecutor(
+            max_workers=min(self.n_workers, -(-self.capacity // self.block_points)),
+            initializer=_init_worker,
+            initargs=(self.kernel, self.basis, specs, self.memory_budget, cache_spec),
+        )
+
+    def evaluate(self, r_points: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the kernel at up to `capacity` points.
+
+        Args:
+            r_points: (N, 3) grid points in Angstroms, converted to the pool dtype.
+
+        Returns:
+            Kernel values with shape `kernel_output_shape(kernel, N, matrix)`.
+        """
+        pts = np.ascontiguousarray(r_points, dtype=self.dtype).reshape(-1, 3)
+        n_points = pts.shape[0]
+        out_shape = kernel_output_shape(self.kernel, n_points, self.matrix)
+        if self.n_workers == 1 or n_points <= self.block_points:
+            return GRID_KERNELS[self.kernel](pts, self.matrix, self.basis, self.memory_budget).reshape(out_shape)
+        if n_points > self.capacity:
+            raise ValueError(f"GridPool holds at most {self.capacity} points per call, got {n_points}.")
+
+        # Contiguous ranges of this ordering are spatially compact blocks.
+        cells = partition_points(pts, max_points=self.block_points)
+        bounds = np.concatenate([[0], np.cumsum([len(c) for c in cells])])
+        tasks: list[tuple[int, int]] = []
+        start = 0
+        for stop in bounds[1:]:
+            if stop - start >= self.block_points or stop == bounds[-1]:
+                tasks.append((start, int(stop)))
+                start = int(stop)
+
+        if self._pool is None:
+            self._start()
+        assert self._pool is not None
+        self._shared["points"][:n_points] = pts
+        self._shared["order"][:n_points] = np.concatenate(cells)
+        done = sum(self._pool.map(_run_task, *zip(*tasks)))
+        if done != n_points:
+            raise RuntimeError(f"Parallel grid evaluation covered {done} of {n_points} points.")
+        return self._shared["output"][:n_points].reshape(out_shape).copy()
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self._shared.clear()
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks.clear()
+
+
+def evaluate_grid(
+    r_points: np.ndarray,
+    basis: Mapping[str, Any],
+    kernel: str,
+    matrix: np.ndarray,
+    workers: int | None = 1,
+    block_points: int = 32768,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+) -> np.ndarray:
+    """
+    Evaluate a grid kernel, optionally across a pool of worker processes.
+
+    Points are ordered into spatially compact blocks and dispatched as
+    (start, stop) ranges to a `GridPool`. The points, the kernel matrix and
+    the output live in shared memory, so only the compiled basis is pickled,
+    once per worker.
+    Float32 points are evaluated and returned in single precision. An
+    active basis block cache with a spill directory is shared with the
+    workers through that directory.
+
+    Args:
+        r_points: (N, 3) grid points in Angstroms.
+        basis: Compiled basis from `compile_basis` or a `BasisSet` (a
+            promolecule from `compile_promolecule` for `promolecular`).
+        kernel: Name in `GRID_KERNELS` (`density`, `spin_density`, `mo` or
+            `promolecular`).
+        matrix: Full density matrix (K, K), side-by-side total and spin
+            density matrices (K, 2K), or MO coefficient slice (K, k);
+            unused (any array) for `promolecular`.
+        workers: Number of processes; 1 runs in-process, None/0 uses all cores.
+        block_points: Approximate number of points per task.
+        memory_budget: Per-worker transient memory budget in bytes.
+
+    Returns:
+        (N,) values for `density` and `promolecular`, (N, 4) columns ordered as
+        `SPIN_DENSITY_FIELDS` for `spin_density`, (N, k) values for `mo`.
+    """
+    dtype = working_dtype(r_points)
+    pts = np.asarray(r_points).reshape(-1, 3)
+    with GridPool(basis, kernel, matrix, len(pts), dtype=dtype, workers=workers, block_points=block_points, memory_budget=memory_budget) as pool:
+        return pool.evaluate(pts)
+
+
+def evaluate_grid_into(
+    out: np.ndarray,
+    grid: RegularGrid,
+    basis: Mapping[str, Any],
+    kernel: str,
+    matrix: np.ndarray,
+    workers: int | None = 1,
+    chunk_points: int = 1 << 21,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    symmetry: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Evaluate a grid kernel on a regular grid out of core.
+
+    Grid points are generated lazily, `chunk_points` at a time, evaluated
+    by one `GridPool` shared by all chunks and written straight into `out`,
+    which may be a `np.memmap` (see `numpy.lib.format.open_memmap`). Peak memory is
+    bounded by the chunk size and `memory_budget`, independent of the grid.
+
+    With `symmetry` (from `lattice_operations`) only the symmetry-unique
+    wedge of the grid is evaluated, one point per orbit, and every other
+    point is copied from its representative; the wedge values (about
+    1/|G| of the grid) are held in memory.
+
+    Args:
+        out: Destination with shape `kernel_output_shape(kernel, len(grid), matrix)`;
+            its dtype selects single or double precision evaluation.
+        grid: `RegularGrid` to evaluate on.
+        basis: Compiled basis from `compile_basis` or a `BasisSet`.
+        kernel: Name in `GRID_KERNELS`.
+        matrix: Kernel matrix, as for `evaluate_grid`.
+        workers: Number of processes; 1 runs in-process.
+        chunk_points: Grid points generated and evaluated per chunk.
+        memory_budget: Per-worker transient memory budget in bytes.
+        symmetry: Optional (k, 3, 4) lattice maps of the grid; only valid
+            for the totally symmetric `SYMMETRIC_KERNELS`.
+
+    Returns:
+        `out`, flushed to disk when it is a memory map.
+    """
+    if kernel not in GRID_KERNELS:
+        raise ValueError(f"Unknown grid kernel: {kernel} (choose from {', '.join(GRID_KERNELS)})")
+    expected = kernel_output_shape(kernel, grid.n_points, np.asarray(matrix))
+    if tuple(out.shape) != expected:
+        raise ValueError(f"Output shape {tuple(out.shape)} does not match grid kernel output {expected}.")
+    dtype = working_dtype(out)
+    if symmetry is not None and len(symmetry) > 1 and kernel not in SYMMETRIC_KERNELS:
+        raise ValueError(f"Grid symmetry needs a totally symmetric field ({', '.join(SYMMETRIC_KERNELS)}), not {kernel}.")
+    capacity = min(chunk_points, grid.n_points)
+    with GridPool(basis, kernel, matrix, capacity, dtype=dtype, workers=workers, memory_budget=memory_budget) as pool:
+        if symmetry is not None and len(symmetry) > 1:
+            bounds = [(start, min(start + chunk_points, grid.n_points)) for start in range(0, grid.n_points, chunk_points)]
+            unique = np.concatenate(
+                [np.flatnonzero(lattice_representatives(grid, symmetry, start, stop) == np.arange(start, stop)) + start for start, stop in bounds]
+            )
+            wedge = np.empty((len(unique),) + expected[1:], dtype=dtype)
+            for start in range(0, len(unique), chunk_points):
+                points = grid.points_at(unique[start:start + chunk_points], dtype=dtype)
+                wedge[start:start + chunk_points] = pool.evaluate(points)
+            for start, stop in bounds:
+                out[start:stop] = wedge[np.searchsorted(unique, lattice_representatives(grid, symmetry, start, stop))]
+        else:
+            for start, stop, points in grid.iter_blocks(block_points=chunk_points, dtype=dtype):
+                out[start:stop] = pool.evaluate(points)
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
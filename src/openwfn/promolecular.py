@@ -0,0 +1,200 @@
+# src/openwfn/promolecular.py
+
+import itertools
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np  # type: ignore
+
+from .basis import working_dtype  # type: ignore
+from .constants import BOHR_TO_ANGSTROM, PROMOLECULAR_DENSITY, Z_TO_SYMBOL  # type: ignore
+from .density import DEFAULT_MEMORY_BUDGET  # type: ignore
+
+# Atomic densities are dropped where they fall below this value (e/bohr^3),
+# which bounds the truncation error of every atom's contribution.
+DEFAULT_PROMOLECULAR_THRESHOLD = 1e-8
+# Transient bytes per (point, atom) entry of a cell's distance block.
+_BYTES_PER_PAIR = 48
+# Offsets of a cell and its 26 neighbours.
+_STENCIL = np.array(list(itertools.product((-1, 0, 1), repeat=3)))
+
+
+def atomic_density_parameters(Z: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Coefficients c_i (e/bohr^3) and decay lengths zeta_i (bohr) of the
+    tabulated spherical density rho(r) = sum_i c_i exp(-r / zeta_i) of element `Z`.
+    """
+    symbol = Z_TO_SYMBOL.get(int(Z))
+    if symbol not in PROMOLECULAR_DENSITY:
+        raise ValueError(f"No promolecular density tabulated for element {symbol or Z}.")
+    c, zeta = np.asarray(PROMOLECULAR_DENSITY[symbol], dtype=float).T
+    return c, zeta
+
+
+def atomic_density_radius(Z: int, threshold: float = DEFAULT_PROMOLECULAR_THRESHOLD) -> float:
+    """Radius (bohr) beyond which the tabulated density of element `Z` stays below `threshold`."""
+    c, zeta = atomic_density_parameters(Z)
+    r = np.linspace(0.0, 60.0, 6001)
+    above = np.flatnonzero(np.abs(np.exp(-r[:, None] / zeta) @ c) >= threshold)
+    return float(r[min(above[-1] + 1, len(r) - 1)]) if len(above) else 0.0
+
+
+def compile_promolecule(
+    atomic_numbers: list[int],
+    coordinates: list[tuple[float, float, float]] | np.ndarray,
+    threshold: float = DEFAULT_PROMOLECULAR_THRESHOLD,
+) -> dict[str, Any]:
+    """
+    Prepare a promolecule (sum of spherical free-atom densities) for grid evaluation.
+
+    Atoms are binned into a cell list whose cells are as wide as the largest
+    atomic cutoff radius, so the atoms that can reach a point are always in
+    its own or one of the 26 neighbouring cells. Evaluation then visits a
+    bounded number of atoms per point and scales linearly with the grid and
+    the system size. Like a compiled basis the result is small and is
+    pickled once per worker by `evaluate_grid`.
+
+    Args:
+        atomic_numbers: Atomic numbers.
+        coordinates: (N, 3) coordinates in Angstroms.
+        threshold: Density (e/bohr^3) below which atomic tails are dropped.
+
+    Returns:
+        Dictionary with per-atom `centers` (bohr) and element `kinds`, the
+        per-element `terms` (c, 1/zeta) and squared cutoffs `cutoff2`, and
+        the cell list (`cell_size`, `origin`, `dims`, `cell_keys`,
+        `cell_start`, `cell_count`, `atom_order`).
+    """
+    Z = np.asarray(atomic_numbers, dtype=int).reshape(-1)
+    centers = np.asarray(coordinates, dtype=float).reshape(-1, 3) / BOHR_TO_ANGSTROM
+    if len(Z) != len(centers):
+        raise ValueError(f"Got {len(Z)} atomic numbers for {len(centers)} coordinates.")
+    if len(Z) == 0:
+        raise ValueError("A promolecule needs at least one atom.")
+
+    elements, kinds = np.unique(Z, return_inverse=True)
+    terms = []
+    for z in elements:
+        c, zeta = atomic_density_parameters(int(z))
+        terms.append((c, 1.0 / zeta))
+    cutoff = np.array([atomic_density_radius(int(z), threshold) for z in elements])
+
+    cell_size = max(float(cutoff.max()), 1e-6)
+    # One empty layer of cells around the atoms keeps every neighbour index in range.
+    origin = centers.min(axis=0) - cell_size
+    cells = np.floor((centers - origin) / cell_size).astype(np.int64)
+    dims = cells.max(axis=0) + 2
+    keys = _cell_keys(cells, dims)
+    atom_order = np.argsort(keys, kind="stable")
+    cell_keys, cell_start, cell_count = np.unique(keys[atom_order], return_index=True, return_counts=True)
+    return {
+        "atomic_numbers": Z,
+        "centers": centers,
+        "kinds": kinds.reshape(-1),
+        "terms": terms,
+        "cutoff2": cutoff ** 2,
+        "threshold": float(threshold),
+        "cell_size": cell_size,
+        "origin": origin,
+        "dims": dims,
+        "cell_keys": cell_keys,
+        "cell_start": cell_start,
+        "cell_count": cell_count,
+        "atom_order": atom_order,
+        "n_atoms": len(Z),
+        # Grid-job sizing (see `plan_grid_job`) treats this like a basis without functions.
+        "n_basis": 0,
+    }
+
+
+def _cell_keys(cells: np.ndarray, dims: np.ndarray) -> np.ndarray:
+    return (cells[..., 0] * dims[1] + cells[..., 1]) * dims[2] + cells[..., 2]
+
+
+def _cell_atoms(cell: np.ndarray, model: Mapping[str, Any]) -> np.ndarray:
+    """Atoms in the 27 cells around `cell`, grouped by element."""
+    neighbours = cell + _STENCIL
+    neighbours = neighbours[np.all((neighbours >= 0) & (neighbours < model["dims"]), axis=1)]
+    keys = _cell_keys(neighbours, model["dims"])
+    slot = np.minimum(np.searchsorted(model["cell_keys"], keys), len(model["cell_keys"]) - 1)
+    slot = slot[model["cell_keys"][slot] == keys]
+    order = model["atom_order"]
+    atoms = np.concatenate(
+        [order[start:start + count] for start, count in zip(model["cell_start"][slot], model["cell_count"][slot])]
+        or [np.empty(0, dtype=np.intp)]
+    )
+    return atoms[np.argsort(model["kinds"][atoms], kind="stable")]
+
+
+def promolecular_density(
+    r_points: np.ndarray,
+    promolecule: Mapping[str, Any],
+    gradient: bool = False,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+    """
+    Promolecular electron density: the sum of tabulated spherical atomic densities.
+
+    Needs only atomic numbers and positions, so it works for structures
+    without a wavefunction (XYZ files, FCHK files without basis data) and
+    for systems far too large for `compute_density`. Points are grouped by
+    cell (see `compile_promolecule`); the points of a cell are screened
+    against the atoms of its 27 neighbouring cells one element at a time,
+    in blocks whose distance matrices fit `memory_budget`, and only atoms
+    within their cutoff radius are summed.
+
+    Args:
+        r_points: (N, 3) points in Angstroms.
+        promolecule: Result of `compile_promolecule`.
+        gradient: Also return the density gradient (e/bohr^4), e.g. for
+            `reduced_density_gradient` in NCI-style screening.
+        memory_budget: Transient memory budget in bytes.
+
+    Returns:
+        (N,) density in e/bohr^3, plus the (N, 3) gradient if requested.
+    """
+    dtype = working_dtype(r_points)
+    pts = np.asarray(r_points, dtype=float).reshape(-1, 3) / BOHR_TO_ANGSTROM
+    rho = np.zeros(len(pts))
+    grad = np.zeros((len(pts), 3)) if gradient else None
+    centers, kinds, dims = promolecule["centers"], promolecule["kinds"], promolecule["dims"]
+
+    cells = np.floor((pts - promolecule["origin"]) / promolecule["cell_size"]).astype(np.int64)
+    # Points outside the padded box are beyond every cutoff.
+    inside = np.flatnonzero(np.all((cells >= 0) & (cells < dims), axis=1))
+    keys = _cell_keys(cells[inside], dims)
+    order = np.argsort(keys, kind="stable")
+    groups = np.split(inside[order], np.flatnonzero(np.diff(keys[order])) + 1)
+
+    for group in groups:
+        if len(group) == 0:
+            continue
+        atoms = _cell_atoms(cells[group[0]], promolecule)
+        if len(atoms) == 0:
+            continue
+        elements, first = np.unique(kinds[atoms], return_index=True)
+        bounds = np.append(first, len(atoms))
+        rows_per_block = max(1, int(memory_budget // (_BYTES_PER_PAIR * len(atoms))))
+        for start in range(0, len(group), rows_per_block):
+            index = group[start:start + rows_per_block]
+            p = pts[index]
+            for kind, lo, hi in zip(elements, bounds[:-1], bounds[1:]):
+                c = centers[atoms[lo:hi]]
+                d2 = (p[:, 0, None] - c[:, 0]) ** 2 + (p[:, 1, None] - c[:, 1]) ** 2 + (p[:, 2, None] - c[:, 2]) ** 2
+                rows, cols = np.nonzero(d2 < promolecule["cutoff2"][kind])
+                if len(rows) == 0:
+                    continue
+                r = np.sqrt(d2[rows, cols])
+                coefficients, decay = promolecule["terms"][kind]
+                values = np.exp(-r[:, None] * decay) * coefficients
+                rho[index] += np.bincount(rows, weights=values.sum(axis=1), minlength=len(index))
+                if grad is not None:
+                    # d rho / dr along the unit vector; the cusp at a nucleus gets no direction.
+                    radial = -(values @ decay) / np.where(r > 1e-12, r, np.inf)
+                    delta = p[rows] - c[cols]
+                    for i in range(3):
+                        grad[index, i] += np.bincount(rows, weights=radial * delta[:, i], minlength=len(index))
+
+    if grad is not None:
+        return rho.astype(dtype, copy=False), grad.astype(dtype, copy=False)
+    return rho.astype(dtype, copy=False)
@@ -0,0 +1,408 @@
+# src/openwfn/symmetry.py
+
+import itertools
+from typing import Any, Tuple
+
+import numpy as np  # type: ignore
+
+from .grid import RegularGrid  # type: ignore
+
+# Largest rotation order searched for (D8h covers the usual sandwich and ring systems).
+_MAX_ORDER = 8
+# Default distance tolerance (Angstroms) for two atoms to count as symmetry images.
+DEFAULT_SYMMETRY_TOLERANCE = 0.01
+# Distance-matrix entries per block when matching operation images to atoms.
+_IMAGE_BLOCK = 1 << 22
+
+
+def _rotation(axis: np.ndarray, angle: float) -> np.ndarray:
+    """(k, 3, 3) rotation matrices by `angle` about each row of `axis` (unit vectors)."""
+    x, y, z = axis.T
+    c, s = np.cos(angle), np.sin(angle)
+    C = 1.0 - c
+    return np.stack(
+        [
+            np.stack([c + x * x * C, x * y * C - z * s, x * z * C + y * s], axis=-1),
+            np.stack([y * x * C + z * s, c + y * y * C, y * z * C - x * s], axis=-1),
+            np.stack([z * x * C - y * s, z * y * C + x * s, c + z * z * C], axis=-1),
+        ],
+        axis=1,
+    )
+
+
+def _reflection(normal: np.ndarray) -> np.ndarray:
+    """(k, 3, 3) reflections through the planes with unit `normal` rows."""
+    return np.eye(3) - 2.0 * normal[:, :, None] * normal[:, None, :]
+
+
+def _unique_directions(vectors: np.ndarray, tol: float = 1e-3) -> np.ndarray:
+    """Unit vectors of the non-zero rows of `vectors`, one per line through the origin."""
+    length = np.linalg.norm(vectors, axis=1)
+    v = vectors[length > 1e-6] / length[length > 1e-6, None]
+    if len(v) == 0:
+        return v
+    # Orient each direction so its largest component is positive.
+    sign = np.sign(v[np.arange(len(v)), np.argmax(np.abs(v), axis=1)])
+    v = v * sign[:, None]
+    _, keep = np.unique(np.round(v / tol).astype(np.int64), axis=0, return_index=True)
+    return v[np.sort(keep)]
+
+
+def _equivalence_classes(atomic_numbers: np.ndarray, X: np.ndarray, tol: float) -> list[np.ndarray]:
+    """Atoms grouped by element and distance from the centre (candidate symmetry-equivalent sets)."""
+    r = np.linalg.norm(X, axis=1)
+    classes = []
+    for z in np.unique(atomic_numbers):
+        index = np.flatnonzero(atomic_numbers == z)
+        index = index[np.argsort(r[index])]
+        bounds = np.flatnonzero(np.diff(r[index]) > tol) + 1
+        classes.extend(np.split(index, bounds))
+    return sorted(classes, key=len)
+
+
+def _probe_classes(classes: list[np.ndarray], X: np.ndarray) -> list[np.ndarray]:
+    """
+    The smallest classes up to the first one whose atoms span a plane.
+
+    Classes of one or two (collinear) atoms leave directions perpendicular
+    to them undetermined; a class spanning at least a plane pins down every
+    symmetry element on its own (see `_candidate_axes`).
+    """
+    probes = []
+    for members in classes:
+        P = X[members]
+        if np.all(np.linalg.norm(P, axis=1) < 1e-6):
+            continue
+        probes.append(members)
+        if np.linalg.matrix_rank(P, tol=1e-6) >= 2:
+            break
+    return probes
+
+
+def _candidate_axes(classes: list[np.ndarray], X: np.ndarray) -> np.ndarray:
+    """
+    Directions that may carry a rotation axis or a mirror-plane normal.
+
+    Any symmetry element maps every equivalence class onto itself, so it
+    either contains one of the class atoms or relates pairs (and, for
+    n >= 3, triples) of them: atom directions, pair sums, differences and
+    cross products within the probe classes (see `_probe_classes`), and
+    normals of triangles through the first atom of the smallest class of
+    three or more atoms cover all cases. Only small classes are used, so
+    the number of candidates does not grow with the size of the molecule.
+    """
+    inertia = np.eye(3) * np.sum(X * X) - X.T @ X
+    candidates = [np.eye(3), np.linalg.eigh(inertia)[1].T]
+    for members in _probe_classes(classes, X):
+        P = X[members]
+        i, j = np.triu_indices(len(members), k=1)
+        candidates += [P, P[i] + P[j], P[i] - P[j], np.cross(P[i], P[j])]
+    smallest = next((m for m in classes if len(m) >= 3 and np.linalg.norm(X[m[0]]) > 1e-6), None)
+    if smallest is not None:
+        P = X[smallest]
+        j, k = np.triu_indices(len(smallest), k=1)
+        keep = j > 0
+        candidates += [P[:1], np.cross(P[j[keep]] - P[0], P[k[keep]] - P[0])]
+    return _unique_directions(np.concatenate(candidates))
+
+
+def _candidate_operations(axes: np.ndarray) -> np.ndarray:
+    """Inversion plus rotations, reflections and improper rotations about every axis."""
+    ops = [-np.eye(3)[None], _reflection(axes)]
+    mirror = _reflection(axes)
+    for n in range(2, _MAX_ORDER + 1):
+        for k in range(1, n):
+            if np.gcd(k, n) != 1:
+                continue
+            rotation = _rotation(axes, 2.0 * np.pi * k / n)
+            ops.append(rotation)
+            ops.append(mirror @ rotation)
+    return np.concatenate(ops)
+
+
+def _images(ops: np.ndarray, X: np.ndarray, members: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Nearest atom of `members` to each operation's image of each member, and that distance."""
+    P = X[members]
+    nearest = np.empty((len(ops), len(members)), dtype=np.int64)
+    dist = np.empty((len(ops), len(members)))
+    step = max(1, _IMAGE_BLOCK // len(members) ** 2)
+    for start in range(0, len(ops), step):
+        images = np.einsum("kab,nb->kna", ops[start:start + step], P)
+        d2 = np.sum(images ** 2, axis=2)[:, :, None] + np.sum(P ** 2, axis=1) - 2.0 * images @ P.T
+        nearest[start:start + step] = np.argmin(d2, axis=2)
+        dist[start:start + step] = np.sqrt(np.maximum(np.min(d2, axis=2), 0.0))
+    return members[nearest], dist
+
+
+def _fit_operation(X: np.ndarray, permutation: np.ndarray, sign: float) -> np.ndarray:
+    """Orthogonal matrix with determinant `sign` that best maps the atoms onto `permutation` (Kabsch)."""
+    u, _, vt = np.linalg.svd(X.T @ X[permutation])
+    d = np.ones(3)
+    d[2] = sign * (np.sign(np.linalg.det(u @ vt)) or 1.0)
+    return vt.T @ np.diag(d) @ u.T
+
+
+def symmetry_operations(
+    atomic_numbers: list[int],
+    coordinates: list[Tuple[float, float, float]],
+    tol: float = DEFAULT_SYMMETRY_TOLERANCE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Point-group operations of a molecule.
+
+    Candidate rotations, reflections and improper rotations are built
+    about directions derived from the atoms and tested all at once, class
+    by class of equivalent atoms. Accepted operations are identified by
+    the atom permutation they induce, closed under composition and
+    refined to the orthogonal matrix that best realizes each permutation,
+    so near-duplicate candidates collapse into one operation.
+
+    Args:
+        atomic_numbers: Atomic numbers.
+        coordinates: Atomic coordinates in Angstroms.
+        tol: Largest distance (Angstroms) between an atom's image and its
+            symmetry partner.
+
+    Returns:
+        (k, 3, 3) Cartesian operation matrices (identity first) acting on
+        positions relative to the centre, and the (3,) centre in Angstroms
+        (the nuclear-charge-weighted centroid, a fixed point of every
+        operation).
+    """
+    Z = np.asarray(atomic_numbers, dtype=np.int64)
+    coords = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+    if len(Z) == 0:
+        raise ValueError("At least one atom is required to determine symmetry.")
+    center = (Z[:, None] * coords).sum(axis=0) / max(Z.sum(), 1)
+    X = coords - center
+    classes = _equivalence_classes(Z, X, tol)
+
+    ops = _candidate_operations(_candidate_axes(classes, X))
+    # Small classes reject most candidates before any per-atom array is built.
+    partners: list[np.ndarray] = []
+    for members in classes:
+        partner, dist = _images(ops, X, members)
+        keep = np.all(dist < tol, axis=1)
+        ops = ops[keep]
+        partners = [p[keep] for p in partners] + [partner[keep]]
+    permutation = np.empty((len(ops), len(Z)), dtype=np.int64)
+    for members, partner in zip(classes, partners):
+        permutation[:, members] = partner
+
+    # Group elements as (determinant, atom permutation), closed under products.
+    identity = (1, tuple(range(len(Z))))
+    elements = {identity}
+    elements.update(zip(np.sign(np.linalg.det(ops)).astype(int).tolist(), map(tuple, permutation.tolist())))
+    frontier = set(elements)
+    while frontier:
+        products = {(s1 * s2, tuple(np.asarray(p1)[list(p2)].tolist())) for s1, p1 in frontier for s2, p2 in elements}
+        frontier = products - elements
+        elements |= frontier
+
+    matrices = []
+    for s, p in [identity] + sorted(elements - {identity}):
+        R = _fit_operation(X, np.asarray(p), float(s))
+        if np.all(np.linalg.norm(X @ R.T - X[list(p)], axis=1) < tol):
+            matrices.append(R)
+    return np.asarray(matrices), center
+
+
+def _describe(op: np.ndarray) -> tuple[str, int, np.ndarray]:
+    """Kind (`E`, `C`, `i`, `s` or `S`), rotation order and axis of one operation."""
+    proper = np.linalg.det(op) > 0.0
+    R = op if proper else -op
+    cos = np.clip((np.trace(R) - 1.0) / 2.0, -1.0, 1.0)
+    angle = float(np.arccos(cos))
+    if angle < 1e-6:
+        return ("E" if proper else "i"), 1, np.zeros(3)
+    if angle > np.pi - 1e-6:
+        column = R + np.eye(3)
+        axis = column[:, np.argmax(np.linalg.norm(column, axis=0))]
+    else:
+        axis = np.array([R[2, 1] - R[1, 2], R[0, 2] - R[2, 0], R[1, 0] - R[0, 1]])
+    axis = axis / np.linalg.norm(axis)
+    order = int(round(2.0 * np.pi / angle))
+    if proper:
+        return "C", order, axis
+    # -op is a rotation by `angle`; op itself is a rotation by pi - angle followed by a reflection.
+    if angle > np.pi - 1e-6:
+        return "s", 1, axis
+    return "S", int(round(2.0 * np.pi / (np.pi - angle))), axis
+
+
+def point_group_name(operations: np.ndarray) -> str:
+    """Schoenflies symbol of the (finite) point group made of `operations`."""
+    kinds = [_describe(op) for op in operations]
+    has_inversion = any(kind == "i" for kind, _, _ in kinds)
+    mirrors = [axis for kind, _, axis in kinds if kind == "s"]
+
+    # Highest rotation order about each distinct axis.
+    axes: list[tuple[np.ndarray, int]] = []
+    for kind, order, axis in kinds:
+        if kind != "C":
+            continue
+        for n, (other, other_order) in enumerate(axes):
+            if abs(abs(float(axis @ other)) - 1.0) < 1e-4:
+                axes[n] = (other, max(other_order, order))
+                break
+        else:
+            axes.append((axis, order))
+
+    if sum(order >= 3 for _, order in axes) >= 2:
+        top = max(order for _, order in axes)
+        if top == 5:
+            return "Ih" if has_inversion else "I"
+        if top == 4:
+            return "Oh" if has_inversion else "O"
+        return "Th" if has_inversion else ("Td" if mirrors else "T")
+    if not axes:
+        return "Cs" if mirrors else ("Ci" if has_inversion else "C1")
+
+    principal, n = max(axes, key=lambda item: item[1])
+    perpendicular_c2 = sum(abs(float(axis @ principal)) < 1e-4 for axis, _ in axes)
+    horizontal = any(abs(abs(float(normal @ principal)) - 1.0) < 1e-4 for normal in mirrors)
+    vertical = any(abs(float(normal @ principal)) < 1e-4 for normal in mirrors)
+    if perpendicular_c2 >= n and n == 2:
+        # Three equivalent-looking C2 axes: no unique principal axis to refer to.
+        return "D2h" if has_inversion else ("D2d" if mirrors else "D2")
+    if perpendicular_c2 >= n:
+        return f"D{n}h" if horizontal else (f"D{n}d" if vertical else f"D{n}")
+    if horizontal:
+        return f"C{n}h"
+    if vertical:
+        return f"C{n}v"
+    improper = [order for kind, order, axis in kinds if kind == "S" and abs(abs(float(axis @ principal)) - 1.0) < 1e-4]
+    if improper and max(improper) == 2 * n:
+        return f"S{2 * n}"
+    return f"C{n}"
+
+
+def point_group(
+    atomic_numbers: list[int],
+    coordinates: list[Tuple[float, float, float]],
+    tol: float = DEFAULT_SYMMETRY_TOLERANCE,
+) -> dict[str, Any]:
+    """
+    Detect the point group of a molecule.
+
+    Atoms and linear molecules are reported as `Kh`, `C*v` or `D*h`; their
+    `operations` are then a finite subgroup of the full group.
+
+    Returns:
+        Dictionary with `name` (Schoenflies symbol, e.g. `C2v` or `Td`),
+        `order` (number of operations found), `operations` ((k, 3, 3)
+        Cartesian matrices) and `center` (Angstroms).
+    """
+    operations, center = symmetry_operations(atomic_numbers, coordinates, tol=tol)
+    X = np.asarray(coordinates, dtype=float).reshape(-1, 3) - center
+    if len(X) == 1:
+        name = "Kh"
+    elif np.linalg.matrix_rank(X - X[0], tol=tol) <= 1:
+        Z = np.asarray(atomic_numbers)
+        mirrored = np.linalg.norm(-X[:, None, :] - X[None, :, :], axis=2) < tol
+        centrosymmetric = bool(np.all(np.any(mirrored & (Z[:, None] == Z[None, :]), axis=1)))
+        name = "D*h" if centrosymmetric else "C*v"
+    else:
+        name = point_group_name(operations)
+    return {
+        "name": name,
+        "order": len(operations),
+        "operations": operations,
+        "center": center,
+    }
+
+
+def _grid_frame_operations(grid: RegularGrid, operations: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Operations expressed along the grid axes, and which of them are signed permutations."""
+    M = np.einsum("ab,kbc,dc->kad", grid.axes, np.asarray(operations, dtype=float), grid.axes)
+    rounded = np.round(M)
+    signed_permutation = (
+        np.all(np.abs(M - rounded) < 1e-6, axis=(1, 2))
+        & np.all(np.sum(np.abs(rounded), axis=1) == 1, axis=1)
+        & np.all(np.sum(np.abs(rounded), axis=2) == 1, axis=1)
+    )
+    return rounded.astype(np.int64), signed_permutation
+
+
+def symmetric_grid(grid: RegularGrid, operations: np.ndarray, center: Any) -> RegularGrid:
+    """
+    Adjust a grid so that the symmetry operations aligned with its axes
+    permute its points.
+
+    Operations that act on the grid axes as signed permutations (e.g. all
+    of D2h, or all of Td and Oh in a standard orientation) are kept; along
+    every axis they flip or exchange, the box is made symmetric about
+    `center`, and exchanged axes get a common spacing and point count. The
+    box only grows and the spacing only shrinks.
+    """
+    M, usable = _grid_frame_operations(grid, operations)
+    M = M[usable]
+    moved = np.any(M != np.eye(3, dtype=np.int64), axis=(0, 2)) if len(M) else np.zeros(3, dtype=bool)
+    if not np.any(moved):
+        return grid
+    # Axes exchanged by some operation share spacing and extent.
+    group = np.arange(3)
+    for op in M:
+        for a, b in zip(*np.nonzero(op)):
+            ga, gb = group[a], group[b]
+            group[group == gb] = ga
+
+    low = (grid.origin - np.asarray(center, dtype=float)) @ grid.axes.T
+    high = low + (np.asarray(grid.shape) - 1) * grid.spacing
+    half = np.maximum(-low, high)
+    spacing, shape, offset = grid.spacing.copy(), np.asarray(grid.shape), low.copy()
+    for g in np.unique(group[moved]):
+        axes = np.flatnonzero(group == g)
+        step = grid.spacing[axes].min()
+        n = 2 * int(np.ceil(half[axes].max() / step - 1e-9)) + 1
+        spacing[axes], shape[axes], offset[axes] = step, n, -0.5 * (n - 1) * step
+    origin = np.asarray(center, dtype=float) + offset @ grid.axes
+    return RegularGrid(origin, spacing, tuple(int(n) for n in shape), axes=grid.axes)
+
+
+def lattice_operations(grid: RegularGrid, operations: np.ndarray, center: Any) -> np.ndarray:
+    """
+    Symmetry operations that map the points of `grid` onto each other.
+
+    Returns:
+        (k, 3, 4) integer maps [P | t] (identity first) taking lattice
+        indices i to P @ i + t.
+    """
+    M, usable = _grid_frame_operations(grid, operations)
+    shape = np.asarray(grid.shape)
+    low = (grid.origin - np.asarray(center, dtype=float)) @ grid.axes.T
+    corners = np.array(list(itertools.product(*[(0, n - 1) for n in shape])))
+    maps = [np.hstack([np.eye(3, dtype=np.int64), np.zeros((3, 1), dtype=np.int64)])]
+    for op in M[usable]:
+        if np.all(op == np.eye(3, dtype=np.int64)):
+            continue
+        # Point spacings must match along exchanged axes.
+        if not np.allclose(grid.spacing @ np.abs(op).T, grid.spacing, rtol=1e-9):
+            continue
+        shift = (op @ low - low) / grid.spacing
+        t = np.round(shift)
+        if not np.allclose(shift, t, atol=1e-6):
+            continue
+        image = corners @ op.T + t
+        if np.any(image.min(axis=0) != 0) or np.any(image.max(axis=0) != shape - 1):
+            continue
+        maps.append(np.hstack([op, t.astype(np.int64)[:, None]]))
+    return np.asarray(maps)
+
+
+def lattice_representatives(grid: RegularGrid, maps: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """Smallest flat index in the symmetry orbit of each grid point `start:stop`."""
+    dtype = np.int32 if grid.n_points < 2 ** 31 else np.int64
+    index = np.arange(start, stop, dtype=dtype)
+    ijk = [i.astype(dtype) for i in np.unravel_index(index, grid.shape)]
+    strides = (grid.shape[1] * grid.shape[2], grid.shape[2], 1)
+    representative = index.copy()
+    image = np.empty_like(index)
+    for m in maps[1:]:
+        # Signed permutations: each image index is +/- one source index plus a shift.
+        image[:] = sum(int(m[a, 3]) * strides[a] for a in range(3))
+        for a in range(3):
+            b = int(np.flatnonzero(m[a, :3])[0])
+            image += int(m[a, b]) * strides[a] * ijk[b]
+        np.minimum(representative, image, out=representative)
+    return representative.astype(np.int64)
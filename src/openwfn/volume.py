@@ -0,0 +1,316 @@
+# src/openwfn/volume.py
+
+import json
+import lzma
+import zlib
+from pathlib import Path
+from typing import Any, Tuple
+
+import numpy as np  # type: ignore
+
+from .grid import RegularGrid  # type: ignore
+
+VOLUME_FORMAT = "openwfn-volume"
+VOLUME_VERSION = 1
+_METADATA = "volume.json"
+
+# Chunk (de)compressors by name; "raw" stores chunks uncompressed.
+_CODECS = {
+    "zlib": (zlib.compress, zlib.decompress),
+    "lzma": (lambda data: lzma.compress(data, preset=1), lzma.decompress),
+    "raw": (bytes, bytes),
+}
+
+
+class VolumeStore:
+    """
+    Chunked, compressed on-disk store of one or more fields on a `RegularGrid`.
+
+    A store is a directory holding `volume.json` (grid, field names, dtype,
+    chunk shape, codec and, optionally, the molecule) and one compressed file
+    per chunk and field (`<field index>/<a>.<b>.<c>`). Stores are written
+    sequentially in grid order by `writer()`, which the grid engine can fill
+    block by block, and any sub-volume can be read back by decompressing only
+    the chunks it intersects.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        metadata_path = self.path / _METADATA
+        if not metadata_path.is_file():
+            raise ValueError(f"{self.path} is not an openWFN volume store (missing {_METADATA}).")
+        meta = json.loads(metadata_path.read_text())
+        if meta.get("format") != VOLUME_FORMAT or meta.get("version", 0) > VOLUME_VERSION:
+            raise ValueError(f"{self.path} is not a supported openWFN volume store.")
+        self.metadata = meta
+        self.grid = RegularGrid(meta["origin"], meta["spacing"], tuple(meta["shape"]), axes=meta["axes"])
+        self.fields: list[str] = list(meta["fields"])
+        self.dtype = np.dtype(meta["dtype"])
+        self.chunks: Tuple[int, int, int] = tuple(int(c) for c in meta["chunks"])  # type: ignore[assignment]
+        self.compression: str = meta["compression"]
+        self.atomic_numbers: list[int] = list(meta.get("atomic_numbers") or [])
+        self.coordinates: list[Tuple[float, float, float]] = [tuple(xyz) for xyz in meta.get("coordinates") or []]
+
+    @classmethod
+    def create(
+        cls,
+        path: str | Path,
+        grid: RegularGrid,
+        fields: list[str],
+        dtype: Any = np.float32,
+        chunks: Tuple[int, int, int] = (32, 32, 32),
+        compression: str = "zlib",
+        atomic_numbers: list[int] | None = None,
+        coordinates: list[Tuple[float, float, float]] | None = None,
+    ) -> "VolumeStore":
+        """
+        Create an empty store (replacing the metadata of an existing one).
+
+        Args:
+            path: Store directory, e.g. `density.owv`.
+            grid: `RegularGrid` of the fields.
+            fields: Field names, in the column order values will be written.
+            dtype: Stored floating-point type.
+            chunks: Chunk shape in grid points.
+            compression: `zlib`, `lzma` or `raw`.
+            atomic_numbers: Optional molecule kept for cube export.
+            coordinates: Atomic coordinates in Angstroms.
+        """
+        if compression not in _CODECS:
+            raise ValueError(f"Unknown volume compression '{compression}' (choose from {', '.join(_CODECS)}).")
+        if not fields:
+            raise ValueError("A volume store needs at least one field.")
+        if len(chunks) != 3 or min(chunks) < 1:
+            raise ValueError("Chunk shape must be three positive integers.")
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "format": VOLUME_FORMAT,
+            "version": VOLUME_VERSION,
+            "origin": grid.origin.tolist(),
+            "spacing": grid.spacing.tolist(),
+            "shape": list(grid.shape),
+            "axes": grid.axes.tolist(),
+            "fields": list(fields),
+            "dtype": np.dtype(dtype).str,
+            "chunks": [int(c) for c in chunks],
+            "compression": compression,
+            "atomic_numbers": [int(z) for z in atomic_numbers or []],
+            "coordinates": [[float(v) for v in xyz] for xyz in coordinates or []],
+        }
+        (path / _METADATA).write_text(json.dumps(meta, indent=1))
+        for index in range(len(fields)):
+            (path / str(index)).mkdir(exist_ok=True)
+        return cls(path)
+
+    def _chunk_path(self, field: int, chunk: Tuple[int, int, int]) -> Path:
+        return self.path / str(field) / ".".join(str(c) for c in chunk)
+
+    def _chunk_shape(self, chunk: Tuple[int, int, int]) -> Tuple[int, int, int]:
+        return tuple(min(c, n - i * c) for i, c, n in zip(chunk, self.chunks, self.grid.shape))  # type: ignore[return-value]
+
+    def write_chunk(self, field: int, chunk: Tuple[int, int, int], values: np.ndarray) -> None:
+        """Compress and store one chunk of a field."""
+        block = np.ascontiguousarray(values, dtype=self.dtype)
+        if block.shape != self._chunk_shape(chunk):
+            raise ValueError(f"Chunk {chunk} must have shape {self._chunk_shape(chunk)} (got {block.shape}).")
+        self._chunk_path(field, chunk).write_bytes(_CODECS[self.compression][0](block.tobytes()))
+
+    def read_chunk(self, field: int, chunk: Tuple[int, int, int]) -> np.ndarray:
+        """Decompress one chunk of a field."""
+        data = _CODECS[self.compression][1](self._chunk_path(field, chunk).read_bytes())
+        return np.frombuffer(data, dtype=self.dtype).reshape(self._chunk_shape(chunk))
+
+    def writer(self, shape: Tuple[int, ...] | None = None) -> "VolumeWriter":
+        """
+        Sequential writer accepting `writer[start:stop] = values` in grid order.
+
+        Args:
+            shape: Flat value shape the caller writes, `(N,)` or `(N, k)` with
+                k the number of fields (defaults to the latter unless the store
+                has one field).
+        """
+        return VolumeWriter(self, shape)
+
+    def region_grid(self, region: Any = None) -> RegularGrid:
+        """`RegularGrid` of the points selected by `region` (see `read`)."""
+        return region_grid(self.grid, region)
+
+    def read(self, field: str | int = 0, region: Any = None, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Read a sub-volume of one field, decompressing only intersecting chunks.
+
+        Args:
+            field: Field name or index.
+            region: Up to three slices or integers selecting grid points
+                along x, y and z (NumPy semantics, positive steps), e.g.
+                `(slice(10, 20), 5)`; None reads the whole volume. Integers
+                keep their axis with length 1, so the result is always 3-D.
+            out: Optional destination with the region's shape.
+
+        Returns:
+            (nx, ny, nz) array of the selected points.
+        """
+        index = self.fields.index(field) if isinstance(field, str) else int(field)
+        if not 0 <= index < len(self.fields):
+            raise ValueError(f"Field index {index} out of range for {len(self.fields)} field(s).")
+        ranges = _normalize_region(region, self.grid.shape)
+        indices = [np.arange(r.start, r.stop, r.step) for r in ranges]
+        shape = tuple(len(i) for i in indices)
+        result = np.empty(shape, dtype=self.dtype) if out is None else out
+        if tuple(result.shape) != shape:
+            raise ValueError(f"Output shape {tuple(result.shape)} does not match region {shape}.")
+        if 0 in shape:
+            return result
+
+        chunk_ids = [np.unique(i // c) for i, c in zip(indices, self.chunks)]
+        for a in chunk_ids[0]:
+            sel_x = np.flatnonzero(indices[0] // self.chunks[0] == a)
+            for b in chunk_ids[1]:
+                sel_y = np.flatnonzero(indices[1] // self.chunks[1] == b)
+                for c in chunk_ids[2]:
+                    sel_z = np.flatnonzero(indices[2] // self.chunks[2] == c)
+                    block = self.read_chunk(index, (int(a), int(b), int(c)))
+                    local = (
+                        indices[0][sel_x] - a * self.chunks[0],
+                        indices[1][sel_y] - b * self.chunks[1],
+                        indices[2][sel_z] - c * self.chunks[2],
+                    )
+                    result[np.ix_(sel_x, sel_y, sel_z)] = block[np.ix_(*local)]
+        return result
+
+    def stored_bytes(self) -> int:
+        """Total size of the compressed chunks on disk."""
+        return sum(p.stat().st_size for index in range(len(self.fields)) for p in (self.path / str(index)).iterdir())
+
+    def __repr__(self) -> str:
+        return f"VolumeStore({self.path}, {self.grid}, fields={self.fields}, {self.compression})"
+
+
+class VolumeWriter:
+    """
+    Buffer sequential grid-order writes into x-slabs of chunks.
+
+    One slab (`chunks[0]` x-planes of every field) is held in memory; it is
+    compressed chunk by chunk as soon as it is complete. The writer quacks
+    like the `out` array of `evaluate_grid_into`.
+    """
+
+    def __init__(self, store: VolumeStore, shape: Tuple[int, ...] | None = None):
+        n_fields = len(store.fields)
+        n_points = store.grid.n_points
+        if shape is None:
+            shape = (n_points,) if n_fields == 1 else (n_points, n_fields)
+        shape = tuple(int(n) for n in shape)
+        if shape[0] != n_points or int(np.prod(shape[1:], dtype=np.int64)) != n_fields:
+            raise ValueError(f"Writer shape {shape} does not match {n_points} points x {n_fields} field(s).")
+        self.store = store
+        self.shape = shape
+        self.dtype = store.dtype
+        _, ny, nz = store.grid.shape
+        self._plane = ny * nz
+        self._slab = np.empty((store.chunks[0] * self._plane, n_fields), dtype=store.dtype)
+        self._slab_index = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __setitem__(self, key: slice, values: np.ndarray) -> None:
+        start, stop, step = key.indices(self.shape[0])
+        if step != 1 or start != self._next:
+            raise ValueError(f"Volume stores are written sequentially (expected points from {self._next}, got {start}).")
+        values = np.asarray(values).reshape(stop - start, -1)
+        while start < stop:
+            offset = start - self._slab_index * self._slab.shape[0]
+            take = min(stop - start, self._slab.shape[0] - offset)
+            self._slab[offset:offset + take] = values[:take]
+            values = values[take:]
+            start += take
+            if offset + take == self._slab.shape[0] or start == self.shape[0]:
+                self._flush_slab(offset + take)
+        self._next = stop
+
+    def _flush_slab(self, n_filled: int) -> None:
+        store = self.store
+        _, ny, nz = store.grid.shape
+        cx, cy, cz = store.chunks
+        slab = self._slab[:n_filled].reshape(-1, ny, nz, len(store.fields))
+        a = self._slab_index
+        for field in range(len(store.fields)):
+            for b in range(-(-ny // cy)):
+                for c in range(-(-nz // cz)):
+                    store.write_chunk(field, (a, b, c), slab[:, b * cy:(b + 1) * cy, c * cz:(c + 1) * cz, field])
+        self._slab_index += 1
+
+    def close(self) -> VolumeStore:
+        """Check that every point was written and return the store."""
+        if self._next != self.shape[0]:
+            raise ValueError(f"Volume store received {self._next} of {self.shape[0]} points.")
+        return self.store
+
+
+def _normalize_region(region: Any, shape: Tuple[int, int, int]) -> list[range]:
+    """Turn up to three slices/integers into per-axis index ranges."""
+    if region is None:
+        region = ()
+    if not isinstance(region, tuple):
+        region = (region,)
+    if len(region) > 3:
+        raise ValueError("A region selects at most three axes.")
+    ranges = []
+    for axis, n in enumerate(shape):
+        item = region[axis] if axis < len(region) else slice(None)
+        if isinstance(item, slice):
+            r = range(*item.indices(n))
+            if r.step <= 0:
+                raise ValueError("Region slices must have positive steps.")
+        else:
+            i = int(item) + (n if int(item) < 0 else 0)
+            if not 0 <= i < n:
+                raise ValueError(f"Index {int(item)} out of range for axis of length {n}.")
+            r = range(i, i + 1)
+        ranges.append(r)
+    return ranges
+
+
+def region_slices(region: Any, shape: Tuple[int, int, int]) -> tuple[slice, slice, slice]:
+    """Per-axis slices of `region` that keep all three axes of an (nx, ny, nz) array."""
+    return tuple(slice(r.start, r.stop, r.step) for r in _normalize_region(region, shape))  # type: ignore[return-value]
+
+
+def region_grid(grid: RegularGrid, region: Any = None) -> RegularGrid:
+    """`RegularGrid` of the points of `grid` selected by `region` (see `VolumeStore.read`)."""
+    ranges = _normalize_region(region, grid.shape)
+    start = np.array([r.start for r in ranges], dtype=float)
+    step = np.array([r.step for r in ranges], dtype=float)
+    return RegularGrid(
+        grid.origin + start @ grid.vectors,
+        grid.spacing * step,
+        tuple(len(r) for r in ranges),
+        axes=grid.axes,
+    )
+
+
+def parse_region(text: str | None) -> tuple:
+    """
+    Parse a command-line region such as `10:50,:,32` or `::2,::2,::2`.
+
+    Each comma-separated item is an index or a `start:stop[:step]` slice
+    along x, y and z; missing trailing axes select everything.
+    """
+    if text is None or not text.strip():
+        return ()
+    items = []
+    for part in text.split(","):
+        part = part.strip()
+        try:
+            if ":" in part:
+                items.append(slice(*(int(v) if v.strip() else None for v in part.split(":"))))
+            else:
+                items.append(int(part))
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid region '{text}' (use e.g. 10:50,:,32).") from None
+    if len(items) > 3:
+        raise ValueError(f"Invalid region '{text}': at most three axes.")
+    return tuple(items)
@@ -2,7 +2,41 @@
 
 from pathlib import Path
 
-from .constants import Z_TO_SYMBOL  # type: ignore
+from .constants import SYMBOL_TO_Z, Z_TO_SYMBOL  # type: ignore
+
+
+def read_xyz(filename: str | Path) -> tuple[list[int], list[tuple[float, float, float]]]:
+    """
+    Read the first frame of an XYZ file.
+
+    Atoms may be given by element symbol (any case) or atomic number;
+    coordinates are in Angstroms.
+
+    Returns:
+        (atomic_numbers, coordinates).
+    """
+    with open(filename) as f:
+        lines = f.read().splitlines()
+    try:
+        n_atoms = int(lines[0].split()[0])
+    except (IndexError, ValueError):
+        raise ValueError(f"{filename}: first line must give the number of atoms.") from None
+    if len(lines) < n_atoms + 2:
+        raise ValueError(f"{filename}: expected {n_atoms} atoms but the file ends after {max(len(lines) - 2, 0)}.")
+
+    atomic_numbers: list[int] = []
+    coordinates: list[tuple[float, float, float]] = []
+    for line in lines[2:n_atoms + 2]:
+        fields = line.split()
+        if len(fields) < 4:
+            raise ValueError(f"{filename}: malformed atom line '{line.strip()}'.")
+        label = fields[0]
+        Z = int(label) if label.isdigit() else SYMBOL_TO_Z.get(label.rstrip("0123456789").capitalize())
+        if Z is None:
+            raise ValueError(f"{filename}: unknown element '{label}'.")
+        atomic_numbers.append(Z)
+        coordinates.append((float(fields[1]), float(fields[2]), float(fields[3])))
+    return atomic_numbers, coordinates
 
 
 def write_xyz(
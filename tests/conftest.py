@@ -1,7 +1,30 @@
 import sys
 from pathlib import Path
 
+import pytest  # type: ignore
+
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
-sys.path.insert(0, str(SRC))
\ No newline at end of file
+sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture(scope="session")
+def water():
+    """The water example as (lines, coordinates, basis, P, C).
+
+    ``P`` is the full total SCF density matrix and ``C`` the alpha MO
+    coefficients with one orbital per column.  Shared across the session, so
+    tests must not modify the arrays in place.
+    """
+    from openwfn.basis import compile_basis  # type: ignore
+    from openwfn.density import unpack_triangular  # type: ignore
+    from openwfn.fchk import parse_fchk_arrays, parse_fchk_basis, parse_fchk_density, parse_fchk_mos, read_fchk  # type: ignore
+    from openwfn.mo import mo_coefficient_matrix  # type: ignore
+
+    lines = read_fchk(str(ROOT / "examples" / "water" / "water.fchk"))
+    _, coordinates = parse_fchk_arrays(lines)
+    basis = compile_basis(parse_fchk_basis(lines), coordinates)
+    P = unpack_triangular(parse_fchk_density(lines)["total_scf_density"], basis["n_basis"])
+    C = mo_coefficient_matrix(parse_fchk_mos(lines)["alpha_coeffs"], basis["n_basis"])
+    return lines, coordinates, basis, P, C
@@ -0,0 +1,174 @@
+import numpy as np  # type: ignore
+import pytest  # type: ignore
+
+from openwfn.basis import (  # type: ignore
+    compile_basis,
+    eval_basis_functions,
+    eval_s_type_gto,
+    iter_basis_blocks,
+    screen_shells,
+    shell_size,
+)
+from openwfn.constants import BOHR_TO_ANGSTROM  # type: ignore
+
+
+def _hermite_grid(n: int = 10) -> tuple[np.ndarray, np.ndarray]:
+    """Quadrature exact for polynomial * exp(-2 r^2) integrands (r in Bohr)."""
+    t, w = np.polynomial.hermite.hermgauss(n)
+    x = t / np.sqrt(2.0)
+    X, Y, Z = np.meshgrid(x, x, x, indexing="ij")
+    W = np.einsum("i,j,k->ijk", w, w, w).ravel() / 2.0 ** 1.5
+    pts = np.column_stack([X.ravel(), Y.ravel(), Z.ravel()])
+    return pts, W * np.exp(2.0 * np.sum(pts ** 2, axis=1))
+
+
+def _single_shell(shell_type: int) -> dict[str, list]:
+    data = {
+        "shell_types": [shell_type],
+        "primitives_per_shell": [1],
+        "shell_to_atom": [1],
+        "primitive_exponents": [1.0],
+        "contraction_coeffs": [0.7],
+    }
+    if shell_type == -1:
+        data["p_contraction_coeffs"] = [0.4]
+    return data
+
+
+@pytest.mark.parametrize("shell_type", [0, 1, -1, 2, -2, 3, -3, 4, -4])
+def test_basis_functions_are_normalized(shell_type):
+    pts, weights = _hermite_grid()
+    basis = compile_basis(_single_shell(shell_type), [(0.0, 0.0, 0.0)])
+    phi = eval_basis_functions(pts * BOHR_TO_ANGSTROM, basis)
+
+    assert phi.shape == (pts.shape[0], shell_size(shell_type))
+    overlap = phi.T @ (phi * weights[:, None])
+    assert np.diag(overlap) == pytest.approx(np.ones(shell_size(shell_type)), abs=1e-10)
+    if shell_type < -1:
+        # Pure functions are mutually orthogonal on one centre.
+        assert np.allclose(overlap, np.eye(shell_size(shell_type)), atol=1e-10)
+
+
+def test_pure_d_ordering_matches_gaussian():
+    pts = np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 0.0], [0.6, 0.0, 0.8], [0.0, 0.6, 0.8], [0.6, 0.8, 0.0]])
+    phi = eval_basis_functions(pts * BOHR_TO_ANGSTROM, compile_basis(_single_shell(-2), [(0.0, 0.0, 0.0)]))
+    d0, d1p, d1m, d2p, d2m = phi.T
+
+    assert d0[0] == pytest.approx(-2.0 * d0[1])
+    assert d1p[2] > 0.0 and d1m[2] == pytest.approx(0.0)
+    assert d1m[3] == pytest.approx(d1p[2])
+    assert d2p[1] > 0.0 and d2m[4] > 0.0
+
+
+def test_s_shell_matches_reference_kernel():
+    rng = np.random.default_rng(3)
+    pts = rng.normal(size=(50, 3))
+    alpha = np.array([3.0, 0.5])
+    d = np.array([0.3, 0.8])
+    data = {
+        "shell_types": [0],
+        "primitives_per_shell": [2],
+        "shell_to_atom": [1],
+        "primitive_exponents": list(alpha),
+        "contraction_coeffs": list(d),
+    }
+    phi = eval_basis_functions(pts * BOHR_TO_ANGSTROM, compile_basis(data, [(0.0, 0.0, 0.0)]))
+    ref = eval_s_type_gto(pts, np.zeros(3), alpha, d * (2.0 * alpha / np.pi) ** 0.75)
+
+    assert np.allclose(phi[:, 0] / ref, phi[0, 0] / ref[0])
+
+
+@pytest.mark.parametrize("shell_type", [0, 1, -1, 2, -2, 3, -3, 4, -4])
+def test_basis_derivatives_match_finite_differences(shell_type):
+    data = _single_shell(shell_type)
+    data["primitives_per_shell"] = [2]
+    data["primitive_exponents"] = [1.3, 0.4]
+    data["contraction_coeffs"] = [0.6, 0.5]
+    if shell_type == -1:
+        data["p_contraction_coeffs"] = [0.3, 0.7]
+    basis = compile_basis(data, [(0.1, -0.2, 0.05)])
+    rng = np.random.default_rng(3)
+    pts = rng.uniform(-1.5, 1.5, size=(40, 3))
+
+    d = eval_basis_functions(pts, basis, deriv=2)
+    assert np.allclose(d[0], eval_basis_functions(pts, basis))
+
+    h = 1e-4  # Angstrom
+    step = h / BOHR_TO_ANGSTROM
+    for i in range(3):
+        e = np.zeros(3)
+        e[i] = h
+        plus = eval_basis_functions(pts + e, basis, deriv=1)
+        minus = eval_basis_functions(pts - e, basis, deriv=1)
+        assert np.allclose((plus[0] - minus[0]) / (2 * step), d[1 + i], atol=1e-6)
+        for j in range(3):
+            k = 4 + {(0, 0): 0, (0, 1): 1, (0, 2): 2, (1, 1): 3, (1, 2): 4, (2, 2): 5}[tuple(sorted((i, j)))]
+            assert np.allclose((plus[1 + j] - minus[1 + j]) / (2 * step), d[k], atol=1e-6)
+
+
+def test_compile_basis_rejects_inconsistent_data():
+    data = _single_shell(0)
+    data["primitive_exponents"] = [1.0, 2.0]
+    with pytest.raises(ValueError, match="Inconsistent basis data"):
+        compile_basis(data, [(0.0, 0.0, 0.0)])
+
+
+def _water_basis(n_copies: int, shift: float):
+    from openwfn.fchk import parse_fchk_arrays, parse_fchk_basis, read_fchk  # type: ignore
+
+    lines = read_fchk("examples/water/water.fchk")
+    _, coords = parse_fchk_arrays(lines)
+    data = parse_fchk_basis(lines)
+    all_coords: list[tuple[float, float, float]] = []
+    merged: dict[str, list] = {key: [] for key in data}
+    for k in range(n_copies):
+        all_coords.extend((x + shift * k, y, z) for x, y, z in coords)
+        for key, values in data.items():
+            merged[key].extend([a + 3 * k for a in values] if key == "shell_to_atom" else values)
+    return compile_basis(merged, all_coords), all_coords
+
+
+def test_screened_blocks_match_dense_evaluation():
+    basis, coords = _water_basis(2, 3.0)
+    rng = np.random.default_rng(0)
+    pts = rng.uniform(-3.0, 6.0, size=(3000, 3))
+    dense = eval_basis_functions(pts, basis)
+
+    covered = np.zeros(len(pts), dtype=int)
+    for index, phi, ao_index in iter_basis_blocks(pts, basis, block_length=1.5, max_points=400):
+        residual = dense[index].copy()
+        residual[:, ao_index] -= phi
+        assert np.abs(residual).max() < 1e-9
+        covered[index] += 1
+    assert np.all(covered == 1)
+
+
+def test_screening_skips_distant_shells():
+    basis, _ = _water_basis(2, 40.0)
+    mask = screen_shells(basis, np.zeros(3), 1.0)
+
+    assert mask[:7].all()
+    assert not mask[7:].any()
+
+
+def test_basis_set_round_trips_through_disk_and_pickle(tmp_path):
+    import pickle
+
+    from openwfn.basis import BasisSet  # type: ignore
+    from openwfn.fchk import read_fchk  # type: ignore
+
+    basis = BasisSet.from_fchk(read_fchk("examples/water/water.fchk"))
+    pts = np.random.default_rng(7).uniform(-2.0, 2.0, size=(300, 3))
+    reference = eval_basis_functions(pts, basis)
+    assert basis.n_basis == reference.shape[1]
+    assert basis.shell_ao_offsets[0] == 0
+
+    basis.save(str(tmp_path / "basis"))
+    mapped = BasisSet.load(str(tmp_path / "basis"))
+    assert isinstance(mapped["exponents"], np.memmap)
+    assert np.array_equal(eval_basis_functions(pts, mapped), reference)
+
+    # Memory-mapped sets pickle by path; in-memory sets pickle their arrays.
+    assert len(pickle.dumps(mapped)) < len(pickle.dumps(basis))
+    for restored in (pickle.loads(pickle.dumps(mapped)), pickle.loads(pickle.dumps(basis))):
+        assert np.array_equal(eval_basis_functions(pts, restored), reference)
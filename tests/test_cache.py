@@ -0,0 +1,58 @@
+import numpy as np  # type: ignore
+
+from openwfn.basis import points_per_block  # type: ignore
+from openwfn.cache import BasisBlockCache, active_basis_cache, basis_cache  # type: ignore
+from openwfn.density import compute_density  # type: ignore
+from openwfn.grid import RegularGrid  # type: ignore
+from openwfn.mo import evaluate_mo  # type: ignore
+
+
+def test_density_and_orbitals_share_cached_basis_blocks(water):
+    _, coordinates, basis, P, C = water
+    points = RegularGrid.around(coordinates, margin=2.0, spacing=0.25).points()
+    rho, homo = compute_density(points, P, basis), evaluate_mo(points, 4, C, basis)
+
+    with basis_cache() as cache:
+        assert active_basis_cache() is cache
+        cached_rho = compute_density(points, P, basis)
+        n_blocks = cache.stats()["misses"]
+        cached_homo = evaluate_mo(points, 4, C, basis)
+        stats = cache.stats()
+    assert active_basis_cache() is None
+
+    assert np.array_equal(cached_rho, rho) and np.array_equal(cached_homo, homo)
+    assert n_blocks > 0 and stats["misses"] == n_blocks and stats["hits"] == n_blocks
+    # Different points (or a different basis) never hit the same entries.
+    with basis_cache(cache=cache):
+        compute_density(points + 0.01, P, basis)
+    assert cache.stats()["misses"] == 2 * n_blocks
+
+
+def test_cached_blocks_respect_memory_budget(water):
+    _, _, basis, P, _ = water
+    # Dense enough that one 2 A screening block holds more points than the budget allows.
+    points = np.random.default_rng(3).uniform(-0.9, 0.9, size=(6000, 3))
+    budget = 1024 ** 2
+    limit = points_per_block(basis, budget, extra_columns=basis["n_basis"])
+    with basis_cache() as cache:
+        rho = compute_density(points, P, basis, memory_budget=budget)
+        sizes = [phi.shape[0] for phi, _ in cache._blocks.values()]
+    assert sizes and max(sizes) <= limit < len(points)
+    assert np.allclose(rho, compute_density(points, P, basis, memory_budget=budget))
+
+
+def test_cache_evicts_least_recently_used_blocks_and_spills_to_disk(tmp_path):
+    cache = BasisBlockCache(max_bytes=250, spill_dir=tmp_path / "blocks")
+    ao = np.arange(3)
+    for name in "abc":
+        cache.put(name, np.full((10, 1), ord(name), dtype=float), ao)
+    cache.get("b")
+    cache.put("d", np.zeros((10, 1)), ao)
+    assert cache.stats()["blocks"] == 2 and cache.nbytes <= 250
+
+    # Evicted blocks come back from the spill directory, also in a new cache.
+    fresh = BasisBlockCache(max_bytes=0, spill_dir=tmp_path / "blocks")
+    phi, ao_index = fresh.get("a")
+    assert phi[0, 0] == ord("a") and ao_index.tolist() == [0, 1, 2]
+    assert fresh.get("missing") is None
+    assert fresh.stats() == {"blocks": 0, "nbytes": 0, "hits": 0, "disk_hits": 1, "misses": 1}
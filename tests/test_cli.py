@@ -1,15 +1,26 @@
 import subprocess
 import sys
 import os
+import re
 from pathlib import Path
 
+import numpy as np  # type: ignore
+
 from openwfn import __version__  # type: ignore
 from openwfn.cli import convert_chk_to_fchk  # type: ignore
+from openwfn.volume import VolumeStore  # type: ignore
 
 
 ROOT = Path(__file__).resolve().parents[1]
 
 
+def read_water_coordinates() -> np.ndarray:
+    from openwfn.fchk import parse_fchk_arrays, read_fchk  # type: ignore
+
+    _, coordinates = parse_fchk_arrays(read_fchk(str(ROOT / "examples" / "water" / "water.fchk")))
+    return np.asarray(coordinates)
+
+
 def run_cli(args: list[str]) -> subprocess.CompletedProcess[str]:
     env = os.environ.copy()
     existing = env.get("PYTHONPATH", "")
@@ -164,3 +175,251 @@ def test_convert_chk_to_fchk_reports_reuse(monkeypatch, tmp_path, capsys):
 
     assert result == str(out)
     assert "Reusing existing formatted checkpoint" in captured.out
+
+
+def test_cli_mo_exports_frontier_range(tmp_path):
+    out = tmp_path / "frontier.vtk"
+
+    result = run_cli(["examples/water/water.fchk", "mo", "HOMO-1:LUMO", "--export", str(out)])
+
+    assert result.returncode == 0
+    content = out.read_text()
+    assert "SCALARS MO_4_HOMO-1 float 1" in content
+    assert "SCALARS MO_6_LUMO float 1" in content
+
+
+def test_cli_mo_single_precision_matches_double(tmp_path):
+    outputs = {}
+    for precision in ("float64", "float32"):
+        out = tmp_path / f"homo_{precision}.vtk"
+        result = run_cli(["examples/water/water.fchk", "mo", "HOMO", "--export", str(out), "--precision", precision])
+        assert result.returncode == 0
+        outputs[precision] = out.read_text()
+
+    header, values64 = outputs["float64"].split("LOOKUP_TABLE default\n")
+    _, values32 = outputs["float32"].split("LOOKUP_TABLE default\n")
+    psi64 = np.array(values64.split(), dtype=float)
+    psi32 = np.array(values32.split(), dtype=float)
+    assert psi32.shape == psi64.shape
+    assert np.max(np.abs(psi32 - psi64)) < 1e-4 * np.abs(psi64).max()
+
+
+def test_cli_density_out_of_core_matches_in_memory(tmp_path):
+    outputs = []
+    for extra in ([], ["--out-of-core"]):
+        out = tmp_path / f"density{len(extra)}.vtk"
+        result = run_cli(["examples/water/water.fchk", "density", "--export", str(out), *extra])
+        assert result.returncode == 0
+        outputs.append(out.read_text().split("POINT_DATA")[1])
+
+    assert outputs[0] == outputs[1]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["density0.vtk", "density1.vtk"]
+
+
+def test_cli_density_symmetry_reports_point_group(tmp_path):
+    assert re.search(r"Point Grp:\S*\s+C2v", run_cli(["examples/water/water.fchk", "summary"]).stdout)
+
+    out = tmp_path / "density.vtk"
+    result = run_cli(["examples/water/water.fchk", "density", "--symmetry", "--export", str(out)])
+    assert result.returncode == 0
+    assert "C2v (4 operations, 4 mapping the grid onto itself)" in result.stdout
+    assert out.exists()
+
+
+def test_summary_skips_point_group_for_large_systems(monkeypatch, capsys):
+    from openwfn import commands  # type: ignore
+
+    monkeypatch.setattr(commands, "SUMMARY_SYMMETRY_MAX_ATOMS", 2)
+    water = [(0.0, 0.0, 0.117), (0.0, 0.757, -0.469), (0.0, -0.757, -0.469)]
+    assert commands.cmd_summary({}, [8, 1, 1], water) == 0
+    assert "unavailable (more than 2 atoms)" in capsys.readouterr().out
+
+
+def test_cli_promolecular_density_from_xyz(tmp_path):
+    xyz = tmp_path / "water.xyz"
+    xyz.write_text("3\nwater\nO 0.0 0.0 0.117\nH 0.0 0.757 -0.469\nH 0.0 -0.757 -0.469\n")
+    out = tmp_path / "promolecule.vtk"
+    result = run_cli([str(xyz), "density", "--promolecular", "--grid-size", "0.3", "--export", str(out)])
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Promolecular_Density" in out.read_text()
+
+    result = run_cli([str(xyz), "density", "--export", str(out)])
+    assert result.returncode != 0
+    assert "--promolecular" in result.stdout + result.stderr
+
+
+def test_cli_density_honours_grid_size(tmp_path):
+    out = tmp_path / "coarse.vtk"
+
+    result = run_cli(["examples/water/water.fchk", "density", "--grid-size", "12x10x8", "--export", str(out)])
+
+    assert result.returncode == 0
+    content = out.read_text()
+    assert "DIMENSIONS 12 10 8" in content
+    assert "POINT_DATA 960" in content
+
+
+def test_cli_density_binary_outputs_match_ascii(tmp_path):
+    ascii_out, vti_out = tmp_path / "rho.vtk", tmp_path / "rho.vti"
+
+    assert run_cli(["examples/water/water.fchk", "density", "--export", str(ascii_out)]).returncode == 0
+    assert run_cli(["examples/water/water.fchk", "density", "--export", str(vti_out), "--encoding", "raw"]).returncode == 0
+
+    rho = np.array(ascii_out.read_text().split("LOOKUP_TABLE default\n")[1].split(), dtype=float)
+    appended = vti_out.read_bytes().split(b'encoding="raw">\n   _')[1]
+    assert np.allclose(np.frombuffer(appended[8:8 + 4 * rho.size], dtype="<f4"), rho, rtol=1e-5, atol=1e-12)
+
+    result = run_cli(["examples/water/water.fchk", "density", "--export", str(ascii_out), "--encoding", "zlib"])
+    assert result.returncode != 0
+    assert "ascii or binary" in result.stdout + result.stderr
+
+
+def test_cli_basis_cache_is_reused_between_density_and_mo(tmp_path):
+    cache = tmp_path / "basis-cache"
+    base = ["examples/water/water.fchk"]
+    options = ["--grid-size", "12x10x8", "--basis-cache", str(cache)]
+
+    first = run_cli(base + ["density", "--export", str(tmp_path / "rho.cube")] + options)
+    second = run_cli(base + ["mo", "HOMO", "--export", str(tmp_path / "homo.cube")] + options)
+    assert first.returncode == 0 and second.returncode == 0
+    n_blocks = re.search(r"0 of (\d+) blocks reused", first.stdout).group(1)
+    assert f"{n_blocks} of {n_blocks} blocks reused" in second.stdout
+    assert any(cache.glob("*.npz"))
+
+
+def test_cli_volume_store_exports_regions(tmp_path):
+    store, plane = tmp_path / "rho.owv", tmp_path / "plane.cube"
+
+    result = run_cli(["examples/water/water.fchk", "density", "--grid-size", "12x10x8", "--export", str(store)])
+    assert result.returncode == 0
+    assert (store / "volume.json").is_file()
+
+    result = run_cli([str(store), "volume", "--region", ":,:,3", "--export", str(plane)])
+    assert result.returncode == 0
+    assert "SCF_Density" in result.stdout
+    header = plane.read_text().splitlines()
+    assert [int(line.split()[0]) for line in header[3:6]] == [12, 10, 1]
+
+    # Store fields go through scratch memory maps that are removed afterwards.
+    copy = tmp_path / "copy.owv"
+    assert run_cli([str(store), "volume", "--export", str(copy)]).returncode == 0
+    assert np.array_equal(VolumeStore(copy).read("SCF_Density"), VolumeStore(store).read("SCF_Density"))
+    assert not list(tmp_path.glob("openwfn-*"))
+
+
+def test_cli_volume_interpolates_and_resamples_cube_files(tmp_path):
+    cube, coarse = tmp_path / "rho.cube", tmp_path / "coarse.vti"
+
+    result = run_cli(["examples/water/water.fchk", "density", "--grid-size", "0.15", "--export", str(cube)])
+    assert result.returncode == 0
+
+    result = run_cli(
+        [str(cube), "volume", "--at-atoms", "--method", "cubic", "--resample", "12x12x12", "--export", str(coarse)]
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Values at Atoms" in result.stdout
+    oxygen = float(result.stdout.split("O1:")[1].split("SCF_Density")[1].split()[0])
+    assert oxygen > 10.0
+    assert 'WholeExtent="0 11 0 11 0 11"' in coarse.read_text(errors="ignore")
+
+
+def test_cli_slice_and_profile_sample_only_the_requested_points(tmp_path):
+    plane, line = tmp_path / "plane.npz", tmp_path / "oh.csv"
+
+    result = run_cli(["examples/water/water.fchk", "slice", "--atoms", "1,2,3", "--spacing", "0.2", "--export", str(plane)])
+    assert result.returncode == 0
+    data = np.load(plane)
+    assert data["SCF_Density"].shape == (data["v"].size, data["u"].size)
+    # All three atoms lie in the plane, so the map peaks next to the oxygen nucleus.
+    iv, iu = np.unravel_index(np.argmax(data["SCF_Density"]), data["SCF_Density"].shape)
+    peak = data["origin"] + iu * data["axes"][0] + iv * data["axes"][1]
+    oxygen = read_water_coordinates()[0]
+    assert np.linalg.norm(peak - oxygen) < 0.2
+
+    result = run_cli(["examples/water/water.fchk", "profile", "1", "2", "--points", "41", "--extend", "0", "--export", str(line)])
+    assert result.returncode == 0
+    rows = line.read_text().splitlines()
+    assert rows[0] == "s,x,y,z,SCF_Density"
+    assert len(rows) == 42
+
+    result = run_cli(["examples/water/water.fchk", "slice", "--export", str(plane)])
+    assert result.returncode != 0
+    assert "--atoms" in result.stdout + result.stderr
+
+
+def test_cli_density_estimate_only_reports_costs(tmp_path):
+    out = tmp_path / "never.vtk"
+
+    result = run_cli(["examples/water/water.fchk", "density", "--estimate", "--max-memory", "64M", "--export", str(out)])
+
+    assert result.returncode == 0
+    assert "Peak memory (est.)" in result.stdout
+    assert "Runtime (est.)" in result.stdout
+    assert not out.exists()
+
+    result = run_cli(["examples/water/water.fchk", "density", "--max-memory", "1M", "--export", str(out)])
+    assert result.returncode != 0
+    assert "--max-memory" in result.stdout + result.stderr
+    assert not out.exists()
+
+
+def test_cli_mo_exports_isosurface_meshes(tmp_path):
+    out = tmp_path / "homo.obj"
+
+    result = run_cli(["examples/water/water.fchk", "mo", "HOMO", "--isosurface", "0.05", "--export", str(out)])
+
+    assert result.returncode == 0
+    names = [line.split()[1] for line in out.read_text().splitlines() if line.startswith("o ")]
+    assert names == ["MO_5_HOMO_+0.05", "MO_5_HOMO_-0.05"]
+
+    result = run_cli(["examples/water/water.fchk", "mo", "HOMO", "--isosurface", "0.05", "--export", str(tmp_path / "homo.vtk")])
+    assert result.returncode != 0
+    assert ".obj, .ply or .html" in result.stdout + result.stderr
+
+
+def test_cli_density_spin_requires_open_shell_checkpoint(tmp_path):
+    out = tmp_path / "spin.vtk"
+
+    result = run_cli(["examples/water/water.fchk", "density", "--spin", "--export", str(out)])
+
+    assert result.returncode != 0
+    assert "Spin SCF Density not found" in result.stdout + result.stderr
+    assert not out.exists()
+
+
+def test_cli_integrate_reports_electron_count():
+    result = run_cli(["examples/water/water.fchk", "integrate"])
+
+    assert result.returncode == 0
+    match = re.search(r"Integrated electrons:(?:\x1b\[[0-9;]*m)?\s*([0-9.]+)", result.stdout)
+    assert match is not None
+    assert abs(float(match.group(1)) - 10.0) < 1e-4
+
+
+def test_cli_integrate_charges_use_fchk_nuclear_charges(tmp_path):
+    # Pretend the oxygen carries an ECP for its two 1s electrons.
+    source = Path("examples/water/water.fchk").read_text()
+    ecp = tmp_path / "water_ecp.fchk"
+    ecp.write_text(source.replace("  8.00000000E+00  1.00000000E+00  1.00000000E+00", "  6.00000000E+00  1.00000000E+00  1.00000000E+00", 1))
+
+    charges = {}
+    for path in ("examples/water/water.fchk", str(ecp)):
+        result = run_cli([path, "integrate", "--angular-degree", "11"])
+        assert result.returncode == 0, result.stdout + result.stderr
+        row = re.search(r"\b1\s+O\s+([0-9.]+)\s+([-+][0-9.]+)", re.sub(r"\x1b\[[0-9;]*m", "", result.stdout))
+        assert row is not None
+        charges[path] = float(row.group(2))
+        assert abs(charges[path] - ((6.0 if path == str(ecp) else 8.0) - float(row.group(1)))) < 1e-5
+    assert abs(charges[str(ecp)] - (charges["examples/water/water.fchk"] - 2.0)) < 1e-5
+
+
+def test_cli_adaptive_density_to_uniform_grid(tmp_path):
+    out = tmp_path / "rho.vti"
+
+    result = run_cli(
+        ["examples/water/water.fchk", "density", "--adaptive", "--to-uniform", "--grid-size", "9x8x7", "--export", str(out)]
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert 'WholeExtent="0 8 0 7 0 6"' in out.read_text(errors="ignore")
+    # --resample belongs to `volume` and takes a grid; density no longer accepts it.
+    assert run_cli(["examples/water/water.fchk", "density", "--adaptive", "--resample", "--export", str(out)]).returncode != 0
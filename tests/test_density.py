@@ -0,0 +1,107 @@
+import numpy as np  # type: ignore
+import pytest  # type: ignore
+
+from openwfn.basis import eval_basis_functions  # type: ignore
+from openwfn.constants import BOHR_TO_ANGSTROM  # type: ignore
+from openwfn.density import (  # type: ignore
+    compute_density,
+    compute_density_derivatives,
+    compute_spin_densities,
+    reduced_density_gradient,
+    unpack_triangular,
+)
+from openwfn.grid import make_bounding_box_grid  # type: ignore
+
+
+def test_unpack_triangular_is_symmetric():
+    matrix = unpack_triangular([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    assert np.array_equal(matrix, np.array([[1.0, 2.0, 4.0], [2.0, 3.0, 5.0], [4.0, 5.0, 6.0]]))
+
+    with pytest.raises(ValueError, match="expected 6"):
+        unpack_triangular([1.0, 2.0, 3.0], 3)
+
+
+def test_blocked_density_matches_dense_contraction(water):
+    _, _, basis, P, _ = water
+    rng = np.random.default_rng(1)
+    pts = rng.uniform(-3.0, 3.0, size=(2000, 3))
+
+    phi = eval_basis_functions(pts, basis)
+    reference = np.einsum("ij,jk,ik->i", phi, P, phi)
+
+    rho = compute_density(pts, P, basis, memory_budget=64 * 1024)
+    assert np.allclose(rho, reference, rtol=1e-10, atol=1e-14)
+
+
+def test_water_density_integrates_to_electron_count(water):
+    _, coordinates, basis, P, _ = water
+    spacing = 0.12
+    points, _ = make_bounding_box_grid(coordinates, margin=4.0, spacing=spacing)
+
+    rho = compute_density(points, P, basis)
+    electrons = rho.sum() * (spacing / BOHR_TO_ANGSTROM) ** 3
+    assert electrons == pytest.approx(10.0, rel=0.02)
+
+
+def test_compute_density_rejects_mismatched_matrix(water):
+    _, _, basis, _, _ = water
+    with pytest.raises(ValueError, match="does not match basis size"):
+        compute_density(np.zeros((1, 3)), np.eye(3), basis)
+
+
+def test_density_derivatives_match_finite_differences(water):
+    _, _, basis, P, _ = water
+    rng = np.random.default_rng(5)
+    pts = rng.uniform(-2.0, 2.0, size=(200, 3))
+    result = compute_density_derivatives(pts, P, basis, deriv=2)
+
+    assert np.allclose(result["rho"], compute_density(pts, P, basis), rtol=1e-12, atol=1e-16)
+    h = 1e-4
+    step = h / BOHR_TO_ANGSTROM
+    laplacian = -6.0 * compute_density(pts, P, basis)
+    for i in range(3):
+        e = np.zeros(3)
+        e[i] = h
+        plus = compute_density(pts + e, P, basis)
+        minus = compute_density(pts - e, P, basis)
+        assert np.allclose((plus - minus) / (2 * step), result["gradient"][:, i], rtol=1e-6, atol=1e-8)
+        laplacian += plus + minus
+    assert np.allclose(laplacian / step ** 2, result["laplacian"], rtol=1e-4, atol=1e-4)
+    assert np.all(result["tau"] >= 0.0)
+
+
+def test_reduced_density_gradient_of_uniform_gas_is_zero():
+    s = reduced_density_gradient(np.array([0.5, 0.0]), np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]]))
+    assert np.array_equal(s, np.zeros(2))
+    s = reduced_density_gradient(np.array([1.0]), np.array([[2.0 * (3.0 * np.pi ** 2) ** (1.0 / 3.0), 0.0, 0.0]]))
+    assert s == pytest.approx([1.0])
+
+
+def test_spin_densities_match_separate_alpha_beta_contractions(water):
+    _, _, basis, _, C = water
+    # Doublet-like occupation: 5 alpha (HOMO singly occupied) and 4 beta electrons.
+    P_alpha = C[:, :5] @ C[:, :5].T
+    P_beta = C[:, :4] @ C[:, :4].T
+    pts = np.random.default_rng(6).uniform(-3.0, 3.0, size=(1500, 3))
+
+    fields = compute_spin_densities(pts, P_alpha + P_beta, P_alpha - P_beta, basis, memory_budget=64 * 1024)
+    assert np.allclose(fields["alpha"], compute_density(pts, P_alpha, basis), rtol=1e-10, atol=1e-14)
+    assert np.allclose(fields["beta"], compute_density(pts, P_beta, basis), rtol=1e-10, atol=1e-14)
+    assert np.allclose(fields["total"], fields["alpha"] + fields["beta"])
+    assert np.all(fields["spin"] >= -1e-14)
+
+
+def test_single_precision_density_matches_double(water):
+    _, coordinates, basis, P, _ = water
+    points, _ = make_bounding_box_grid(coordinates, margin=3.0, spacing=0.3, dtype=np.float32)
+    assert points.dtype == np.float32
+
+    rho32 = compute_density(points, P, basis)
+    rho64 = compute_density(points.astype(np.float64), P, basis)
+    assert rho32.dtype == np.float32
+    assert np.max(np.abs(rho32 - rho64)) < 1e-5 * rho64.max()
+
+    deriv32 = compute_density_derivatives(points[:500], P, basis, deriv=2)
+    deriv64 = compute_density_derivatives(points[:500].astype(np.float64), P, basis, deriv=2)
+    assert deriv32["laplacian"].dtype == np.float32
+    assert np.allclose(deriv32["gradient"], deriv64["gradient"], atol=1e-4 * np.abs(deriv64["gradient"]).max())
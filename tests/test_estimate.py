@@ -0,0 +1,45 @@
+import numpy as np  # type: ignore
+import pytest  # type: ignore
+
+from openwfn.estimate import format_bytes, parse_memory_size, plan_grid_job  # type: ignore
+from openwfn.grid import RegularGrid  # type: ignore
+
+
+def test_parse_memory_size_units():
+    assert parse_memory_size("512M") == 512 * 1024 ** 2
+    assert parse_memory_size("1.5GiB") == int(1.5 * 1024 ** 3)
+    assert parse_memory_size("4096") == 4096
+    assert format_bytes(3 * 1024 ** 3) == "3.00 GiB"
+    for bad in ("lots", "0", "-1G"):
+        with pytest.raises(ValueError):
+            parse_memory_size(bad)
+
+
+def test_plan_fits_chunks_within_max_memory(water):
+    _, coordinates, basis, P, _ = water
+    grid = RegularGrid.around(coordinates, spacing=0.05)
+
+    free = plan_grid_job(basis, grid, "density", P, calibrate=False)
+    assert free["output_memory"] == grid.n_points * 8
+    assert free["bytes_written"] >= 13 * grid.n_points
+    assert free["runtime"] is None
+
+    capped = plan_grid_job(basis, grid, "density", P, max_memory=64 * 1024 ** 2, calibrate=False)
+    assert capped["peak_memory"] <= 64 * 1024 ** 2
+    assert capped["chunk_points"] < free["chunk_points"]
+    assert capped["memory_budget"] < free["memory_budget"]
+
+    single = plan_grid_job(basis, grid, "density", P, dtype=np.float32, out_of_core=True, calibrate=False)
+    assert single["output_memory"] == 0
+    assert single["scratch_bytes"] == grid.n_points * 4
+
+    with pytest.raises(ValueError, match="out-of-core"):
+        plan_grid_job(basis, grid, "density", P, max_memory=grid.n_points * 8, calibrate=False)
+
+
+def test_plan_calibrates_runtime(water):
+    _, coordinates, basis, P, _ = water
+    plan = plan_grid_job(basis, RegularGrid.around(coordinates, spacing=0.1), "mo", P[:, :3])
+    assert plan["n_fields"] == 3
+    assert plan["seconds_per_point"] > 0.0
+    assert plan["runtime"] > plan["seconds_per_point"] * plan["n_points"]
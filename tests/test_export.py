@@ -1,7 +1,14 @@
+import gzip
+import re
+import zlib
+
 import numpy as np  # type: ignore
 import pytest  # type: ignore
+from numpy.lib.format import open_memmap  # type: ignore
 
-from openwfn.export import export_molecule_viewer, export_vtk  # type: ignore
+from openwfn.cube import read_cube  # type: ignore
+from openwfn.export import export_csv, export_cube, export_molecule_viewer, export_vti, export_vtk, export_vtk_grid  # type: ignore
+from openwfn.grid import RegularGrid  # type: ignore
 
 
 def test_export_vtk_writes_actual_spacing(tmp_path):
@@ -54,3 +61,118 @@ def test_export_molecule_viewer_writes_inline_viewer(tmp_path):
     assert 'data-download="png"' in content
     assert 'data-download="jpeg"' in content
     assert 'data-download="svg"' in content
+
+
+def test_export_vtk_unstructured_writes_voxels(tmp_path):
+    from openwfn.export import export_vtk_unstructured  # type: ignore
+
+    corners = np.array([[x, y, z] for z in (0, 1) for y in (0, 1) for x in (0, 1)], dtype=float)
+    out = tmp_path / "cells.vtk"
+    export_vtk_unstructured(str(out), corners, np.arange(8)[None, :], {"a": np.arange(8.0), "b": np.ones(8)})
+
+    content = out.read_text()
+    assert "DATASET UNSTRUCTURED_GRID" in content
+    assert "CELLS 1 9" in content
+    assert "CELL_TYPES 1\n11" in content
+    assert "SCALARS a float 1" in content and "SCALARS b float 1" in content
+
+
+def test_export_cube_round_trips_multiple_fields(tmp_path):
+    c, s = np.cos(0.4), np.sin(0.4)
+    grid = RegularGrid([0.5, -1.0, 2.0], (0.3, 0.25, 0.2), (4, 3, 7), axes=[[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+    rho = np.linspace(1e-6, 2.0, grid.n_points)
+    out = tmp_path / "fields.cube"
+
+    export_cube(str(out), grid, {"rho": rho, "half": -0.5 * rho}, [8, 1], [(0.0, 0.0, 0.0), (0.0, 0.76, 0.59)])
+
+    lines = out.read_text().splitlines()
+    assert lines[2].split()[0] == "-2"
+    assert lines[8].split() == ["2", "1", "2"]
+    # 14 values per (x, y) row: two full lines and one of two values.
+    assert [len(line.split()) for line in lines[9:12]] == [6, 6, 2]
+
+    dest = open_memmap(tmp_path / "values.npy", mode="w+", dtype=np.float64, shape=(grid.n_points, 2))
+    cube = read_cube(out, out=dest)
+    assert cube["values"] is dest
+    assert cube["grid"].shape == grid.shape
+    assert np.allclose(cube["grid"].vectors, grid.vectors, atol=1e-6)
+    assert np.allclose(cube["grid"].points(), grid.points(), atol=1e-5)
+    assert cube["atomic_numbers"] == [8, 1]
+    assert np.allclose(cube["coordinates"][1], (0.0, 0.76, 0.59), atol=1e-6)
+    assert np.allclose(dest[:, 0], rho, rtol=1e-5) and np.allclose(dest[:, 1], -0.5 * rho, rtol=1e-5)
+
+
+def test_read_cube_rejects_truncated_data(tmp_path):
+    grid = RegularGrid([0.0, 0.0, 0.0], 0.2, (3, 3, 3))
+    out = tmp_path / "short.cube"
+    export_cube(str(out), grid, np.ones(grid.n_points), [1], [(0.0, 0.0, 0.0)])
+    out.write_text("\n".join(out.read_text().splitlines()[:-2]) + "\n")
+
+    with pytest.raises(ValueError, match="holds 21 values"):
+        read_cube(out)
+
+
+def _ramp_grid() -> tuple[RegularGrid, np.ndarray]:
+    grid = RegularGrid([0.0, 1.0, 2.0], (0.1, 0.2, 0.3), (5, 4, 3))
+    i, j, k = np.unravel_index(np.arange(grid.n_points), grid.shape)
+    return grid, 100.0 * i + 10.0 * j + k
+
+
+def test_export_vtk_grid_writes_x_fastest_ascii_and_binary(tmp_path):
+    grid, values = _ramp_grid()
+    expected = values.reshape(grid.shape).transpose(2, 1, 0).ravel()
+
+    export_vtk_grid(str(tmp_path / "a.vtk"), grid, values)
+    text = tmp_path.joinpath("a.vtk").read_text()
+    assert np.allclose(np.array(text.split("LOOKUP_TABLE default\n")[1].split(), dtype=float), expected)
+
+    export_vtk_grid(str(tmp_path / "b.vtk"), grid, {"ramp": values, "neg": -values}, binary=True)
+    raw = tmp_path.joinpath("b.vtk").read_bytes()
+    assert b"\nBINARY\n" in raw
+    blocks = raw.split(b"LOOKUP_TABLE default\n")[1:]
+    assert np.array_equal(np.frombuffer(blocks[0][: 4 * grid.n_points], dtype=">f4"), expected)
+    assert np.array_equal(np.frombuffer(blocks[1][: 4 * grid.n_points], dtype=">f4"), -expected)
+
+
+@pytest.mark.parametrize("encoding", ["raw", "zlib"])
+def test_export_vti_appended_fields(tmp_path, encoding):
+    grid, values = _ramp_grid()
+    expected = values.reshape(grid.shape).transpose(2, 1, 0).ravel()
+    out = tmp_path / "grid.vti"
+
+    export_vti(str(out), grid, {"ramp": values, "neg": -values}, encoding=encoding)
+
+    content = out.read_bytes()
+    xml, appended = content.split(b'<AppendedData encoding="raw">\n   _')
+    assert b'WholeExtent="0 4 0 3 0 2"' in xml
+    assert (b'compressor="vtkZLibDataCompressor"' in xml) == (encoding == "zlib")
+    offsets = [int(v) for v in re.findall(rb'offset="(\d+)"', xml)]
+    for offset, sign in zip(offsets, (1.0, -1.0)):
+        if encoding == "raw":
+            n_bytes = int(np.frombuffer(appended[offset:offset + 8], dtype="<u8")[0])
+            data = appended[offset + 8:offset + 8 + n_bytes]
+        else:
+            n_blocks = int(np.frombuffer(appended[offset:offset + 8], dtype="<u8")[0])
+            header = np.frombuffer(appended[offset:offset + 8 * (3 + n_blocks)], dtype="<u8")
+            start, data = offset + 8 * (3 + n_blocks), b""
+            for size in header[3:]:
+                data += zlib.decompress(appended[start:start + int(size)])
+                start += int(size)
+        assert np.array_equal(np.frombuffer(data, dtype="<f4"), sign * expected)
+
+
+def test_export_csv_streams_grid_and_point_rows(tmp_path):
+    grid = RegularGrid([-1.25, 0.5, 2.0], (0.1, 0.2, 0.3), (7, 5, 4))
+    rho = np.linspace(0.0, 3.0, grid.n_points)
+    expected = "x,y,z,rho,spin\n" + "".join(
+        f"{x:.6f},{y:.6f},{z:.6f},{a:.6e},{b:.6e}\n" for (x, y, z), a, b in zip(grid.points(), rho, -rho)
+    )
+
+    export_csv(str(tmp_path / "grid.csv"), grid, {"rho": rho, "spin": -rho})
+    export_csv(str(tmp_path / "points.csv"), grid.points(), {"rho": rho, "spin": -rho})
+    export_csv(str(tmp_path / "grid.csv.gz"), grid, {"rho": rho, "spin": -rho})
+
+    assert (tmp_path / "grid.csv").read_text() == expected
+    assert (tmp_path / "points.csv").read_text() == expected
+    with gzip.open(tmp_path / "grid.csv.gz", "rt") as f:
+        assert f.read() == expected
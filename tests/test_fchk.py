@@ -1,5 +1,5 @@
 import pytest  # type: ignore
-from openwfn.fchk import parse_fchk_arrays, parse_fchk_scalars  # type: ignore
+from openwfn.fchk import parse_fchk_arrays, parse_fchk_nuclear_charges, parse_fchk_scalars  # type: ignore
 
 
 BOHR = 0.52917721092
@@ -46,3 +46,14 @@ def test_parse_fchk_arrays_rejects_malformed_coordinate_count():
     ]
     with pytest.raises(ValueError, match="multiple of 3"):
         parse_fchk_arrays(lines)
+
+
+def test_parse_fchk_nuclear_charges():
+    lines = [
+        "Atomic numbers                 I   N= 2\n",
+        "53 1\n",
+        "Nuclear charges                R   N= 2\n",
+        "  7.00000000E+00  1.00000000E+00\n",
+    ]
+    assert parse_fchk_nuclear_charges(lines) == [7.0, 1.0]
+    assert parse_fchk_nuclear_charges(lines[:2]) == []
@@ -0,0 +1,50 @@
+import numpy as np  # type: ignore
+import pytest  # type: ignore
+
+from openwfn.geometry import center_of_mass  # type: ignore
+from openwfn.graph import build_graph, fragment_table, group_identical_fragments  # type: ignore
+
+
+WATER = [(0.000, 0.000, 0.000), (0.758, 0.000, 0.504), (-0.758, 0.000, 0.504)]
+
+
+def _water_box(n: int) -> tuple[list[int], list[tuple[float, float, float]], list[list[int]]]:
+    atomic_numbers: list[int] = []
+    coordinates: list[tuple[float, float, float]] = []
+    components: list[list[int]] = []
+    for k in range(n):
+        offset = 5.0 * k
+        components.append([len(atomic_numbers) + 1, len(atomic_numbers) + 2, len(atomic_numbers) + 3])
+        atomic_numbers.extend([8, 1, 1])
+        coordinates.extend((x + offset, y, z) for x, y, z in WATER)
+    return atomic_numbers, coordinates, components
+
+
+def test_fragment_table_matches_per_fragment_reference():
+    atomic_numbers, coordinates, components = _water_box(4)
+    atomic_numbers.append(6)
+    coordinates.append((-10.0, 0.0, 0.0))
+    components.append([len(atomic_numbers)])
+
+    table = fragment_table(atomic_numbers, coordinates, components, charges=[-0.8, 0.4, 0.4] * 4 + [0.0])
+
+    assert table["formula"] == ["H2O"] * 4 + ["C"]
+    assert list(table["n_atoms"]) == [3, 3, 3, 3, 1]
+    assert table["mass"][0] == pytest.approx(18.015)
+    for f, nodes in enumerate(components):
+        com = center_of_mass([atomic_numbers[n - 1] for n in nodes], [coordinates[n - 1] for n in nodes])
+        assert table["center_of_mass"][f] == pytest.approx(com)
+    assert table["radius_of_gyration"][4] == pytest.approx(0.0)
+    assert np.allclose(table["charge"], 0.0)
+
+
+def test_group_identical_fragments_collapses_solvent():
+    atomic_numbers, coordinates, components = _water_box(50)
+    bonds = [(c[0], c[1], 0.96) for c in components] + [(c[0], c[2], 0.96) for c in components]
+    comps = build_graph(len(atomic_numbers), bonds).connected_components()
+
+    groups = group_identical_fragments(fragment_table(atomic_numbers, coordinates, comps)["formula"])
+
+    assert len(groups) == 1
+    assert groups[0][0] == "H2O"
+    assert len(groups[0][1]) == 50
@@ -0,0 +1,73 @@
+import numpy as np  # type: ignore
+import pytest  # type: ignore
+
+from openwfn.constants import BOHR_TO_ANGSTROM  # type: ignore
+from openwfn.grid import RegularGrid, line_grid, make_bounding_box_grid, parse_grid_size, plane_grid  # type: ignore
+
+
+COORDS = [(0.0, 0.0, 0.1), (1.23, -0.7, 0.45)]
+
+
+def test_regular_grid_blocks_match_meshgrid_points():
+    points, shape = make_bounding_box_grid(COORDS, margin=2.0, spacing=0.3)
+    x, y, z = (np.arange(lo - 2.0, hi + 2.0, 0.3) for lo, hi in zip(np.min(COORDS, 0), np.max(COORDS, 0)))
+    X, Y, Z = np.meshgrid(x, y, z, indexing="ij")
+    assert shape == X.shape
+    assert np.allclose(points, np.column_stack([X.ravel(), Y.ravel(), Z.ravel()]))
+
+    grid = RegularGrid.around(COORDS, margin=2.0, spacing=0.3)
+    blocks = list(grid.iter_blocks(block_points=777, dtype=np.float32))
+    assert [b[0] for b in blocks] == list(range(0, len(grid), 777))
+    assert blocks[-1][2].dtype == np.float32
+    assert np.allclose(np.concatenate([b[2] for b in blocks]), points, atol=1e-5)
+
+
+def test_rotated_grid_points_and_headers():
+    c, s = np.cos(0.3), np.sin(0.3)
+    axes = [[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]]
+    grid = RegularGrid([1.0, 2.0, 3.0], 0.5, (2, 3, 4), axes=axes)
+
+    i, j, k = np.unravel_index(17, grid.shape)
+    expected = np.array([1.0, 2.0, 3.0]) + 0.5 * (i * np.array(axes[0]) + j * np.array(axes[1]) + k * np.array(axes[2]))
+    assert np.allclose(grid.points(17, 18)[0], expected)
+    assert "rotated" in repr(grid)
+
+    with pytest.raises(ValueError, match="rotated"):
+        grid.vtk_header()
+    header = grid.cube_header([8], [(0.0, 0.0, 0.0)]).splitlines()
+    assert header[2].split()[0] == "1"
+    assert [int(line.split()[0]) for line in header[3:6]] == [2, 3, 4]
+    assert np.allclose([float(v) for v in header[3].split()[1:]], np.array(axes[0]) * 0.5 / BOHR_TO_ANGSTROM, atol=1e-6)
+    assert header[6].split()[:2] == ["8", "8.000000"]
+
+    with pytest.raises(ValueError, match="orthonormal"):
+        RegularGrid([0, 0, 0], 0.5, (2, 2, 2), axes=np.ones((3, 3)))
+
+
+def test_parse_grid_size_accepts_shape_or_spacing():
+    grid = parse_grid_size("10x12x14", COORDS, margin=3.0)
+    assert grid.shape == (10, 12, 14)
+    assert np.allclose(grid.points(len(grid) - 1)[0], np.max(COORDS, axis=0) + 3.0)
+    assert grid.vtk_header()[0] == "DIMENSIONS 10 12 14"
+
+    assert parse_grid_size("0.25", COORDS).shape == RegularGrid.around(COORDS, spacing=0.25).shape
+    assert parse_grid_size(None, COORDS).shape == make_bounding_box_grid(COORDS)[1]
+    for bad in ("40x40", "fine", "-0.1", "1x5x5"):
+        with pytest.raises(ValueError):
+            parse_grid_size(bad, COORDS)
+
+
+def test_plane_and_line_grids():
+    coords = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)]
+    plane = plane_grid((0.0, 0.0, 0.0), (0.0, 0.0, 2.0), coords, spacing=0.25, margin=1.0, in_plane=(1.0, 1.0, 0.0))
+
+    assert plane.shape[2] == 1
+    assert np.allclose(plane.points()[:, 2], 0.0)
+    assert np.allclose(plane.axes[0], np.array([1.0, 1.0, 0.0]) / np.sqrt(2.0))
+    assert np.allclose(np.cross(plane.axes[0], plane.axes[1]), [0.0, 0.0, 1.0])
+    with pytest.raises(ValueError, match="not parallel"):
+        plane_grid((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), coords, in_plane=(0.0, 0.0, 3.0))
+
+    line = line_grid((1.0, 1.0, 1.0), (1.0, 1.0, 3.0), n_points=5, extend=0.5)
+    assert line.shape == (5, 1, 1)
+    assert np.allclose(line.points(), [(1.0, 1.0, z) for z in (0.5, 1.25, 2.0, 2.75, 3.5)])
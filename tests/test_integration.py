@@ -0,0 +1,129 @@
+import math
+import time
+
+import numpy as np  # type: ignore
+import pytest  # type: ignore
+
+from openwfn.density import compute_density  # type: ignore
+from openwfn.fchk import parse_fchk_arrays  # type: ignore
+from openwfn import integration  # type: ignore
+from openwfn.integration import (  # type: ignore
+    angular_grid,
+    atomic_integrals,
+    lebedev_grid,
+    molecular_grid,
+    radial_grid,
+)
+
+
+def _sphere_moment(a: int, b: int, c: int) -> float:
+    """Exact integral of x^a y^b z^c over the unit sphere."""
+    if a % 2 or b % 2 or c % 2:
+        return 0.0
+    g = math.gamma
+    return 2.0 * g((a + 1) / 2) * g((b + 1) / 2) * g((c + 1) / 2) / g((a + b + c + 3) / 2)
+
+
+def _max_moment_error(points: np.ndarray, weights: np.ndarray, degree: int) -> float:
+    error = 0.0
+    for a in range(degree + 1):
+        for b in range(degree + 1 - a):
+            for c in range(degree + 1 - a - b):
+                value = np.sum(weights * points[:, 0] ** a * points[:, 1] ** b * points[:, 2] ** c)
+                error = max(error, abs(value - _sphere_moment(a, b, c)))
+    return error
+
+
+@pytest.mark.parametrize(
+    "n_points,degree",
+    [(6, 3), (14, 5), (26, 7), (38, 9), (50, 11), (74, 13), (86, 15), (110, 17),
+     (146, 19), (170, 21), (194, 23), (230, 25), (266, 27), (302, 29)],
+)
+def test_lebedev_rules_are_exact_to_their_degree(n_points, degree):
+    points, weights = lebedev_grid(n_points)
+    assert points.shape == (n_points, 3)
+    assert np.allclose(np.linalg.norm(points, axis=1), 1.0)
+    assert _max_moment_error(points, weights, degree) < 1e-12
+
+
+def test_angular_grid_falls_back_to_product_rule():
+    assert angular_grid(10)[0].shape[0] == 50
+    assert angular_grid(23)[0].shape[0] == 194
+    points, weights = angular_grid(31)
+    assert points.shape[0] == 16 * 32
+    assert _max_moment_error(points, weights, 31) < 1e-12
+
+
+def test_radial_grid_integrates_slater_function():
+    r, w = radial_grid(75, 1.0)
+    assert np.sum(w * np.exp(-2.0 * r)) == pytest.approx(0.25, rel=1e-10)
+
+
+def test_water_density_integrates_to_1e5_electrons_on_becke_grid(water):
+    lines, coordinates, basis, P, _ = water
+    atomic_numbers, _ = parse_fchk_arrays(lines)
+
+    points, weights, owners = molecular_grid(atomic_numbers, coordinates)
+    assert points.shape[0] < 100_000
+    populations = atomic_integrals(compute_density(points, P, basis), weights, owners, len(atomic_numbers))
+
+    assert populations.sum() == pytest.approx(10.0, abs=1e-5)
+    assert populations[1] == pytest.approx(populations[2], abs=1e-6)
+    assert populations[0] > 8.0
+
+
+def test_molecular_grid_partition_of_unity():
+    # The fuzzy cells of all atoms must add up to one everywhere.
+    coordinates = [(0.0, 0.0, 0.0), (0.0, 0.0, 1.1)]
+    points, weights, _ = molecular_grid([6, 8], coordinates)
+    r2 = np.sum((points / 0.52917721092 - [0.0, 0.0, 0.5 / 0.52917721092]) ** 2, axis=1)
+    assert np.sum(weights * np.exp(-r2)) == pytest.approx(math.pi ** 1.5, rel=1e-6)
+
+
+def _water_cluster(shape, spacing=3.0):
+    """Randomly oriented water molecules on a cubic lattice (Angstroms)."""
+    rng = np.random.default_rng(0)
+    monomer = np.array([(0.0, 0.0, 0.117), (0.0, 0.757, -0.469), (0.0, -0.757, -0.469)])
+    atomic_numbers, coordinates = [], []
+    for site in np.ndindex(*shape):
+        rotation, _ = np.linalg.qr(rng.normal(size=(3, 3)))
+        coordinates.extend(monomer @ rotation.T + spacing * np.array(site) + rng.uniform(-0.2, 0.2, 3))
+        atomic_numbers.extend([8, 1, 1])
+    return atomic_numbers, np.array(coordinates)
+
+
+def test_becke_weights_screen_distant_cells_on_a_large_cluster(monkeypatch):
+    atomic_numbers, coordinates = _water_cluster((3, 3, 2))
+    n_atoms = len(atomic_numbers)
+    coords = coordinates / 0.52917721092
+    radii = np.array([integration.atomic_radius(z) for z in atomic_numbers]) / 0.52917721092
+    r_ab, a = integration._becke_pairs(coords, radii)
+
+    step = integration._becke_step
+    evaluated = []
+    monkeypatch.setattr(integration, "_becke_step", lambda mu, a: evaluated.append(mu.size) or step(mu, a))
+    for atom in (27, 28):
+        n_rad = integration.default_radial_points(atomic_numbers[atom])
+        r, _ = radial_grid(n_rad, radii[atom] if atomic_numbers[atom] == 1 else 0.5 * radii[atom])
+        points = (r[:, None, None] * angular_grid(11)[0][None]).reshape(-1, 3) + coords[atom]
+        evaluated.clear()
+        weights = integration._becke_cell_weights(points, coords, r_ab, a, atom)
+
+        # Reference: every cell with every factor, N^2 cell factors per point.
+        dist = np.linalg.norm(points[:, None, :] - coords[None, :, :], axis=2)
+        s = step((dist[:, :, None] - dist[:, None, :]) / r_ab, a)
+        s[:, np.arange(n_atoms), np.arange(n_atoms)] = 1.0
+        cells = np.prod(s, axis=2)
+        assert np.allclose(weights, cells[:, atom] / cells.sum(axis=1), rtol=0, atol=1e-10)
+        assert sum(evaluated) < n_atoms * n_atoms * len(points) / 2
+
+
+def test_molecular_grid_of_a_large_cluster_is_fast():
+    # Cubic all-pairs Becke weights took about 50 s here.
+    atomic_numbers, coordinates = _water_cluster((3, 3, 2))
+    start = time.perf_counter()
+    points, weights, owners = molecular_grid(atomic_numbers, coordinates, radial_points=30, angular_degree=11)
+    assert time.perf_counter() - start < 20.0
+    assert np.array_equal(np.unique(owners), np.arange(len(atomic_numbers)))
+    r2 = np.sum((points[:, None, :] - coordinates[None, :, :]) ** 2, axis=2) / 0.52917721092 ** 2
+    assert weights @ np.exp(-r2).sum(axis=1) == pytest.approx(len(atomic_numbers) * math.pi ** 1.5, rel=1e-3)
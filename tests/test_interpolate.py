@@ -0,0 +1,61 @@
+import numpy as np  # type: ignore
+import pytest  # type: ignore
+
+from openwfn.grid import RegularGrid, parse_resample_size  # type: ignore
+from openwfn.interpolate import interpolate_grid, resample_grid  # type: ignore
+
+
+def _rotated_grid():
+    c, s = np.cos(0.3), np.sin(0.3)
+    return RegularGrid([-2.0, -2.0, -2.0], 0.2, (21, 21, 21), axes=[[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
+def _quadratic(points):
+    x, y, z = points.T
+    return 1.0 + x - 2.0 * y + 0.5 * z ** 2 + x * y
+
+
+def test_interpolation_reproduces_polynomials_on_rotated_grid():
+    grid = _rotated_grid()
+    values = _quadratic(grid.points())
+    rng = np.random.default_rng(7)
+    # Interior points, so the cubic stencil is never clamped at a face.
+    queries = grid.origin + rng.uniform(1.0, 19.0, (500, 3)) @ grid.vectors
+
+    cubic = interpolate_grid(values, grid, queries, method="cubic", block_points=97)
+    assert np.allclose(cubic, _quadratic(queries), atol=1e-10)
+
+    linear_field = 2.0 * values - 3.0 * grid.points()[:, 0]
+    stacked = np.column_stack([values, linear_field])
+    both = interpolate_grid(stacked, grid, queries, method="linear")
+    assert both.shape == (500, 2)
+    assert np.allclose(both[:, 1], interpolate_grid(linear_field.reshape(grid.shape), grid, queries))
+    # Trilinear interpolation is exact at the grid points themselves.
+    assert np.allclose(interpolate_grid(values, grid, grid.points()[::37]), values[::37])
+
+
+def test_interpolation_fills_points_outside_the_grid():
+    grid = _rotated_grid()
+    values = np.ones(grid.n_points)
+    queries = np.array([[0.0, 0.0, 0.0], [10.0, 0.0, 0.0], [0.0, 0.0, -2.5]])
+
+    assert interpolate_grid(values, grid, queries, method="cubic", fill_value=-1.0).tolist() == [1.0, -1.0, -1.0]
+    with pytest.raises(ValueError, match="method"):
+        interpolate_grid(values, grid, queries, method="spline")
+
+
+def test_resampling_converges_to_the_reevaluated_field():
+    def gaussian(points):
+        return np.exp(-np.sum(points ** 2, axis=1))
+
+    fine = RegularGrid([-3.0, -3.0, -3.0], 0.1, (61, 61, 61))
+    coarse = parse_resample_size("0.25", fine)
+    assert coarse.shape == (25, 25, 25)
+    assert parse_resample_size("31x31x31", fine).spacing.tolist() == [0.2, 0.2, 0.2]
+
+    values = gaussian(fine.points()).astype(np.float32)
+    exact = gaussian(coarse.points())
+    linear = resample_grid(values, fine, coarse, method="linear", block_points=5000)
+    cubic = resample_grid(values, fine, coarse, method="cubic")
+    assert linear.dtype == np.float32 and linear.shape == (coarse.n_points,)
+    assert np.abs(cubic - exact).max() < 0.1 * np.abs(linear - exact).max()
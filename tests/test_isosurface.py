@@ -0,0 +1,57 @@
+import numpy as np  # type: ignore
+
+from openwfn.export import export_obj, export_ply  # type: ignore
+from openwfn.grid import RegularGrid  # type: ignore
+from openwfn.isosurface import extract_isosurface, isosurfaces, mesh_normals  # type: ignore
+
+
+def _field(grid: RegularGrid, f) -> np.ndarray:
+    x, y, z = grid.points().T
+    return f(x, y, z)
+
+
+def _signed_volume(vertices: np.ndarray, faces: np.ndarray) -> float:
+    a, b, c = (vertices[faces[:, i]] for i in range(3))
+    return float(np.einsum("ij,ij->i", a, np.cross(b, c)).sum() / 6.0)
+
+
+def test_sphere_isosurface_is_closed_and_outward():
+    grid = RegularGrid([-2.0, -2.0, -2.0], 0.1, (41, 41, 41))
+    values = _field(grid, lambda x, y, z: 1.0 - np.sqrt(x ** 2 + y ** 2 + z ** 2) / 1.2)
+
+    vertices, faces = extract_isosurface(values, grid, 0.0, block_planes=7)
+
+    edges = np.sort(np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]]), axis=1)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    assert np.all(counts == 2)
+    assert np.allclose(np.linalg.norm(vertices, axis=1), 1.2, atol=0.03)
+    assert abs(_signed_volume(vertices, faces) - 4.0 / 3.0 * np.pi * 1.2 ** 3) < 0.02 * 7.24
+    normals = mesh_normals(vertices, faces)
+    assert np.all(np.einsum("ij,ij->i", normals, vertices) > 0.0)
+
+    whole = extract_isosurface(values.reshape(grid.shape), grid, 0.0, block_planes=100)
+    assert np.allclose(whole[0], vertices)
+    assert np.array_equal(np.unique(np.sort(whole[1], axis=1), axis=0), np.unique(np.sort(faces, axis=1), axis=0))
+
+
+def test_orbital_lobes_and_mesh_export(tmp_path):
+    grid = RegularGrid([-3.0, -3.0, -3.0], 0.2, (31, 31, 31))
+    psi = _field(grid, lambda x, y, z: z * np.exp(-(x ** 2 + y ** 2 + z ** 2)))
+
+    meshes = isosurfaces({"p": psi}, grid, [0.05])
+
+    assert sorted(meshes) == ["p_+0.05", "p_-0.05"]
+    for name, (vertices, faces) in meshes.items():
+        assert _signed_volume(vertices, faces) > 0.0
+        assert np.sign(vertices[:, 2].mean()) == (1.0 if "+" in name else -1.0)
+
+    export_obj(tmp_path / "p.obj", meshes)
+    lines = (tmp_path / "p.obj").read_text().splitlines()
+    n_vertices = sum(len(v) for v, _ in meshes.values())
+    assert sum(line.startswith("v ") for line in lines) == n_vertices
+    assert sum(line.startswith("f ") for line in lines) == sum(len(f) for _, f in meshes.values())
+
+    export_ply(tmp_path / "p.ply", meshes)
+    header = (tmp_path / "p.ply").read_bytes().split(b"end_header\n")[0].decode()
+    assert "format binary_little_endian 1.0" in header
+    assert f"element vertex {n_vertices}" in header
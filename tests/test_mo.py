@@ -0,0 +1,36 @@
+import numpy as np  # type: ignore
+import pytest  # type: ignore
+
+from openwfn.density import compute_density  # type: ignore
+from openwfn.mo import evaluate_mo, evaluate_mos, mo_label, parse_mo_selection  # type: ignore
+
+
+def test_parse_mo_selection_ranges_and_keywords():
+    assert parse_mo_selection("HOMO-1:LUMO+1", 5, 5, 13) == [3, 4, 5, 6]
+    assert parse_mo_selection("homo, lumo", 5, 5, 13) == [4, 5]
+    assert parse_mo_selection("1:3,13", 5, 5, 13) == [0, 1, 2, 12]
+    assert parse_mo_selection("HOMO", 5, 4, 13, spin="beta") == [3]
+
+    with pytest.raises(ValueError, match="out of range"):
+        parse_mo_selection("LUMO+20", 5, 5, 13)
+    with pytest.raises(ValueError, match="Invalid MO selection"):
+        parse_mo_selection("SOMO", 5, 5, 13)
+
+
+def test_mo_label_relative_to_frontier():
+    assert mo_label(4, 4) == "MO_5_HOMO"
+    assert mo_label(2, 4) == "MO_3_HOMO-2"
+    assert mo_label(6, 4) == "MO_7_LUMO+1"
+
+
+def test_occupied_orbitals_reproduce_closed_shell_density(water):
+    _, _, basis, P, coeffs = water
+    rng = np.random.default_rng(2)
+    pts = rng.uniform(-2.5, 2.5, size=(1500, 3))
+
+    psi = evaluate_mos(pts, list(range(5)), coeffs, basis)
+    rho = compute_density(pts, P, basis)
+
+    assert psi.shape == (1500, 5)
+    assert np.allclose(2.0 * np.sum(psi ** 2, axis=1), rho, rtol=1e-5, atol=1e-10)
+    assert np.allclose(evaluate_mo(pts, 3, coeffs, basis), psi[:, 3])
@@ -0,0 +1,37 @@
+import numpy as np  # type: ignore
+
+from openwfn.density import compute_density  # type: ignore
+from openwfn.octree import build_octree, resample_octree  # type: ignore
+
+
+def test_octree_reproduces_linear_fields_exactly():
+    def field(pts):
+        return np.column_stack([np.exp(-4.0 * np.sum(pts ** 2, axis=1)), 1.0 + pts @ [0.3, -0.2, 0.5]])
+
+    tree = build_octree([(0.0, 0.0, 0.0)], field, margin=1.5, base_spacing=0.5, max_level=3, tol=1e-3)
+    assert tree["values"].shape == (tree["points"].shape[0], 2)
+    assert len(np.unique(tree["levels"])) > 1
+
+    pts = np.random.default_rng(8).uniform(-1.4, 1.4, size=(500, 3))
+    assert np.allclose(resample_octree(tree, pts)[:, 1], field(pts)[:, 1])
+    assert np.all(resample_octree(tree, np.array([[10.0, 0.0, 0.0]])) == 0.0)
+
+
+def test_octree_density_matches_fine_uniform_grid_with_fewer_points(water):
+    _, coordinates, basis, P, _ = water
+
+    def density(pts):
+        return compute_density(pts, P, basis)
+
+    tree = build_octree(coordinates, density, margin=3.0, base_spacing=0.8, max_level=3)
+    fine = build_octree(coordinates, density, margin=3.0, base_spacing=0.1, max_level=0)
+    assert fine["n_evaluated"] > 10 * tree["n_evaluated"]
+
+    rng = np.random.default_rng(9)
+    lo = np.min(coordinates, axis=0) - 2.5
+    hi = np.max(coordinates, axis=0) + 2.5
+    pts = rng.uniform(lo, hi, size=(5000, 3))
+    error = np.abs(resample_octree(tree, pts) - density(pts))
+    fine_error = np.abs(resample_octree(fine, pts) - density(pts))
+    assert error.max() <= 1.5 * fine_error.max()
+    assert error.mean() < 3.0 * fine_error.mean()
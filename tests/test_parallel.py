@@ -0,0 +1,88 @@
+import numpy as np  # type: ignore
+import pytest  # type: ignore
+from numpy.lib.format import open_memmap  # type: ignore
+
+from openwfn.density import SPIN_DENSITY_FIELDS, compute_density, compute_spin_densities  # type: ignore
+from openwfn.mo import evaluate_mos  # type: ignore
+from openwfn.grid import RegularGrid, make_bounding_box_grid  # type: ignore
+from openwfn import parallel  # type: ignore
+from openwfn.parallel import evaluate_grid, evaluate_grid_into  # type: ignore
+
+
+@pytest.fixture(scope="module")
+def points():
+    return np.random.default_rng(4).uniform(-4.0, 4.0, size=(6000, 3))
+
+
+def test_parallel_density_matches_serial(water, points):
+    _, _, basis, P, _ = water
+
+    rho = evaluate_grid(points, basis, "density", P, workers=2, block_points=1000)
+    assert np.allclose(rho, compute_density(points, P, basis), rtol=1e-10, atol=1e-12)
+
+
+def test_parallel_spin_density_matches_serial(water, points):
+    _, _, basis, P, _ = water
+    S = 0.1 * P
+
+    values = evaluate_grid(points, basis, "spin_density", np.hstack([P, S]), workers=2, block_points=1000)
+    serial = compute_spin_densities(points, P, S, basis)
+    assert values.shape == (6000, len(SPIN_DENSITY_FIELDS))
+    for k, name in enumerate(SPIN_DENSITY_FIELDS):
+        assert np.allclose(values[:, k], serial[name], rtol=1e-10, atol=1e-12)
+
+
+def test_parallel_mo_matches_serial(water, points):
+    _, _, basis, _, C = water
+    C = C[:, 3:7]
+
+    psi = evaluate_grid(points, basis, "mo", C, workers=2, block_points=1000)
+    assert psi.shape == (6000, 4)
+    assert np.allclose(psi, evaluate_mos(points, [0, 1, 2, 3], C, basis))
+
+
+def test_evaluate_grid_rejects_unknown_kernel(water, points):
+    _, _, basis, _, _ = water
+    with pytest.raises(ValueError, match="Unknown grid kernel"):
+        evaluate_grid(points, basis, "laplacian", np.eye(basis["n_basis"]))
+
+
+def test_parallel_single_precision_matches_double(water, points):
+    _, _, basis, P, _ = water
+
+    rho = evaluate_grid(points.astype(np.float32), basis, "density", P, workers=2, block_points=1000)
+    reference = compute_density(points, P, basis)
+    assert rho.dtype == np.float32
+    assert np.max(np.abs(rho - reference)) < 1e-5 * reference.max()
+
+
+def test_out_of_core_grid_streams_into_memmap(water, tmp_path):
+    _, coordinates, basis, P, _ = water
+    points, _ = make_bounding_box_grid(coordinates, margin=2.0, spacing=0.4)
+    grid = RegularGrid.around(coordinates, margin=2.0, spacing=0.4)
+
+    out = open_memmap(str(tmp_path / "rho.npy"), mode="w+", dtype=np.float64, shape=(points.shape[0],))
+    evaluate_grid_into(out, grid, basis, "density", P, chunk_points=1000)
+    del out
+    assert np.allclose(np.load(tmp_path / "rho.npy"), compute_density(points, P, basis), rtol=1e-10, atol=1e-12)
+
+    with pytest.raises(ValueError, match="does not match"):
+        evaluate_grid_into(np.zeros(5), grid, basis, "density", P)
+
+
+def test_out_of_core_grid_reuses_one_worker_pool(water, monkeypatch):
+    _, coordinates, basis, P, _ = water
+    grid = RegularGrid.around(coordinates, margin=2.0, spacing=0.1)
+    assert grid.n_points > 2 * 40000
+
+    pools = []
+
+    class CountingPool(parallel.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", CountingPool)
+    values = evaluate_grid_into(np.empty(grid.n_points), grid, basis, "density", P, workers=2, chunk_points=40000)
+    assert len(pools) == 1
+    assert np.allclose(values, compute_density(grid.points(), P, basis), rtol=1e-10, atol=1e-12)
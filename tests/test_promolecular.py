@@ -0,0 +1,70 @@
+import numpy as np  # type: ignore
+import pytest  # type: ignore
+
+from openwfn.constants import BOHR_TO_ANGSTROM, PROMOLECULAR_DENSITY, SYMBOL_TO_Z  # type: ignore
+from openwfn.grid import RegularGrid  # type: ignore
+from openwfn.integration import molecular_grid  # type: ignore
+from openwfn.parallel import evaluate_grid, evaluate_grid_into  # type: ignore
+from openwfn.promolecular import (  # type: ignore
+    atomic_density_parameters,
+    compile_promolecule,
+    promolecular_density,
+)
+
+
+def _brute_force(points, atomic_numbers, coordinates):
+    r = np.linalg.norm(points[:, None, :] - np.asarray(coordinates)[None], axis=2) / BOHR_TO_ANGSTROM
+    rho = np.zeros(len(points))
+    for j, Z in enumerate(atomic_numbers):
+        c, zeta = atomic_density_parameters(Z)
+        rho += np.exp(-r[:, j, None] / zeta) @ c
+    return rho
+
+
+def test_tabulated_atoms_hold_their_electrons():
+    for symbol, terms in PROMOLECULAR_DENSITY.items():
+        c, zeta = np.asarray(terms).T
+        assert np.isclose(np.sum(8.0 * np.pi * c * zeta ** 3), SYMBOL_TO_Z[symbol], rtol=1e-6)
+        r = np.linspace(0.0, 20.0, 2001)
+        rho = np.exp(-r[:, None] / zeta) @ c
+        assert np.all(rho > 0.0) and np.all(np.diff(rho) <= 0.0)
+    # Hydrogen is exact: rho(r) = exp(-2r) / pi.
+    c, zeta = atomic_density_parameters(1)
+    assert np.allclose(np.exp(-np.array([0.0, 1.0, 3.0])[:, None] / zeta) @ c, np.exp(-2.0 * np.array([0.0, 1.0, 3.0])) / np.pi)
+    with pytest.raises(ValueError, match="No promolecular density"):
+        atomic_density_parameters(118)
+
+
+def test_cell_lists_match_all_pairs_sum():
+    rng = np.random.default_rng(7)
+    atomic_numbers = rng.choice([1, 6, 7, 8, 16, 26], size=300)
+    coordinates = rng.uniform(0.0, 25.0, size=(300, 3))
+    points = rng.uniform(-4.0, 29.0, size=(2000, 3))
+    model = compile_promolecule(atomic_numbers, coordinates)
+
+    expected = _brute_force(points, atomic_numbers, coordinates)
+    # Truncated tails cost at most the threshold per atom.
+    assert np.allclose(promolecular_density(points, model), expected, rtol=0, atol=300 * model["threshold"])
+    assert np.allclose(promolecular_density(points, model, memory_budget=1), expected, rtol=0, atol=300 * model["threshold"])
+
+    rho, grad = promolecular_density(points[:20], model, gradient=True)
+    h = 1e-5
+    for i in range(3):
+        step = np.zeros(3)
+        step[i] = h
+        numeric = (_brute_force(points[:20] + step, atomic_numbers, coordinates) - _brute_force(points[:20] - step, atomic_numbers, coordinates)) / (2 * h)
+        assert np.allclose(grad[:, i], numeric * BOHR_TO_ANGSTROM, rtol=1e-5, atol=1e-7)
+
+
+def test_promolecular_grid_kernel_counts_electrons():
+    atomic_numbers = [8, 1, 1, 26]
+    coordinates = [(0.0, 0.0, 0.117), (0.0, 0.757, -0.469), (0.0, -0.757, -0.469), (0.0, 0.0, 2.2)]
+    model = compile_promolecule(atomic_numbers, coordinates)
+
+    points, weights, _ = molecular_grid(atomic_numbers, coordinates)
+    rho = evaluate_grid(points, model, "promolecular", np.zeros((0, 0)))
+    assert abs(weights @ rho - 36.0) < 1e-3
+
+    grid = RegularGrid.around(coordinates, margin=3.0, spacing=0.25)
+    values = evaluate_grid_into(np.empty(grid.n_points), grid, model, "promolecular", np.zeros((0, 0)), workers=2, chunk_points=20000)
+    assert np.allclose(values, promolecular_density(grid.points(), model))
@@ -0,0 +1,81 @@
+import tracemalloc
+from pathlib import Path
+
+import numpy as np  # type: ignore
+import pytest  # type: ignore
+
+from openwfn.fchk import parse_fchk_arrays, read_fchk  # type: ignore
+from openwfn.grid import RegularGrid  # type: ignore
+from openwfn.parallel import evaluate_grid_into  # type: ignore
+from openwfn.symmetry import lattice_operations, lattice_representatives, point_group, symmetric_grid  # type: ignore
+
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+
+
+def _molecule(name: str):
+    lines = read_fchk(str(EXAMPLES / name / f"{name}.fchk"))
+    return parse_fchk_arrays(lines)
+
+
+def test_point_groups_of_examples_and_ideal_geometries():
+    assert point_group(*_molecule("water"))["name"] == "C2v"
+    assert point_group(*_molecule("ammonia"))["name"] == "C3v"
+    methane = point_group(*_molecule("methane"))
+    assert methane["name"] == "Td" and methane["order"] == 24
+
+    octahedral = [(0, 0, 0)] + [tuple(s * v) for v in np.eye(3) for s in (1.6, -1.6)]
+    assert point_group([16] + [9] * 6, octahedral)["name"] == "Oh"
+    ring = [(1.4 * np.cos(a), 1.4 * np.sin(a), 0.0) for a in np.arange(6) * np.pi / 3]
+    hydrogens = [(2.48 * x / 1.4, 2.48 * y / 1.4, 0.0) for x, y, _ in ring]
+    assert point_group([6] * 6 + [1] * 6, ring + hydrogens)["name"] == "D6h"
+    assert point_group([8, 6, 8], [(0, 0, -1.16), (0, 0, 0), (0, 0, 1.16)])["name"] == "D*h"
+    assert point_group([1, 6, 7], [(0, 0, -1.07), (0, 0, 0), (0, 0, 1.16)])["name"] == "C*v"
+
+    # A rigid rotation does not change the group.
+    Z, coords = _molecule("methane")
+    c, s = np.cos(0.7), np.sin(0.7)
+    rotated = np.asarray(coords) @ np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]]).T
+    assert point_group(Z, rotated)["name"] == "Td"
+
+
+def test_point_group_of_large_cluster_stays_small():
+    # 343-atom cubic cluster: candidates come from one small class, not every pair of atoms.
+    side = np.arange(7) * 1.5
+    coords = np.array(np.meshgrid(side, side, side, indexing="ij")).reshape(3, -1).T
+    tracemalloc.start()
+    try:
+        group = point_group([6] * len(coords), coords)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert group["name"] == "Oh" and group["order"] == 48
+    assert peak < 32 * 1024 ** 2
+
+
+def test_lattice_operations_map_symmetric_grid_onto_itself():
+    Z, coords = _molecule("methane")
+    group = point_group(Z, coords)
+    grid = symmetric_grid(RegularGrid.around(coords, margin=2.0, spacing=0.3), group["operations"], group["center"])
+    maps = lattice_operations(grid, group["operations"], group["center"])
+    assert len(maps) == 24 and np.array_equal(maps[0, :, :3], np.eye(3, dtype=int))
+
+    reps = lattice_representatives(grid, maps, 0, grid.n_points)
+    assert np.all(reps <= np.arange(grid.n_points))
+    assert len(np.unique(reps)) < grid.n_points / 15
+
+
+def test_symmetric_evaluation_matches_full_grid(water):
+    lines, coords, basis, P, _ = water
+    Z, _ = parse_fchk_arrays(lines)
+    group = point_group(Z, coords)
+    grid = symmetric_grid(RegularGrid.around(coords, margin=2.0, spacing=0.25), group["operations"], group["center"])
+    maps = lattice_operations(grid, group["operations"], group["center"])
+    assert len(maps) == 4
+
+    full = evaluate_grid_into(np.empty(grid.n_points), grid, basis, "density", P)
+    wedge = evaluate_grid_into(np.empty(grid.n_points), grid, basis, "density", P, symmetry=maps, chunk_points=5000)
+    assert np.allclose(wedge, full, rtol=1e-12, atol=1e-14)
+
+    with pytest.raises(ValueError, match="totally symmetric"):
+        evaluate_grid_into(np.empty((grid.n_points, 1)), grid, basis, "mo", np.ones((basis["n_basis"], 1)), symmetry=maps)
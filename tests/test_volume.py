@@ -0,0 +1,58 @@
+import numpy as np  # type: ignore
+import pytest  # type: ignore
+
+from openwfn.grid import RegularGrid  # type: ignore
+from openwfn.parallel import evaluate_grid_into  # type: ignore
+from openwfn.volume import VolumeStore, parse_region  # type: ignore
+
+
+def _ramp_store(tmp_path, compression="zlib"):
+    grid = RegularGrid([0.0, -1.0, 0.5], (0.1, 0.2, 0.3), (21, 13, 9))
+    i, j, k = np.unravel_index(np.arange(grid.n_points), grid.shape)
+    values = np.column_stack([100.0 * i + 10.0 * j + k, -(100.0 * i + 10.0 * j + k)])
+    store = VolumeStore.create(
+        tmp_path / "ramp.owv", grid, ["up", "down"], dtype=np.float64, chunks=(8, 5, 4), compression=compression
+    )
+    writer = store.writer()
+    for start in range(0, grid.n_points, 251):
+        writer[start:start + 251] = values[start:start + 251]
+    writer.close()
+    return VolumeStore(tmp_path / "ramp.owv"), values[:, 0].reshape(grid.shape)
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma", "raw"])
+def test_volume_store_reads_regions(tmp_path, compression):
+    store, volume = _ramp_store(tmp_path, compression)
+
+    assert np.array_equal(store.read("up"), volume)
+    assert np.array_equal(store.read("down"), -volume)
+    assert np.array_equal(store.read("up", (slice(3, 17), 4)), volume[3:17, 4:5])
+    assert np.array_equal(store.read(0, parse_region("::3,2:11:4,-1")), volume[::3, 2:11:4, -1:])
+
+    sub = store.region_grid(parse_region("3:17,4"))
+    assert sub.shape == (14, 1, 9)
+    assert np.allclose(sub.points()[0], store.grid.points()[np.ravel_multi_index((3, 4, 0), store.grid.shape)])
+
+
+def test_volume_store_decompresses_only_intersecting_chunks(tmp_path):
+    store, volume = _ramp_store(tmp_path)
+    # Chunk (2, 2, 2) covers x 16..20, y 10..12, z 8.
+    (store.path / "0" / "2.2.2").write_bytes(b"not zlib")
+
+    assert np.array_equal(store.read("up", (slice(0, 16),)), volume[:16])
+    with pytest.raises(Exception):
+        store.read("up")
+
+
+def test_volume_writer_is_an_evaluation_target(water, tmp_path):
+    _, coordinates, basis, density_matrix, _ = water
+    grid = RegularGrid.around(coordinates, margin=2.0, spacing=0.35)
+    expected = evaluate_grid_into(np.empty(grid.n_points, dtype=np.float32), grid, basis, "density", density_matrix)
+
+    store = VolumeStore.create(tmp_path / "rho.owv", grid, ["rho"], chunks=(6, 6, 6))
+    evaluate_grid_into(store.writer(), grid, basis, "density", density_matrix, chunk_points=1000).close()
+
+    assert store.read("rho").dtype == np.float32
+    assert np.allclose(store.read("rho").ravel(), expected, rtol=1e-6, atol=1e-9)
+    with pytest.raises(ValueError, match="sequentially"):
+        store.writer()[5:10] = np.zeros(5)
@@ -1,4 +1,6 @@
-from openwfn.xyz import write_xyz  # type: ignore
+import pytest  # type: ignore
+
+from openwfn.xyz import read_xyz, write_xyz  # type: ignore
 
 def test_write_xyz(tmp_path):
     atoms = [1, 8]  # H, O
@@ -16,3 +18,19 @@ def test_write_xyz(tmp_path):
     assert "Generated by openWFN" in content
     assert "H" in content
     assert "O" in content
+
+
+def test_read_xyz_round_trip_and_labels(tmp_path):
+    outfile = tmp_path / "water.xyz"
+    write_xyz(outfile, [8, 1, 1], [(0.0, 0.0, 0.117), (0.0, 0.757, -0.469), (0.0, -0.757, -0.469)])
+    atoms, coords = read_xyz(outfile)
+    assert atoms == [8, 1, 1]
+    assert coords[1] == (0.0, 0.757, -0.469)
+
+    labelled = tmp_path / "labelled.xyz"
+    labelled.write_text("3\ncomment\nCL1 0 0 0\nfe 1 0 0\n6 2 0 0\n")
+    assert read_xyz(labelled)[0] == [17, 26, 6]
+
+    labelled.write_text("2\ncomment\nXx 0 0 0\nH 1 0 0\n")
+    with pytest.raises(ValueError, match="unknown element"):
+        read_xyz(labelled)